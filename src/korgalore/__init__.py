@@ -1,4 +1,5 @@
 """Korgalore - A command-line tool to put public-inbox sources directly into Gmail."""
+import json
 import logging
 import os
 import subprocess
@@ -7,7 +8,16 @@ from pathlib import Path
 import liblore
 from liblore import LoreNode
 import requests
-from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# orjson parses and serializes several times faster than the standard
+# library; use it for state and metadata when it is installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 __version__ = "0.7-dev"
 __author__ = "Konstantin Ryabitsev"
@@ -28,6 +38,8 @@ _user_agent_plus: Optional[str] = None
 
 
 # Global requests session for HTTP calls
+# Per-host connection pool size for the shared session
+HTTP_POOL_SIZE = 16
 _REQSESSION: Optional[requests.Session] = None
 
 
@@ -39,6 +51,11 @@ def get_requests_session() -> requests.Session:
         _REQSESSION.headers.update({
             'User-Agent': __user_agent__
         })
+        # Size the pools so concurrent requests to the same host reuse
+        # keepalive connections instead of opening new ones
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        _REQSESSION.mount('https://', adapter)
+        _REQSESSION.mount('http://', adapter)
     return _REQSESSION
 
 
@@ -132,12 +149,15 @@ def _init_git_user_agent() -> None:
 def run_git_command(gitdir: Optional[str], args: List[str],
                     stdin: Optional[bytes] = None,
                     git_config: Optional[Dict[str, str]] = None,
+                    strip: bool = True,
                     ) -> Tuple[int, bytes, bytes]:
     """Run a git command in the specified git directory and return (returncode, stdout, stderr).
 
     Uses --git-dir instead of -C to work with safe.bareRepository=explicit.
     Optional *git_config* dict adds ``-c key=value`` flags before the
     subcommand (useful for per-invocation url.<base>.insteadOf).
+    Callers that split large outputs into lines pass ``strip=False`` to
+    get stdout as-is, without a stripped copy of the whole buffer.
     """
     cmd = [GITCMD]
     if git_config:
@@ -146,20 +166,45 @@ def run_git_command(gitdir: Optional[str], args: List[str],
     if gitdir:
         cmd += ['--git-dir', gitdir]
     cmd += args
-    logger.debug('Running git command: %s', ' '.join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Running git command: %s', ' '.join(cmd))
 
     try:
         result = subprocess.run(cmd, capture_output=True, input=stdin)
     except FileNotFoundError:
         raise GitError(f"Git command '{GITCMD}' not found. Is it installed?")
-    return result.returncode, result.stdout.strip(), result.stderr.strip()
+    stdout = result.stdout.strip() if strip else result.stdout
+    return result.returncode, stdout, result.stderr.strip()
+
 
+def open_git_cat_file(gitdir: str) -> 'subprocess.Popen[bytes]':
+    """Start a long-lived ``git cat-file --batch`` process for a git directory.
 
-def run_lei_command(args: List[str]) -> Tuple[int, bytes]:
+    Object names written to its stdin, one per line, are answered on
+    stdout with a ``<oid> <type> <size>`` header followed by the object
+    contents, or ``<name> missing``. Reading many objects this way costs
+    one git process instead of one per object.
+
+    Raises:
+        GitError: If git is not installed.
+    """
+    cmd = [GITCMD, '--git-dir', gitdir, 'cat-file', '--batch']
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Starting git command: %s', ' '.join(cmd))
+    try:
+        return subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        raise GitError(f"Git command '{GITCMD}' not found. Is it installed?")
+
+
+def run_lei_command(args: List[str], strip: bool = True) -> Tuple[int, bytes]:
     """Run a lei command and return (returncode, stdout).
 
     Args:
         args: Arguments to pass to lei command (first element is the subcommand).
+        strip: Strip surrounding whitespace from the output. Callers that
+            parse the output as a whole (e.g. JSON) pass False to skip the copy.
 
     Returns:
         Tuple of (return_code, stdout_output).
@@ -173,13 +218,16 @@ def run_lei_command(args: List[str]) -> Tuple[int, bytes]:
         lei_ua = f"{__user_agent__}+{_user_agent_plus}" if _user_agent_plus else __user_agent__
         cmd += ['--user-agent', lei_ua]
     cmd += args[1:]
-    logger.debug('Running lei command: %s', ' '.join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Running lei command: %s', ' '.join(cmd))
 
     try:
         result = subprocess.run(cmd, capture_output=True)
     except FileNotFoundError:
         raise PublicInboxError(f"LEI command '{LEICMD}' not found. Is it installed?")
-    return result.returncode, result.stdout.strip()
+    if strip:
+        return result.returncode, result.stdout.strip()
+    return result.returncode, result.stdout
 
 
 def format_key_for_display(key: Optional[str]) -> str:
@@ -192,3 +240,70 @@ def format_key_for_display(key: Optional[str]) -> str:
         except Exception:
             return key
     return key
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from a string or bytes, with orjson if available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, with orjson if available.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation, for files
+            people may read or edit.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def atomic_write_text(path: Path, content: str, mode: Optional[int] = None,
+                      fsync: bool = True) -> None:
+    """Replace a file's contents atomically.
+
+    The content is written to a uniquely named temporary file next to the
+    target, which is then moved into place, so a crash mid-write leaves
+    either the old file or the new one and never a truncated mix, and
+    concurrent writers (e.g. the GUI and the CLI refreshing the same
+    token) never share a temporary file.
+
+    Args:
+        path: File to write.
+        content: Text to write.
+        mode: Optional permission bits to set before the file is moved
+            into place (e.g. 0o600 for credentials). Otherwise the file
+            gets the umask's permissions, as with open().
+        fsync: Flush the content to disk before the rename. Callers that
+            rewrite frequently changing state may skip this.
+    """
+    while True:
+        tmp_path = path.with_name(f'.tmp_{path.name}.{os.urandom(4).hex()}')
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except Exception:
+        # Clean up temp file on error
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
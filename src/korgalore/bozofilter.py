@@ -6,50 +6,55 @@ import subprocess
 from datetime import date
 from email.utils import parseaddr
 from pathlib import Path
-from typing import Set, Optional
+from typing import AbstractSet, Dict, FrozenSet, Optional, Tuple
 
 logger = logging.getLogger('korgalore')
 
+# Parsed bozofilter files, keyed by path and validated against the
+# file's (mtime_ns, size) so edits made outside korgalore are noticed
+_BOZO_CACHE: Dict[Path, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+
 
 def get_bozofilter_path(config_dir: Path) -> Path:
     """Get the path to the bozofilter file."""
     return config_dir / 'bozofilter.txt'
 
 
-def load_bozofilter(config_dir: Path) -> Set[str]:
+def load_bozofilter(config_dir: Path) -> FrozenSet[str]:
     """Load and parse the bozofilter file.
 
+    The result is checked once per delivered message, so it is returned
+    as an immutable frozenset that can be shared between threads and
+    does not need to be copied by callers.
+
     Args:
         config_dir: Path to the korgalore config directory.
 
     Returns:
-        Set of lowercase email addresses in the filter.
+        Frozenset of lowercase email addresses in the filter.
     """
     bozofilter_path = get_bozofilter_path(config_dir)
-    addresses: Set[str] = set()
-
-    if not bozofilter_path.exists():
-        return addresses
-
-    with open(bozofilter_path, 'r') as f:
-        for line in f:
-            # Strip whitespace
-            line = line.strip()
-
-            # Skip empty lines and comment-only lines
-            if not line or line.startswith('#'):
-                continue
 
-            # Remove trailing comment
-            if '#' in line:
-                line = line.split('#', 1)[0].strip()
-
-            # Skip if nothing left after removing comment
-            if not line:
-                continue
-
-            # Normalize to lowercase
-            addresses.add(line.lower())
+    try:
+        st = bozofilter_path.stat()
+    except FileNotFoundError:
+        _BOZO_CACHE.pop(bozofilter_path, None)
+        return frozenset()
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _BOZO_CACHE.get(bozofilter_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # Drop trailing comments (comment-only lines become empty), then
+    # skip blank entries and normalize to lowercase
+    addresses = frozenset(
+        addr.lower()
+        for addr in (line.split('#', 1)[0].strip()
+                     for line in bozofilter_path.read_text().splitlines())
+        if addr
+    )
+    _BOZO_CACHE[bozofilter_path] = (stamp, addresses)
 
     return addresses
 
@@ -68,14 +73,11 @@ def add_to_bozofilter(config_dir: Path, addresses: list[str],
     """
     bozofilter_path = get_bozofilter_path(config_dir)
 
-    # Load existing addresses
+    # Load existing addresses (served from the cache if unchanged)
     existing = load_bozofilter(config_dir)
 
-    # Prepare new entries
-    added = 0
-    new_lines: list[str] = []
-    today = date.today().isoformat()
-
+    # Collect new addresses, keeping the order they were given in
+    new_addrs: dict[str, None] = {}
     for addr in addresses:
         addr_lower = addr.lower().strip()
         if not addr_lower:
@@ -83,25 +85,26 @@ def add_to_bozofilter(config_dir: Path, addresses: list[str],
         if addr_lower in existing:
             logger.info('Address already in bozofilter: %s', addr_lower)
             continue
+        new_addrs[addr_lower] = None
 
-        # Build the line with comment
-        comment_parts = [f'added on {today}']
-        if reason:
-            comment_parts.append(reason)
-        comment = ', '.join(comment_parts)
+    if not new_addrs:
+        return 0
 
-        new_lines.append(f'{addr_lower} # {comment}\n')
-        added += 1
+    # Build the trailing comment shared by all new entries
+    comment_parts = [f'added on {date.today().isoformat()}']
+    if reason:
+        comment_parts.append(reason)
+    comment = ', '.join(comment_parts)
 
-    if new_lines:
-        # Ensure config dir exists
-        config_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure config dir exists
+    config_dir.mkdir(parents=True, exist_ok=True)
 
-        # Append to file
-        with open(bozofilter_path, 'a') as f:
-            f.writelines(new_lines)
+    # Append all new entries in a single write
+    with open(bozofilter_path, 'a') as f:
+        f.write(''.join(f'{addr} # {comment}\n' for addr in new_addrs))
+    _BOZO_CACHE.pop(bozofilter_path, None)
 
-    return added
+    return len(new_addrs)
 
 
 def ensure_bozofilter_exists(config_dir: Path) -> Path:
@@ -171,7 +174,7 @@ def extract_email_address(from_header: str) -> Optional[str]:
     return None
 
 
-def is_bozofied(from_header: str, bozofilter: Set[str]) -> bool:
+def is_bozofied(from_header: str, bozofilter: AbstractSet[str]) -> bool:
     """Check if a From: header matches any address in the bozofilter.
 
     Args:
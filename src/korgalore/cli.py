@@ -1,9 +1,12 @@
 """Command-line interface for korgalore."""
 
+import atexit
 import os
 import re
+import functools
 import hashlib
-import uuid
+import itertools
+import threading
 import urllib.parse
 import click
 import tomllib
@@ -11,44 +14,83 @@ import logging
 import click_log
 import requests
 
+from collections import Counter, defaultdict
+from enum import Enum
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional, Union, Callable, Set
-from korgalore.lore_feed import LoreFeed
-from korgalore.lei_feed import LeiFeed
-from korgalore.gmail_target import GmailTarget
-from korgalore.maildir_target import MaildirTarget
-from korgalore.jmap_target import JmapTarget
-from korgalore.imap_target import ImapTarget
-from korgalore.pipe_target import PipeTarget
+from typing import (
+    AbstractSet, DefaultDict, Dict, Any, Iterable, Iterator, List, Tuple, Optional, Union,
+    Callable, Final, Set, TYPE_CHECKING,
+)
 from korgalore import (
     __version__, ConfigurationError, StateError, GitError,
     RemoteError, PublicInboxError, AuthenticationError, format_key_for_display,
     _init_git_user_agent, get_requests_session, close_requests_session,
-    make_lore_node
+    make_lore_node, atomic_write_text
 )
 import liblore
-from liblore.utils import parse_message, get_msgid_from_url, split_mbox_as_bytes
-from korgalore.tracking import (
-    TrackingManifest, TrackStatus,
-    create_lei_thread_search, create_lei_query_search, update_lei_search,
-    forget_lei_search
-)
-from korgalore.maintainers import (
-    get_subsystem, normalize_subsystem_name,
-    build_mailinglist_query, build_patches_query,
-    generate_subsystem_config, DEFAULT_CATCHALL_LISTS
-)
+from liblore.utils import get_msgid_from_url, split_mbox_as_bytes
 from korgalore.bozofilter import (
     load_bozofilter, add_to_bozofilter, edit_bozofilter, is_bozofied
 )
 
+if TYPE_CHECKING:
+    from click._termui_impl import ProgressBar
+    # Feed, tracking, maintainers and target modules are imported lazily
+    # by the functions that use them, so that short-lived commands only
+    # pay for what they touch. Target modules in particular pull in heavy
+    # third-party stacks (Google API client, OAuth2 libraries).
+    from korgalore.lore_feed import LoreFeed
+    from korgalore.lei_feed import LeiFeed
+    from korgalore.tracking import TrackingManifest
+    from korgalore.gmail_target import GmailTarget
+    from korgalore.maildir_target import MaildirTarget
+    from korgalore.jmap_target import JmapTarget
+    from korgalore.imap_target import ImapTarget
+    from korgalore.pipe_target import PipeTarget
+
 logger = logging.getLogger('korgalore')
 click_log.basic_config(logger)
 
-# Sentinel value for messages skipped due to bozofilter
-SKIPPED_BOZOFILTER = '__SKIPPED_BOZOFILTER__'
-# Sentinel value for public-inbox 'rm' commits (message removals)
-SKIPPED_NOOP_COMMIT = '__SKIPPED_NOOP_COMMIT__'
+
+class SkipReason(Enum):
+    """Why deliver_commit() skipped a commit; returned in place of a Message-ID."""
+    BOZOFILTER = "bozofilter"    # Sender is in the bozofilter
+    NOOP_COMMIT = "noop-commit"  # Public-inbox 'rm' commit (message removal)
+
+
+# Returned by deliver_commit() and deliver_commits() for skipped commits
+SKIPPED_BOZOFILTER: Final = SkipReason.BOZOFILTER
+SKIPPED_NOOP_COMMIT: Final = SkipReason.NOOP_COMMIT
+
+# Number of messages handed to a target's import_messages() in one call
+DELIVERY_BATCH_SIZE = 50
+
+# Deliveries to a target stop after this many failures in a row
+MAX_CONSECUTIVE_FAILURES = 5
+
+# Upper bound on targets delivered to concurrently during a pull
+MAX_DELIVERY_WORKERS = 8
+
+# Upper bound on feeds fetched concurrently; kept low to go easy on servers
+MAX_FEED_UPDATE_WORKERS = 4
+
+# Record of messages delivered to IMAP folders, in the data directory
+IMAP_DEDUP_DB_NAME = 'imap-dedup.sqlite'
+
+# Legacy 'sources' config markers and their 'deliveries' replacements
+LEGACY_SOURCES_MAP = {'[sources.': '[deliveries.', '### Sources ###': '### Deliveries ###'}
+LEGACY_SOURCES_RE = re.compile('|'.join(re.escape(marker) for marker in LEGACY_SOURCES_MAP))
+
+# Separator for comma-delimited --labels values
+LABEL_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Characters not allowed in a directory name derived from a feed URL
+UNSAFE_DIRNAME_RE = re.compile(r'[^a-zA-Z0-9_.-]')
+
+# Prefixes that mark a feed value as a direct URL rather than a feed name
+HTTP_URL_PREFIXES = ('https:', 'http:')
+FEED_URL_PREFIXES = HTTP_URL_PREFIXES + ('lei:',)
 
 # URL to fetch MAINTAINERS file from kernel.org
 MAINTAINERS_URL = 'https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linux.git/plain/MAINTAINERS'
@@ -57,7 +99,8 @@ MAINTAINERS_URL = 'https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linu
 MAINTAINERS_CACHE_MAX_AGE = 24 * 60 * 60
 
 
-def get_maintainers_file(data_dir: Path) -> Path:
+def get_maintainers_file(data_dir: Path,
+                         session: Optional[requests.Session] = None) -> Path:
     """Get MAINTAINERS file, fetching from kernel.org if needed.
 
     Uses a cached copy if it exists and is less than 24 hours old.
@@ -65,6 +108,7 @@ def get_maintainers_file(data_dir: Path) -> Path:
 
     Args:
         data_dir: The korgalore data directory for caching.
+        session: HTTP session to fetch with (defaults to the shared session).
 
     Returns:
         Path to the MAINTAINERS file.
@@ -76,9 +120,15 @@ def get_maintainers_file(data_dir: Path) -> Path:
 
     cache_path = data_dir / 'MAINTAINERS'
 
-    # Check if we have a fresh cached copy
-    if cache_path.exists():
-        age = time.time() - cache_path.stat().st_mtime
+    # Check if we have a fresh cached copy (a single stat covers both
+    # the existence check and the age check)
+    try:
+        cache_mtime: Optional[float] = cache_path.stat().st_mtime
+    except FileNotFoundError:
+        cache_mtime = None
+
+    if cache_mtime is not None:
+        age = time.time() - cache_mtime
         if age < MAINTAINERS_CACHE_MAX_AGE:
             logger.debug('Using cached MAINTAINERS file (age: %.1f hours)', age / 3600)
             return cache_path
@@ -87,12 +137,13 @@ def get_maintainers_file(data_dir: Path) -> Path:
     # Fetch fresh copy
     logger.info('Fetching MAINTAINERS file from %s', MAINTAINERS_URL)
     try:
-        session = get_requests_session()
+        if session is None:
+            session = get_requests_session()
         response = session.get(MAINTAINERS_URL, timeout=30)
         response.raise_for_status()
     except Exception as e:
         # If fetch fails but we have a stale cache, use it with a warning
-        if cache_path.exists():
+        if cache_mtime is not None:
             logger.warning('Failed to fetch fresh MAINTAINERS file, using stale cache: %s', e)
             return cache_path
         raise click.ClickException(
@@ -125,11 +176,20 @@ def parse_labels(labels: Tuple[str, ...]) -> List[str]:
         >>> parse_labels(('INBOX', 'UNREAD,CATEGORY_FORUMS'))
         ['INBOX', 'UNREAD', 'CATEGORY_FORUMS']
     """
-    result: List[str] = []
-    for label in labels:
-        # Split by comma and strip whitespace
-        result.extend(part.strip() for part in label.split(',') if part.strip())
-    return result
+    # Split everything in one pass; whitespace around commas is consumed
+    # by the pattern, and the outer strip handles the ends
+    return [part for part in LABEL_SPLIT_RE.split(','.join(labels).strip()) if part]
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per process.
+
+    Repeated calls with the same path return immediately without
+    touching the filesystem.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def get_xdg_data_dir() -> Path:
@@ -145,9 +205,7 @@ def get_xdg_data_dir() -> Path:
     korgalore_data_dir = data_home / 'korgalore'
 
     # Create directory if it doesn't exist
-    korgalore_data_dir.mkdir(parents=True, exist_ok=True)
-
-    return korgalore_data_dir
+    return _ensure_dir(korgalore_data_dir)
 
 
 def get_xdg_config_dir() -> Path:
@@ -163,21 +221,40 @@ def get_xdg_config_dir() -> Path:
     korgalore_config_dir = config_home / 'korgalore'
 
     # Create directory if it doesn't exist
-    korgalore_config_dir.mkdir(parents=True, exist_ok=True)
+    return _ensure_dir(korgalore_config_dir)
+
+
+def get_ctx_requests_session(ctx: click.Context) -> requests.Session:
+    """Return the HTTP session shared by this CLI invocation.
+
+    The session is stored in ctx.obj['requests_session'] so that every
+    consumer reuses the same keepalive connection pools. It is recreated
+    on demand after close_ctx_requests_session().
+    """
+    session: Optional[requests.Session] = ctx.obj.get('requests_session')
+    if session is None:
+        session = get_requests_session()
+        ctx.obj['requests_session'] = session
+    return session
+
 
-    return korgalore_config_dir
+def close_ctx_requests_session(ctx: click.Context) -> None:
+    """Close the shared HTTP session and drop it from the context."""
+    ctx.obj.pop('requests_session', None)
+    close_requests_session()
 
 
 def get_target(ctx: click.Context, identifier: str) -> Any:
     """Get or create a target service instance by identifier."""
-    if identifier in ctx.obj['targets']:
-        return ctx.obj['targets'][identifier]
+    resolved = ctx.obj.setdefault('targets', {})
+    if identifier in resolved:
+        return resolved[identifier]
 
     config = ctx.obj.get('config', {})
     targets = config.get('targets', {})
     if identifier not in targets:
         logger.critical('Target "%s" not found in configuration.', identifier)
-        logger.critical('Known targets: %s', ', '.join(targets.keys()))
+        logger.critical('Known targets: %s', ', '.join(targets))
         raise click.Abort()
 
     details = targets[identifier]
@@ -207,7 +284,7 @@ def get_target(ctx: click.Context, identifier: str) -> Any:
             token=details.get('token', None),
             token_file=details.get('token_file', None),
             timeout=details.get('timeout', 60),
-            reqsession=get_requests_session()
+            reqsession=get_ctx_requests_session(ctx)
         )
     elif target_type == 'imap':
         service = get_imap_target(
@@ -222,7 +299,8 @@ def get_target(ctx: click.Context, identifier: str) -> Any:
             client_id=details.get('client_id', None),
             tenant=details.get('tenant', 'common'),
             token=details.get('token', None),
-            interactive=interactive
+            interactive=interactive,
+            dedup_db=str(ctx.obj.get('data_dir', get_xdg_data_dir()) / IMAP_DEDUP_DB_NAME)
         )
     elif target_type == 'pipe':
         service = get_pipe_target(
@@ -234,7 +312,7 @@ def get_target(ctx: click.Context, identifier: str) -> Any:
         logger.critical('Supported types: gmail, maildir, jmap, imap, pipe')
         raise click.Abort()
 
-    ctx.obj['targets'][identifier] = service
+    resolved[identifier] = service
 
     # Check if Gmail target needs authentication (in non-interactive/GUI mode)
     # Note: IMAP OAuth2 targets handle this during connect() instead, which
@@ -250,7 +328,7 @@ def get_target(ctx: click.Context, identifier: str) -> Any:
 
 
 def get_gmail_target(identifier: str, credentials_file: str,
-                     token_file: Optional[str], interactive: bool = True) -> GmailTarget:
+                     token_file: Optional[str], interactive: bool = True) -> 'GmailTarget':
     """Create a Gmail target service instance."""
     if not credentials_file:
         logger.critical('No credentials file specified for Gmail target: %s', identifier)
@@ -258,6 +336,8 @@ def get_gmail_target(identifier: str, credentials_file: str,
     if not token_file:
         cfgdir = get_xdg_config_dir()
         token_file = str(cfgdir / f'gmail-{identifier}-token.json')
+    from korgalore.gmail_target import GmailTarget
+
     try:
         gt = GmailTarget(identifier=identifier,
                          credentials_file=credentials_file,
@@ -270,12 +350,14 @@ def get_gmail_target(identifier: str, credentials_file: str,
     return gt
 
 
-def get_maildir_target(identifier: str, maildir_path: str) -> MaildirTarget:
+def get_maildir_target(identifier: str, maildir_path: str) -> 'MaildirTarget':
     """Create a Maildir target service instance."""
     if not maildir_path:
         logger.critical('No maildir path specified for target: %s', identifier)
         raise click.Abort()
 
+    from korgalore.maildir_target import MaildirTarget
+
     try:
         mt = MaildirTarget(identifier=identifier, maildir_path=maildir_path)
     except ConfigurationError as fe:
@@ -288,7 +370,7 @@ def get_maildir_target(identifier: str, maildir_path: str) -> MaildirTarget:
 def get_jmap_target(identifier: str, server: str, username: str,
                     token: Optional[str], token_file: Optional[str],
                     timeout: int,
-                    reqsession: Optional[requests.Session] = None) -> JmapTarget:
+                    reqsession: Optional[requests.Session] = None) -> 'JmapTarget':
     """Create a JMAP target service instance."""
     if not server:
         logger.critical('No server specified for JMAP target: %s', identifier)
@@ -303,6 +385,8 @@ def get_jmap_target(identifier: str, server: str, username: str,
         logger.critical('Generate a token at your JMAP provider (e.g., Fastmail Settings → Integrations)')
         raise click.Abort()
 
+    from korgalore.jmap_target import JmapTarget
+
     try:
         jt = JmapTarget(
             identifier=identifier,
@@ -327,7 +411,8 @@ def get_imap_target(identifier: str, server: str, username: str,
                     client_id: Optional[str] = None,
                     tenant: str = 'common',
                     token: Optional[str] = None,
-                    interactive: bool = True) -> ImapTarget:
+                    interactive: bool = True,
+                    dedup_db: Optional[str] = None) -> 'ImapTarget':
     """Create an IMAP target service instance."""
     if not server:
         logger.critical('No server specified for IMAP target: %s', identifier)
@@ -345,6 +430,8 @@ def get_imap_target(identifier: str, server: str, username: str,
             raise click.Abort()
     # OAuth2 uses a built-in default client_id if not specified
 
+    from korgalore.imap_target import ImapTarget
+
     try:
         it = ImapTarget(
             identifier=identifier,
@@ -358,7 +445,8 @@ def get_imap_target(identifier: str, server: str, username: str,
             client_id=client_id,
             tenant=tenant,
             token=token,
-            interactive=interactive
+            interactive=interactive,
+            dedup_db=dedup_db
         )
     except ConfigurationError as fe:
         logger.critical('Error: %s', str(fe))
@@ -367,12 +455,14 @@ def get_imap_target(identifier: str, server: str, username: str,
     return it
 
 
-def get_pipe_target(identifier: str, command: str) -> PipeTarget:
+def get_pipe_target(identifier: str, command: str) -> 'PipeTarget':
     """Create a Pipe target service instance."""
     if not command:
         logger.critical('No command specified for pipe target: %s', identifier)
         raise click.Abort()
 
+    from korgalore.pipe_target import PipeTarget
+
     try:
         pt = PipeTarget(identifier=identifier, command=command)
     except ConfigurationError as fe:
@@ -385,7 +475,7 @@ def get_pipe_target(identifier: str, command: str) -> PipeTarget:
 def resolve_feed_url(feed_value: str, config: Dict[str, Any]) -> str:
     """Resolve a feed name or URL to its full URL."""
     # If it's already a URL, return as-is
-    if feed_value.startswith('https:') or feed_value.startswith('lei:'):
+    if feed_value.startswith(('https:', 'lei:')):
         return feed_value
 
     # Otherwise, look it up in the feeds section
@@ -417,7 +507,7 @@ def get_feed_identifier(feed_value: str, config: Dict[str, Any]) -> Optional[str
         Directory name to use for this feed, or None for LEI feeds (handled separately)
     """
     # Named feed: use the feed name as directory
-    if not (feed_value.startswith('https:') or feed_value.startswith('http:') or feed_value.startswith('lei:')):
+    if not feed_value.startswith(FEED_URL_PREFIXES):
         return feed_value
 
     # LEI path: handled separately in process_lei_delivery
@@ -429,7 +519,7 @@ def get_feed_identifier(feed_value: str, config: Dict[str, Any]) -> Optional[str
     url_without_scheme = feed_value.replace('https://', '').replace('http://', '')
 
     # Replace special characters with hyphens
-    sanitized = re.sub(r'[^a-zA-Z0-9_.-]', '-', url_without_scheme)
+    sanitized = UNSAFE_DIRNAME_RE.sub('-', url_without_scheme)
 
     # Remove trailing slashes, dots, and hyphens
     sanitized = sanitized.strip('-./')
@@ -444,26 +534,38 @@ def get_feed_identifier(feed_value: str, config: Dict[str, Any]) -> Optional[str
     return sanitized
 
 
-def validate_config_file(cfgpath: Path) -> Tuple[bool, str]:
-    """Validate a TOML configuration file.
+def validate_config_text(text: str) -> Tuple[bool, str]:
+    """Validate TOML configuration already read into memory.
 
     Args:
-        cfgpath: Path to the configuration file.
+        text: The configuration file contents.
 
     Returns:
         A tuple of (is_valid, error_message). If valid, error_message is empty.
     """
-    if not cfgpath.exists():
-        return False, f"Configuration file not found: {cfgpath}"
-
     try:
-        with open(cfgpath, 'rb') as cf:
-            tomllib.load(cf)
+        tomllib.loads(text)
         return True, ""
     except tomllib.TOMLDecodeError as e:
         return False, f"TOML syntax error: {e}"
+
+
+def validate_config_file(cfgpath: Path) -> Tuple[bool, str]:
+    """Validate a TOML configuration file.
+
+    Args:
+        cfgpath: Path to the configuration file.
+
+    Returns:
+        A tuple of (is_valid, error_message). If valid, error_message is empty.
+    """
+    try:
+        text = cfgpath.read_bytes().decode()
+    except FileNotFoundError:
+        return False, f"Configuration file not found: {cfgpath}"
     except Exception as e:
         return False, f"Error reading config: {e}"
+    return validate_config_text(text)
 
 
 def merge_config(base: Dict[str, Any], extra: Dict[str, Any]) -> None:
@@ -481,6 +583,13 @@ def merge_config(base: Dict[str, Any], extra: Dict[str, Any]) -> None:
         base['gui'] = extra['gui']
 
 
+def _load_toml_file(toml_file: Path) -> Dict[str, Any]:
+    """Parse a single conf.d TOML file."""
+    logger.debug('Loading additional config from %s', toml_file.name)
+    with open(toml_file, 'rb') as cf:
+        return tomllib.load(cf)
+
+
 def load_config(cfgfile: Path) -> Dict[str, Any]:
     """Load and parse the TOML configuration file and conf.d/*.toml files."""
     config: Dict[str, Any] = dict()
@@ -504,10 +613,12 @@ def load_config(cfgfile: Path) -> Dict[str, Any]:
         # Load conf.d/*.toml files
         conf_d = cfgfile.parent / 'conf.d'
         if conf_d.is_dir():
-            for toml_file in sorted(conf_d.glob('*.toml')):
-                logger.debug('Loading additional config from %s', toml_file.name)
-                with open(toml_file, 'rb') as cf:
-                    extra = tomllib.load(cf)
+            toml_files = sorted(conf_d.glob('*.toml'))
+            # Parsing is independent per file, so do it concurrently; the
+            # merge itself must still happen in sorted order on this thread.
+            with ThreadPoolExecutor() as executor:
+                extras = list(executor.map(_load_toml_file, toml_files))
+            for extra in extras:
                 merge_config(config, extra)
 
         logger.debug('Config loaded with %s targets, %s deliveries, and %s feeds',
@@ -521,7 +632,7 @@ def load_config(cfgfile: Path) -> Dict[str, Any]:
         raise click.Abort()
 
 
-def retry_failed_commits(feed_dir: Path, pi_feed: Union[LeiFeed, LoreFeed], target_service: Any,
+def retry_failed_commits(feed_dir: Path, pi_feed: Union['LeiFeed', 'LoreFeed'], target_service: Any,
                          labels: List[str], delivery_name: str,
                          subfolder: Optional[str] = None) -> None:
     """Retry previously failed message deliveries for a specific delivery."""
@@ -555,10 +666,100 @@ def retry_failed_commits(feed_dir: Path, pi_feed: Union[LeiFeed, LoreFeed], targ
     pi_feed.feed_unlock()
 
 
-def deliver_commit(delivery_name: str, target: Any, feed: Union[LeiFeed, LoreFeed], epoch: int, commit: str,
+class SharedMessageCache:
+    """Raw messages read once and handed to every target that needs them.
+
+    When deliveries to several targets in one pull follow the same feed,
+    each of them would otherwise read (and parse) the same commits again.
+    The cache is primed with the targets that consume each (feed_key,
+    epoch, commit); the message is read from git on first use and dropped
+    once the last of those targets has taken it (or given it up with
+    release()), so only messages shared between targets are ever held in
+    memory. A target's deliveries run one after another, so a further
+    delivery of the same commit to the same target reads it from git
+    again rather than pinning it for the whole run.
+
+    Safe to use from the per-target delivery threads: the lock only guards
+    the bookkeeping, and the first consumer of a message reads it from git
+    outside the lock while later ones wait on its Future.
+    """
+
+    def __init__(self, consumers: Dict[Tuple[str, int, str], AbstractSet[str]]) -> None:
+        self._remaining = {key: set(targets) for key, targets in consumers.items()}
+        self._messages: Dict[Tuple[str, int, str], Future[bytes]] = dict()
+        self._lock = threading.Lock()
+
+    def _consume(self, key: Tuple[str, int, str], target_name: str) -> None:
+        """Count target_name as done with key; the caller holds the lock."""
+        remaining = self._remaining[key]
+        remaining.discard(target_name)
+        if not remaining:
+            del self._remaining[key]
+            self._messages.pop(key, None)
+
+    def get(self, feed: Union['LeiFeed', 'LoreFeed'], epoch: int, commit: str, target_name: str) -> bytes:
+        """Return the raw message at commit for a target, reading it from the feed at most once."""
+        key = (feed.feed_key, epoch, commit)
+        with self._lock:
+            pending = self._messages.get(key)
+            reader = False
+            if target_name in self._remaining.get(key, ()):
+                if pending is None:
+                    pending = self._messages[key] = Future()
+                    reader = True
+                self._consume(key, target_name)
+
+        if pending is None:
+            return feed.get_message_at_commit(epoch, commit)
+
+        if reader:
+            try:
+                raw_message = feed.get_message_at_commit(epoch, commit)
+            except BaseException as e:
+                pending.set_exception(e)
+                with self._lock:
+                    if self._messages.get(key) is pending:
+                        del self._messages[key]
+                raise
+            pending.set_result(raw_message)
+            return raw_message
+
+        try:
+            return pending.result()
+        except Exception:
+            # The read failed for the consumer that made it; try again here
+            return feed.get_message_at_commit(epoch, commit)
+
+    def release(self, target_name: str, feed_key: str, commits: Iterable[Tuple[int, str]]) -> None:
+        """Give up the reads a target will no longer make.
+
+        Called for the commits of deliveries to a target that aborted or
+        could not be reached, so their shared messages are not kept until
+        the end of the pull.
+        """
+        with self._lock:
+            for epoch, commit in commits:
+                key = (feed_key, epoch, commit)
+                if target_name in self._remaining.get(key, ()):
+                    self._consume(key, target_name)
+
+
+def fetch_commit_message(target: Any, feed: Union['LeiFeed', 'LoreFeed'], epoch: int, commit: str,
+                         message_cache: Optional[SharedMessageCache] = None) -> bytes:
+    """Read the raw message at a commit for target, through the shared cache if given."""
+    if message_cache is not None:
+        return message_cache.get(feed, epoch, commit, target.identifier)
+    return feed.get_message_at_commit(epoch, commit)
+
+
+def deliver_commit(delivery_name: str, target: Any, feed: Union['LeiFeed', 'LoreFeed'], epoch: int, commit: str,
                    labels: List[str], was_failing: bool = False,
-                   bozofilter: Optional[Set[str]] = None,
-                   subfolder: Optional[str] = None) -> Optional[str]:
+                   bozofilter: Optional[AbstractSet[str]] = None,
+                   subfolder: Optional[str] = None,
+                   bozo_check: Callable[[str, AbstractSet[str]], bool] = is_bozofied,
+                   connect: bool = True,
+                   message_cache: Optional[SharedMessageCache] = None,
+                   ) -> Union[str, SkipReason, None]:
     """Deliver a single message to the target.
 
     Args:
@@ -571,9 +772,17 @@ def deliver_commit(delivery_name: str, target: Any, feed: Union[LeiFeed, LoreFee
         was_failing: True if this is a retry of a previously failed delivery.
         bozofilter: Optional set of addresses to skip (from bozofilter).
         subfolder: Optional subfolder for IMAP/Maildir targets.
+        bozo_check: Predicate used to match the From header against the
+            bozofilter; callers delivering many messages may pass a
+            memoized wrapper around is_bozofied.
+        connect: Call target.connect() before importing. Callers that have
+            already connected the target for a whole run pass False.
+        message_cache: Optional cache of messages shared with deliveries
+            of the same feed to other targets.
 
     Returns:
-        The Message-ID of the delivered message on success, None on failure or skip.
+        The Message-ID of the delivered message on success, the SkipReason
+        of a skipped message, or None on failure.
     """
     # Skip public-inbox commits that carry no message (rm, purged, etc.)
     # is_noop_commit raises GitError when the commit object is missing
@@ -586,15 +795,16 @@ def deliver_commit(delivery_name: str, target: Any, feed: Union[LeiFeed, LoreFee
             feed.mark_successful_delivery(delivery_name, epoch, commit,
                                               was_failing=was_failing)
             return SKIPPED_NOOP_COMMIT
-        raw_message = feed.get_message_at_commit(epoch, commit)
-        target.connect()
-        msg = parse_message(raw_message)
+        raw_message = fetch_commit_message(target, feed, epoch, commit, message_cache)
+        if connect:
+            target.connect()
+        msg = feed.parse_headers_only(raw_message)
         msgid = msg.get('Message-ID', '')
 
         # Check bozofilter before delivering
         if bozofilter:
             from_header = msg.get('From', '')
-            if is_bozofied(from_header, bozofilter):
+            if bozo_check(from_header, bozofilter):
                 logger.debug('Skipping bozofied sender: %s', from_header)
                 # Mark as successful to avoid retrying
                 feed.mark_successful_delivery(delivery_name, epoch, commit,
@@ -620,6 +830,126 @@ def deliver_commit(delivery_name: str, target: Any, feed: Union[LeiFeed, LoreFee
         return None
 
 
+def deliver_commits(delivery_name: str, target: Any, feed: Union['LeiFeed', 'LoreFeed'],
+                    commits: List[Tuple[int, str]], labels: List[str],
+                    bozofilter: Optional[AbstractSet[str]] = None,
+                    subfolder: Optional[str] = None,
+                    connect: bool = True,
+                    message_cache: Optional[SharedMessageCache] = None) -> List[Union[str, SkipReason, None]]:
+    """Deliver several messages from one delivery with a single upload call.
+
+    Batched counterpart of deliver_commit() for targets that implement
+    import_messages(). Messages are read and filtered one at a time,
+    uploaded together, and delivery state is then recorded in commit
+    order, so the delivery pointer never moves past a message that has
+    not been imported yet.
+
+    Args:
+        delivery_name: Name of the delivery configuration.
+        target: Target service to deliver to; must provide import_messages().
+        feed: Feed to get messages from.
+        commits: List of (epoch, commit) tuples, in delivery order.
+        labels: Labels/folders to apply.
+        bozofilter: Optional set of addresses to skip (from bozofilter).
+        subfolder: Optional subfolder for IMAP/Maildir targets.
+        connect: Call target.connect() before uploading. Callers that have
+            already connected the target for a whole run pass False.
+        message_cache: Optional cache of messages shared with deliveries
+            of the same feed to other targets.
+
+    Returns:
+        One entry per commit, with the same meaning as the return value
+        of deliver_commit().
+    """
+    results: List[Union[str, SkipReason, None]] = [None] * len(commits)
+    raw_messages: Dict[int, bytes] = dict()
+    # Indexes into commits of the messages that still need uploading
+    pending: List[int] = list()
+
+    for idx, (epoch, commit) in enumerate(commits):
+        try:
+            if feed.is_noop_commit(epoch, commit):
+                logger.debug('Skipping no-op commit %s in epoch %d', commit, epoch)
+                results[idx] = SKIPPED_NOOP_COMMIT
+                continue
+            raw_message = fetch_commit_message(target, feed, epoch, commit, message_cache)
+            raw_messages[idx] = raw_message
+            msg = feed.parse_headers_only(raw_message)
+        except Exception as e:
+            logger.debug('Failed to read commit %s from epoch %d: %s', commit, epoch, str(e))
+            continue
+
+        if bozofilter:
+            from_header = msg.get('From', '')
+            if is_bozofied(from_header, bozofilter):
+                logger.debug('Skipping bozofied sender: %s', from_header)
+                results[idx] = SKIPPED_BOZOFILTER
+                continue
+
+        if logger.isEnabledFor(logging.DEBUG):
+            subject = msg.get('Subject', '(no subject)')
+            logger.debug(' -> %s', subject)
+        results[idx] = msg.get('Message-ID', '')
+        pending.append(idx)
+
+    if pending:
+        errors: List[Optional[Exception]]
+        try:
+            if connect:
+                target.connect()
+            errors = target.import_messages([raw_messages[idx] for idx in pending], labels=labels,
+                                            feed_name=format_key_for_display(feed.feed_key),
+                                            delivery_name=delivery_name,
+                                            subfolder=subfolder)
+        except Exception as e:
+            errors = [e] * len(pending)
+        for idx, error in zip(pending, errors):
+            if error is not None:
+                epoch, commit = commits[idx]
+                logger.debug('Failed to deliver commit %s from epoch %d: %s', commit, epoch, str(error))
+                results[idx] = None
+
+    # Record delivery state in commit order
+    for idx, (epoch, commit) in enumerate(commits):
+        result = results[idx]
+        raw_message_or_none = raw_messages.get(idx)
+        if result is None:
+            feed.mark_failed_delivery(delivery_name, epoch, commit)
+            if raw_message_or_none is not None:
+                feed.save_delivery_info(delivery_name, epoch, latest_commit=commit,
+                                        message=raw_message_or_none)
+        else:
+            feed.mark_successful_delivery(delivery_name, epoch, commit, message=raw_message_or_none)
+
+    return results
+
+
+def iter_delivery_batches(
+    deliveries: Dict[str, Tuple[Union['LeiFeed', 'LoreFeed'], Any, List[str], Optional[str]]],
+    work: List[Tuple[str, List[Tuple[int, str]]]],
+    batch_size: Callable[[], int],
+) -> Iterator[Tuple[str, Any, Union['LeiFeed', 'LoreFeed'], List[Tuple[int, str]], List[str], Optional[str]]]:
+    """Lazily slice each delivery's pending commits into batches.
+
+    Args:
+        deliveries: Mapping of delivery name to (feed, target, labels, subfolder).
+        work: List of (delivery_name, commits) in delivery order.
+        batch_size: Called before each batch for the maximum number of
+            commits it may hold, so callers can adapt it as they go.
+
+    Yields:
+        Tuples of (delivery_name, target, feed, commits, labels, subfolder),
+        where commits holds at most batch_size() (epoch, commit) entries.
+    """
+    for dname, commits in work:
+        feed, target, labels, subfolder = deliveries[dname]
+        start = 0
+        while start < len(commits):
+            end = start + max(1, batch_size())
+            yield dname, target, feed, commits[start:end], labels, subfolder
+            start = end
+
+
 def normalize_feed_key(feed_url: str) -> str:
     """Normalize a feed URL into a consistent key for internal tracking.
 
@@ -636,7 +966,7 @@ def normalize_feed_key(feed_url: str) -> str:
     else:
         # Sanitize URL for use as a directory name
         url_without_scheme = feed_url.replace('https://', '').replace('http://', '')
-        sanitized = re.sub(r'[^a-zA-Z0-9_.-]', '-', url_without_scheme)
+        sanitized = UNSAFE_DIRNAME_RE.sub('-', url_without_scheme)
         sanitized = sanitized.strip('-./')
         if len(sanitized) > 200:
             url_hash = hashlib.sha256(feed_url.encode()).hexdigest()[:16]
@@ -664,7 +994,7 @@ def generate_subscription_config(feed_key: str, url: str,
     timestamp = datetime.now().isoformat(timespec='seconds')
 
     # Determine the URL value to write
-    if url.startswith('https:') or url.startswith('http:'):
+    if url.startswith(HTTP_URL_PREFIXES):
         url_value = url
     else:
         url_value = f'lei:{url}'
@@ -724,7 +1054,7 @@ def get_lore_node(ctx: click.Context, url: str = 'https://lore.kernel.org/all')
     return nodes[origin]
 
 
-def get_feed_for_delivery(delivery_details: Dict[str, Any], ctx: click.Context) -> Union[LeiFeed, LoreFeed]:
+def get_feed_for_delivery(delivery_details: Dict[str, Any], ctx: click.Context) -> Union['LeiFeed', 'LoreFeed']:
     """Get or create a feed instance for a delivery configuration."""
     config = ctx.obj.get('config', {})
     feed_value = delivery_details.get('feed', '')
@@ -732,12 +1062,13 @@ def get_feed_for_delivery(delivery_details: Dict[str, Any], ctx: click.Context)
         raise ConfigurationError('No feed specified for delivery.')
     feed_url = resolve_feed_url(feed_value, config)
     feed_key = normalize_feed_key(feed_url)
-    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union[LeiFeed, LoreFeed]]
+    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union['LeiFeed', 'LoreFeed']]
     if feed_key in feeds:
         return feeds[feed_key]
 
     if feed_url.startswith('https:'):
         # Lore feed
+        from korgalore.lore_feed import LoreFeed
         data_dir = ctx.obj.get('data_dir', get_xdg_data_dir())
         feed_dir = data_dir / feed_key
         lore_feed = LoreFeed(feed_key, feed_dir, feed_url, lore_node=get_lore_node(ctx, feed_url))
@@ -745,6 +1076,7 @@ def get_feed_for_delivery(delivery_details: Dict[str, Any], ctx: click.Context)
         return lore_feed
     elif feed_url.startswith('lei:'):
         # LEI feed
+        from korgalore.lei_feed import LeiFeed
         lei_feed = LeiFeed(feed_key, feed_url)
         feeds[feed_key] = lei_feed
         return lei_feed
@@ -758,7 +1090,7 @@ def map_deliveries(ctx: click.Context, deliveries: Dict[str, Any]) -> None:
     from datetime import datetime
 
     # 'deliveries' is a mapping: delivery_name -> Tuple[feed, target, labels, subfolder]
-    dmap: Dict[str, Tuple[Union[LeiFeed, LoreFeed], Any, List[str], Optional[str]]] = dict()
+    dmap: Dict[str, Tuple[Union['LeiFeed', 'LoreFeed'], Any, List[str], Optional[str]]] = dict()
     # Store original strftime templates for refresh (used by GUI for long-running processes)
     templates: Dict[str, str] = dict()
     logger.debug('Mapping deliveries to their feeds and targets')
@@ -789,6 +1121,7 @@ def map_deliveries(ctx: click.Context, deliveries: Dict[str, Any]) -> None:
                 subfolder = None
             elif '%' in subfolder:
                 # Only Maildir targets support strftime templates in subfolder
+                from korgalore.maildir_target import MaildirTarget
                 if isinstance(target, MaildirTarget):
                     try:
                         # Validate the strftime template and store original for refresh
@@ -842,49 +1175,78 @@ def refresh_subfolder_templates(ctx: click.Context) -> None:
 
 def lock_all_feeds(ctx: click.Context) -> None:
     """Acquire exclusive locks on all feeds in the context."""
-    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union[LeiFeed, LoreFeed]]
-    for feed_key in feeds.keys():
-        feed = feeds[feed_key]
+    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union['LeiFeed', 'LoreFeed']]
+    for feed in feeds.values():
         feed.feed_lock()
 
 
 def unlock_all_feeds(ctx: click.Context) -> None:
     """Release exclusive locks on all feeds in the context."""
-    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union[LeiFeed, LoreFeed]]
-    for feed_key in feeds.keys():
-        feed = feeds[feed_key]
+    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union['LeiFeed', 'LoreFeed']]
+    for feed in feeds.values():
         feed.feed_unlock()
 
 
 def update_all_feeds(ctx: click.Context,
                      status_callback: Optional[Callable[[str], None]] = None,
+                     cancel_token: Optional[threading.Event] = None,
                      ) -> Tuple[List[str], List[str]]:
-    """Update all feeds and return (updated_feeds, initialized_feeds)."""
+    """Update all feeds and return (updated_feeds, initialized_feeds).
+
+    Feed updates are mostly network and git subprocess time, so several
+    feeds are updated at once. Both returned lists keep the configured
+    feed order. If cancel_token is set while feeds are being updated,
+    feeds that have not started yet are left alone.
+    """
     updated_feeds: List[str] = []
     initialized_feeds: List[str] = []
-    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union[LeiFeed, LoreFeed]]
+    feeds = ctx.obj.get('feeds', {})  # type: Dict[str, Union['LeiFeed', 'LoreFeed']]
 
     if status_callback:
         status_callback("Querying feeds...")
 
-    with click.progressbar(feeds.keys(),
-                           label='Updating feeds',
-                           show_pos=True,
-                           item_show_func=lambda x: format_key_for_display(x in feeds and str(feeds[x].feed_url) or x),
-                           hidden=ctx.obj['hide_bar']) as bar:
-        for feed_key in bar:
-            if status_callback:
-                status_callback(f"Querying {format_key_for_display(feed_key)}...")
-            feed = feeds[feed_key]
-            try:
-                status = feed.update_feed()
-            except (RemoteError, PublicInboxError, GitError) as e:
-                logger.warning('Failed to update %s: %s', feed_key, e)
-                continue
-            if status & feed.STATUS_UPDATED:
-                updated_feeds.append(feed_key)
-            if status & feed.STATUS_INITIALIZED:
-                initialized_feeds.append(feed_key)
+    # Work out progressbar labels once rather than on every redraw
+    feed_labels = {feed_key: format_key_for_display(str(feed.feed_url) or feed_key)
+                   for feed_key, feed in feeds.items()}
+
+    def _update_feed(feed_key: str, feed: Union['LeiFeed', 'LoreFeed']) -> Optional[int]:
+        if cancel_token is not None and cancel_token.is_set():
+            return None
+        if status_callback:
+            status_callback(f"Querying {format_key_for_display(feed_key)}...")
+        try:
+            return feed.update_feed()
+        except (RemoteError, PublicInboxError, GitError) as e:
+            logger.warning('Failed to update %s: %s', feed_key, e)
+            return None
+
+    statuses: Dict[str, Optional[int]] = dict()
+    bar: 'ProgressBar[str]' = click.progressbar(
+        length=len(feeds),
+        label='Updating feeds',
+        show_pos=True,
+        item_show_func=lambda item: feed_labels[item] if item else None,
+        hidden=ctx.obj['hide_bar'])
+    with bar:
+        if feeds:
+            with ThreadPoolExecutor(max_workers=min(MAX_FEED_UPDATE_WORKERS, len(feeds))) as executor:
+                futures = {executor.submit(_update_feed, feed_key, feed): feed_key
+                           for feed_key, feed in feeds.items()}
+                for future in as_completed(futures):
+                    feed_key = futures[future]
+                    statuses[feed_key] = future.result()
+                    bar.update(1, feed_key)
+    if cancel_token is not None and cancel_token.is_set():
+        logger.info('Feed updates cancelled')
+
+    for feed_key, feed in feeds.items():
+        status = statuses.get(feed_key)
+        if status is None:
+            continue
+        if status & feed.STATUS_UPDATED:
+            updated_feeds.append(feed_key)
+        if status & feed.STATUS_INITIALIZED:
+            initialized_feeds.append(feed_key)
 
     # Log initialization messages after progressbar completes
     for feed_key in initialized_feeds:
@@ -895,11 +1257,13 @@ def update_all_feeds(ctx: click.Context,
 
 def retry_all_failed_deliveries(ctx: click.Context) -> None:
     """Retry all previously failed deliveries across all feeds."""
-    bozo_set = ctx.obj.get('bozofilter', set())
+    bozo_set = frozenset(ctx.obj.get('bozofilter', frozenset()))
+    # Retries tend to repeat the same senders, so memoize lookups for this run
+    bozo_check = functools.lru_cache(maxsize=1024)(is_bozofied)
 
     # 'deliveries' is a mapping: delivery_name -> Tuple[feed, target, labels, subfolder]
     deliveries = ctx.obj['deliveries']
-    retry_list: List[Tuple[str, Any, Union[LeiFeed, LoreFeed], int, str, List[str], Optional[str]]] = list()
+    retry_list: List[Tuple[str, Any, Union['LeiFeed', 'LoreFeed'], int, str, List[str], Optional[str]]] = list()
     for delivery_name, (feed, target, labels, subfolder) in deliveries.items():
         to_retry = feed.get_failed_commits_for_delivery(delivery_name)
         if not to_retry:
@@ -917,7 +1281,8 @@ def retry_all_failed_deliveries(ctx: click.Context) -> None:
                            hidden=ctx.obj['hide_bar']) as bar:
         for (delivery_name, target, feed, epoch, commit, labels, subfolder) in bar:
             deliver_commit(delivery_name, target, feed, epoch, commit, labels,
-                           was_failing=True, bozofilter=bozo_set, subfolder=subfolder)
+                           was_failing=True, bozofilter=bozo_set, subfolder=subfolder,
+                           bozo_check=bozo_check)
 
 
 @click.group()
@@ -981,6 +1346,8 @@ def main(ctx: click.Context, cfgfile: str, logfile: Optional[click.Path]) -> Non
     ctx.obj['feeds'] = dict()
     # 'deliveries' is a mapping: delivery_name -> Tuple[feed_instance, target_instance, labels, subfolder]
     ctx.obj['deliveries'] = dict()
+    # Shared HTTP session (JMAP targets, MAINTAINERS downloads)
+    ctx.obj['requests_session'] = get_requests_session()
 
     # Hide progress bar at the DEBUG level
     if logger.isEnabledFor(logging.DEBUG):
@@ -1012,7 +1379,7 @@ def auth(ctx: click.Context, target: Optional[str]) -> None:
     if target:
         if target not in targets:
             logger.critical('Target "%s" not found in configuration.', target)
-            logger.critical('Known targets: %s', ', '.join(targets.keys()))
+            logger.critical('Known targets: %s', ', '.join(targets))
             raise click.Abort()
 
         # Check if target requires authentication
@@ -1067,6 +1434,9 @@ def edit_config(ctx: click.Context) -> None:
 
     # Create config file with example if it doesn't exist
     if not cfgpath.exists():
+        # Only needed for the one-off example config, so not imported at startup
+        import uuid
+
         logger.info('Configuration file does not exist. Creating example configuration at: %s', cfgpath)
         example_config = f"""[main]
 # Uncomment to add a unique identifier to your User-Agent string.
@@ -1096,12 +1466,11 @@ credentials = '~/.config/korgalore/credentials.json'
         cfgpath.write_text(example_config)
     else:
         # Convert legacy 'sources' to 'deliveries' in existing config file
-        content = cfgpath.read_text()
-        if '[sources.' in content or '### Sources ###' in content:
-            logger.debug('Converting legacy "sources" to "deliveries" in config file')
-            content = content.replace('[sources.', '[deliveries.')
-            content = content.replace('### Sources ###', '### Deliveries ###')
-            cfgpath.write_text(content)
+        content, converted = LEGACY_SOURCES_RE.subn(
+            lambda m: LEGACY_SOURCES_MAP[m.group(0)], cfgpath.read_text())
+        if converted:
+            logger.debug('Converted %d legacy "sources" markers in config file', converted)
+            atomic_write_text(cfgpath, content)
             logger.info('Converted legacy "sources" to "deliveries" in config file')
 
     # Open in editor
@@ -1109,7 +1478,10 @@ credentials = '~/.config/korgalore/credentials.json'
     click.edit(filename=str(cfgpath))
 
     # Validate the config file after editing
-    is_valid, error_msg = validate_config_file(cfgpath)
+    try:
+        is_valid, error_msg = validate_config_text(cfgpath.read_bytes().decode())
+    except (OSError, UnicodeDecodeError) as e:
+        is_valid, error_msg = False, f"Error reading config: {e}"
     if is_valid:
         logger.info('Configuration file is valid.')
     else:
@@ -1152,16 +1524,155 @@ def labels(ctx: click.Context, target: str, ids: bool = False) -> None:
         raise click.Abort()
 
 
+def _deliver_target(ctx: click.Context, target_name: str,
+                    work: List[Tuple[str, List[Tuple[int, str]]]],
+                    bozo_set: AbstractSet[str],
+                    status_callback: Optional[Callable[[str], None]],
+                    hide_bar: bool,
+                    message_cache: Optional[SharedMessageCache] = None,
+                    cancel_token: Optional[threading.Event] = None) -> Tuple[Dict[str, int], Set[str]]:
+    """Deliver new commits for the given deliveries to a single target.
+
+    Safe to run concurrently for different targets: it only touches the
+    target's own connection and the delivery state of the named deliveries.
+
+    Args:
+        ctx: Click context with mapped deliveries.
+        target_name: Identifier of the target all deliveries in work use.
+        work: Non-empty list of (delivery name, new commits) pairs; each
+            commit list is non-empty. Batches are sliced from these lists
+            lazily rather than expanding every commit into a work item.
+        bozo_set: Addresses to skip (from bozofilter).
+        status_callback: Optional callback for status updates.
+        hide_bar: Hide the progress bar.
+        message_cache: Optional cache of messages shared with deliveries
+            of the same feed to other targets.
+        cancel_token: Optional event; once set, no further batches are
+            delivered. Batches already delivered keep their state.
+
+    Returns:
+        A tuple of (per-delivery counts dict, set of unique message-ids delivered).
+    """
+    changes: Counter[str] = Counter()
+    unique_msgids: Set[str] = set()
+
+    logger.debug('Processing deliveries for target: %s', target_name)
+    deliveries = ctx.obj['deliveries']
+    total = sum(len(commits) for _, commits in work)
+    logger.debug('Delivering %d messages to target: %s', total, target_name)
+
+    # Targets that can import several messages at once get them in
+    # batches; everything else is delivered one message at a time
+    target_service = deliveries[work[0][0]][1]
+    batched = hasattr(target_service, 'import_messages')
+    batch_size = DELIVERY_BATCH_SIZE if batched else 1
+
+    # Connect once for the whole run instead of once per message, so
+    # backends never re-authenticate between deliveries
+    try:
+        target_service.connect()
+    except Exception as e:
+        logger.error('Unable to connect to target "%s": %s', target_name, str(e))
+        if message_cache is not None:
+            for dname, commits in work:
+                message_cache.release(target_name, deliveries[dname][0].feed_key, commits)
+        return dict(changes), unique_msgids
+
+    # The bar redraws its current item on every update, so format the
+    # delivery names once up front
+    display_names = {dname: format_key_for_display(dname) for dname, _ in work}
+    bar: 'ProgressBar[str]' = click.progressbar(
+        length=total,
+        label='Delivering to ' + target_name,
+        show_pos=True,
+        item_show_func=lambda x: display_names.get(x) if x is not None else None,
+        hidden=hide_bar)
+    with bar:
+        # We bail on a target after MAX_CONSECUTIVE_FAILURES failures in a row
+        consecutive_failures = 0
+        delivered_any = False
+
+        def _next_batch_size() -> int:
+            # Until the target has taken a message, and while its latest
+            # messages are failing, only send as many as may still fail
+            # before we bail, so a dead target is given up on early
+            if consecutive_failures or not delivered_any:
+                return min(batch_size, MAX_CONSECUTIVE_FAILURES - consecutive_failures)
+            return batch_size
+
+        prev_dname: Optional[str] = None
+        batches = iter_delivery_batches(deliveries, work, _next_batch_size)
+        for dname, target, feed, commits, labels, subfolder in batches:
+            if status_callback and dname != prev_dname:
+                status_callback(f"Delivering {display_names[dname]}...")
+                prev_dname = dname
+            stop = False
+            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                logger.error('Aborting deliveries to target "%s" due to repeated failures.', target_name)
+                stop = True
+            elif cancel_token is not None and cancel_token.is_set():
+                logger.info('Deliveries to target "%s" cancelled', target_name)
+                stop = True
+            if stop:
+                # Messages this target was going to share with others are
+                # no longer needed on its account
+                if message_cache is not None:
+                    message_cache.release(target_name, feed.feed_key, commits)
+                    for _, _, rest_feed, rest_commits, _, _ in batches:
+                        message_cache.release(target_name, rest_feed.feed_key, rest_commits)
+                break
+            if batched:
+                msgids = deliver_commits(dname, target, feed, commits, labels,
+                                         bozofilter=bozo_set, subfolder=subfolder, connect=False,
+                                         message_cache=message_cache)
+            else:
+                epoch, commit = commits[0]
+                msgids = [deliver_commit(dname, target, feed, epoch, commit, labels,
+                                         was_failing=False, bozofilter=bozo_set, subfolder=subfolder,
+                                         connect=False, message_cache=message_cache)]
+            bar.update(len(commits), dname)
+            delivered: List[str] = list()
+            for msgid in msgids:
+                if msgid is None:
+                    consecutive_failures += 1
+                    continue
+                if isinstance(msgid, SkipReason):
+                    # Filtered or no-op commit - not a failure, just skip
+                    continue
+
+                consecutive_failures = 0
+                delivered_any = True
+                delivered.append(msgid)
+            # Record the batch in one go rather than per message
+            if delivered:
+                changes[dname] += len(delivered)
+                unique_msgids.update(msgid for msgid in delivered if msgid)
+
+    # Disconnect target if it supports it (e.g., IMAP)
+    if hasattr(target_service, 'disconnect'):
+        target_service.disconnect()
+
+    return dict(changes), unique_msgids
+
+
 def perform_pull(ctx: click.Context, no_update: bool, force: bool,
                  delivery_name: Optional[str],
-                 status_callback: Optional[Callable[[str], None]] = None) -> Tuple[Dict[str, int], Set[str]]:
+                 status_callback: Optional[Callable[[str], None]] = None,
+                 cancel_token: Optional[threading.Event] = None) -> Tuple[Dict[str, int], Set[str]]:
     """Execute the pull logic and return changes.
 
+    The track_ids of tracked threads mapped for this pull are stored in
+    ctx.obj['tracked_ids'].
+
+    A long-running caller (the GUI) may pass cancel_token to stop the pull
+    early: feed updates and deliveries stop at the next feed or batch once
+    it is set, and feeds are still unlocked as usual.
+
     Returns:
         A tuple of (per-delivery counts dict, set of unique message-ids delivered).
     """
     cfg = ctx.obj.get('config', {})
-    bozo_set = ctx.obj.get('bozofilter', set())
+    bozo_set = ctx.obj.get('bozofilter', frozenset())
 
     # Load deliveries to process
     deliveries = cfg.get('deliveries', {})
@@ -1174,9 +1685,12 @@ def perform_pull(ctx: click.Context, no_update: bool, force: bool,
     # Collect unique feeds from all deliveries
     map_deliveries(ctx, deliveries)
 
-    # Map tracked threads as ephemeral deliveries (unless specific delivery requested)
+    # Map tracked threads as ephemeral deliveries (unless specific delivery
+    # requested), and remember which deliveries they are for reporting
+    tracked_ids: Set[str] = set()
     if not delivery_name:
-        map_tracked_threads(ctx)
+        tracked_ids.update(map_tracked_threads(ctx))
+    ctx.obj['tracked_ids'] = tracked_ids
 
     lock_all_feeds(ctx)
     # Retry all previously failed deliveries, if any
@@ -1186,7 +1700,8 @@ def perform_pull(ctx: click.Context, no_update: bool, force: bool,
         updated_feeds: List[str] = list()
         initialized_feeds: List[str] = list()
     else:
-        updated_feeds, initialized_feeds = update_all_feeds(ctx, status_callback=status_callback)
+        updated_feeds, initialized_feeds = update_all_feeds(ctx, status_callback=status_callback,
+                                                              cancel_token=cancel_token)
 
     # Build reverse index once: feed_key -> delivery names
     feed_to_deliveries: Dict[str, List[str]] = dict()
@@ -1205,93 +1720,93 @@ def perform_pull(ctx: click.Context, no_update: bool, force: bool,
                     logger.info('Initializing delivery state: %s', dname)
                     feed.save_delivery_info(dname)
 
-    run_deliveries: List[str] = list()
+    # Deliveries are streamed straight into the per-target worklist below
+    run_deliveries: Iterable[str]
     if not force:
-        logger.debug('Updated feeds: %s', ', '.join(updated_feeds))
-        for feed_key in updated_feeds:
-            run_deliveries.extend(feed_to_deliveries.get(feed_key, []))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Updated feeds: %s', ', '.join(updated_feeds))
+        run_deliveries = itertools.chain.from_iterable(
+            feed_to_deliveries.get(feed_key, ()) for feed_key in updated_feeds)
     else:
         # If force is specified, treat all feeds as updated
         logger.debug('Force flag set, treating all feeds as updated')
-        run_deliveries = list(ctx.obj['deliveries'].keys())
+        run_deliveries = iter(ctx.obj['deliveries'])
 
-    logger.debug('Deliveries to run: %s', ', '.join(run_deliveries))
+    if cancel_token is not None and cancel_token.is_set():
+        logger.info('Pull cancelled, skipping deliveries')
+        run_deliveries = ()
 
-    if not run_deliveries:
-        unlock_all_feeds(ctx)
-        return {}, set()
+    if logger.isEnabledFor(logging.DEBUG):
+        run_deliveries = list(run_deliveries)
+        logger.debug('Deliveries to run: %s', ', '.join(run_deliveries))
 
-    # Build a worklist of updates per target
-    by_target: Dict[str, List[str]] = dict()
+    # Build a worklist of new commits per target. Deliveries without new
+    # commits are dropped here, so targets with nothing to do are never
+    # connected to.
+    by_target: DefaultDict[str, List[Tuple[str, List[Tuple[int, str]]]]] = defaultdict(list)
     for dname in run_deliveries:
-        target_name = ctx.obj['deliveries'][dname][1].identifier
-        if target_name not in by_target:
-            by_target[target_name] = list()
-        by_target[target_name].append(dname)
+        feed, target, _, _ = ctx.obj['deliveries'][dname]
+        commits = feed.get_latest_commits_for_delivery(dname)
+        if not commits:
+            logger.debug('No new commits for delivery: %s', dname)
+            continue
+        by_target[target.identifier].append((dname, commits))
 
-    changes: Dict[str, int] = dict()
-    unique_msgids: Set[str] = set()
+    if not by_target:
+        logger.debug('No deliveries with new commits')
+        unlock_all_feeds(ctx)
+        flush_tracking_manifest(ctx)
+        close_ctx_requests_session(ctx)
+        ctx.obj['targets'] = {}
+        return {}, set()
 
-    # Process deliveries now
-    for target_name, delivery_names in by_target.items():
-        logger.debug('Processing deliveries for target: %s', target_name)
-        run_list: List[Tuple[str, Any, Union[LeiFeed, LoreFeed], int, str, List[str], Optional[str]]] = list()
-        for dname in delivery_names:
-            feed, target, labels, subfolder = ctx.obj['deliveries'][dname]
-            commits = feed.get_latest_commits_for_delivery(dname)
-            if not commits:
-                logger.debug('No new commits for delivery: %s', dname)
-                continue
+    # Targets following the same feed would each read the same commits;
+    # note which targets consume every commit so those shared between
+    # targets are read only once
+    consumers: DefaultDict[Tuple[str, int, str], Set[str]] = defaultdict(set)
+    for target_name, work in by_target.items():
+        for dname, commits in work:
+            feed_key = ctx.obj['deliveries'][dname][0].feed_key
             for epoch, commit in commits:
-                run_list.append((dname, target, feed, epoch, commit, labels, subfolder))
-        if not run_list:
-            logger.debug('No deliveries with new commits for target: %s', target_name)
-            continue
-        logger.debug('Delivering %d messages to target: %s', len(run_list), target_name)
-
-        with click.progressbar(run_list,
-                              label='Delivering to ' + target_name,
-                              show_pos=True,
-                              item_show_func=lambda x: x is not None and format_key_for_display(x[0]) or None,
-                              hidden=ctx.obj['hide_bar']) as bar:
-            # We bail on a target if we have more than 5 consecutive failures
-            consecutive_failures = 0
-            prev_dname: Optional[str] = None
-            for dname, target, feed, epoch, commit, labels, subfolder in bar:
-                if status_callback and dname != prev_dname:
-                    status_callback(f"Delivering {format_key_for_display(dname)}...")
-                    prev_dname = dname
-                if consecutive_failures >= 5:
-                    logger.error('Aborting deliveries to target "%s" due to repeated failures.', target_name)
-                    break
-                msgid = deliver_commit(dname, target, feed, epoch, commit, labels,
-                                       was_failing=False, bozofilter=bozo_set, subfolder=subfolder)
-                if msgid is None:
-                    consecutive_failures += 1
-                    continue
-                if msgid in (SKIPPED_BOZOFILTER, SKIPPED_NOOP_COMMIT):
-                    # Filtered or no-op commit - not a failure, just skip
-                    continue
+                consumers[(feed_key, epoch, commit)].add(target_name)
+    message_cache = SharedMessageCache({key: targets for key, targets in consumers.items() if len(targets) > 1})
 
-                consecutive_failures = 0
-                if dname not in changes:
-                    changes[dname] = 0
-                changes[dname] += 1
-                if msgid:
-                    unique_msgids.add(msgid)
+    changes: Dict[str, int] = dict()
+    unique_msgids: Set[str] = set()
 
-        # Disconnect target if it supports it (e.g., IMAP)
-        target_service = ctx.obj['targets'].get(target_name)
-        if target_service is not None and hasattr(target_service, 'disconnect'):
-            target_service.disconnect()
+    # Process deliveries now. Targets are independent endpoints, so when
+    # there are several of them deliver to each one in its own thread.
+    # Per-target progress bars would interleave, so they are hidden then.
+    if len(by_target) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_DELIVERY_WORKERS, len(by_target))) as executor:
+            futures = [executor.submit(_deliver_target, ctx, target_name, work,
+                                       bozo_set, status_callback, True, message_cache,
+                                       cancel_token)
+                       for target_name, work in by_target.items()]
+            # Results are merged here, on the calling thread, as each target finishes
+            for future in as_completed(futures):
+                target_changes, target_msgids = future.result()
+                changes.update(target_changes)
+                # Grow the larger set with the smaller one, so the bulk of
+                # the message-ids is never copied or rehashed again
+                if len(target_msgids) > len(unique_msgids):
+                    unique_msgids, target_msgids = target_msgids, unique_msgids
+                unique_msgids.update(target_msgids)
+    else:
+        for target_name, work in by_target.items():
+            changes, unique_msgids = _deliver_target(ctx, target_name, work, bozo_set,
+                                                     status_callback, ctx.obj['hide_bar'],
+                                                     message_cache, cancel_token)
 
     unlock_all_feeds(ctx)
 
-    # Update tracking manifest activity for any tracked threads that had deliveries
+    # Update tracking manifest activity for any tracked threads that had
+    # deliveries, then write the manifest once for the whole pull
     update_tracked_thread_activity(ctx, changes)
+    flush_tracking_manifest(ctx)
 
     # Close HTTP session and clear cached targets to avoid stale session references
-    close_requests_session()
+    close_ctx_requests_session(ctx)
     ctx.obj['targets'] = {}
 
     return changes, unique_msgids
@@ -1309,13 +1824,7 @@ def pull(ctx: click.Context, max_mail: int, no_update: bool, force: bool, delive
 
     if changes:
         logger.info('Pull complete with updates:')
-        tracked_ids = []
-        if not delivery_name:
-             # We need to re-fetch tracked IDs to identify them in output
-             # This is a bit inefficient but safe
-             manifest = get_tracking_manifest(ctx)
-             tracked_ids = [t.track_id for t in manifest.get_active_threads()]
-
+        tracked_ids: Set[str] = ctx.obj.get('tracked_ids', set())
         for dname, count in changes.items():
             if dname in tracked_ids:
                 logger.info('  %s (tracked): %d', dname, count)
@@ -1325,6 +1834,55 @@ def pull(ctx: click.Context, max_mail: int, no_update: bool, force: bool, delive
         logger.info('Pull complete with no updates.')
 
 
+def upload_messages(target: Any, messages: List[bytes], labels: List[str],
+                    progress: Optional[Callable[[int], None]] = None) -> Tuple[int, int]:
+    """Upload raw messages to a connected target.
+
+    Targets that implement import_messages() get the messages in batches
+    of DELIVERY_BATCH_SIZE, so a whole thread costs a few round-trips
+    instead of one per message; other targets get them one at a time.
+
+    Args:
+        target: Connected target service.
+        messages: Raw messages to upload, in order.
+        labels: Labels/folders to apply.
+        progress: Optional callback, called with the number of messages
+            handled after each batch.
+
+    Returns:
+        Tuple of (uploaded_count, failed_count)
+    """
+    from korgalore.pi_feed import PIFeed
+
+    uploaded = 0
+    failed = 0
+    batched = hasattr(target, 'import_messages')
+    batch_size = DELIVERY_BATCH_SIZE if batched else 1
+    for start in range(0, len(messages), batch_size):
+        chunk = messages[start:start + batch_size]
+        if logger.isEnabledFor(logging.DEBUG):
+            for raw_message in chunk:
+                logger.debug('Uploading: %s', PIFeed.parse_subject(raw_message))
+        errors: List[Optional[Exception]]
+        try:
+            if batched:
+                errors = target.import_messages(chunk, labels=labels)
+            else:
+                target.import_message(chunk[0], labels=labels)
+                errors = [None]
+        except liblore.RemoteError as e:
+            errors = [e] * len(chunk)
+        for error in errors:
+            if error is None:
+                uploaded += 1
+            else:
+                logger.error('Failed to upload message: %s', str(error))
+                failed += 1
+        if progress is not None:
+            progress(len(chunk))
+    return uploaded, failed
+
+
 def perform_yank(ctx: click.Context, target_name: str, msgid_or_url: str,
                  thread: bool = False,
                  labels_list: Optional[List[str]] = None) -> Tuple[int, int]:
@@ -1344,6 +1902,8 @@ def perform_yank(ctx: click.Context, target_name: str, msgid_or_url: str,
         ConfigurationError: If target not found
         RemoteError: If fetch or upload fails
     """
+    from korgalore.pi_feed import PIFeed
+
     ts = get_target(ctx, target_name)
 
     if labels_list is None:
@@ -1358,34 +1918,17 @@ def perform_yank(ctx: click.Context, target_name: str, msgid_or_url: str,
             mbox = node.get_mbox_by_msgid(msgid)
             messages = split_mbox_as_bytes(mbox)
             logger.info('Found %d messages in thread', len(messages))
-
-            uploaded = 0
-            failed = 0
-
-            for raw_message in messages:
-                try:
-                    msg = parse_message(raw_message)
-                    subject = msg.get('Subject', '(no subject)')
-                    logger.debug('Uploading: %s', subject)
-                    ts.import_message(raw_message, labels=labels_list)
-                    uploaded += 1
-                except liblore.RemoteError as e:
-                    logger.error('Failed to upload message: %s', str(e))
-                    failed += 1
-
-            return uploaded, failed
+            return upload_messages(ts, messages, labels_list)
         else:
             msgid = get_msgid_from_url(msgid_or_url)
             raw_message = node.get_message_by_msgid(msgid)
-            msg = parse_message(raw_message)
-            subject = msg.get('Subject', '(no subject)')
-            logger.debug('Uploading: %s', subject)
+            logger.debug('Uploading: %s', PIFeed.parse_subject(raw_message))
             ts.import_message(raw_message, labels=labels_list)
             return 1, 0
     finally:
         if hasattr(ts, 'disconnect'):
             ts.disconnect()
-        close_requests_session()
+        close_ctx_requests_session(ctx)
         ctx.obj['targets'] = {}
 
 
@@ -1399,13 +1942,15 @@ def perform_yank(ctx: click.Context, target_name: str, msgid_or_url: str,
 def yank(ctx: click.Context, target: Optional[str],
          labels: Tuple[str, ...], thread: bool, msgid_or_url: str) -> None:
     """Yank a single message or entire thread to a target."""
+    from korgalore.pi_feed import PIFeed
+
     # Get the target service
     config = ctx.obj.get('config', {})
     targets = config.get('targets', {})
 
     # Auto-select target if not specified (use first configured target)
     if not target:
-        target = list(targets.keys())[0]
+        target = next(iter(targets))
         logger.info('Using default target: %s', target)
 
     try:
@@ -1435,26 +1980,13 @@ def yank(ctx: click.Context, target: Optional[str],
 
         logger.info('Found %d messages in thread', len(messages))
 
-        # Upload each message in the thread
-        uploaded = 0
-        failed = 0
-
+        # Upload the messages in the thread
         ts.connect()
-        with click.progressbar(messages,
+        with click.progressbar(length=len(messages),
                               label='Uploading thread',
                               show_pos=True,
                               hidden=ctx.obj['hide_bar']) as bar:
-            for raw_message in bar:
-                try:
-                    msg = parse_message(raw_message)
-                    subject = msg.get('Subject', '(no subject)')
-                    logger.debug('Uploading: %s', subject)
-                    ts.import_message(raw_message, labels=labels_list)
-                    uploaded += 1
-                except liblore.RemoteError as e:
-                    logger.error('Failed to upload message: %s', str(e))
-                    failed += 1
-                    continue
+            uploaded, failed = upload_messages(ts, messages, labels_list, progress=bar.update)
 
         if failed > 0:
             logger.warning('Uploaded %d messages, %d failed', uploaded, failed)
@@ -1469,9 +2001,8 @@ def yank(ctx: click.Context, target: Optional[str],
             logger.critical('Failed to fetch message: %s', str(e))
             raise click.Abort()
 
-        # Parse to get the subject for logging
-        msg = parse_message(raw_message)
-        subject = msg.get('Subject', '(no subject)')
+        # Parse the headers to get the subject for logging
+        subject = PIFeed.parse_subject(raw_message)
         logger.debug('Message subject: %s', subject)
 
         # Upload the message
@@ -1486,13 +2017,24 @@ def yank(ctx: click.Context, target: Optional[str],
             raise click.Abort()
 
 
-def get_tracking_manifest(ctx: click.Context) -> TrackingManifest:
+def get_tracking_manifest(ctx: click.Context) -> 'TrackingManifest':
     """Get or create the tracking manifest."""
     if 'tracking_manifest' not in ctx.obj:
+        from korgalore.tracking import TrackingManifest
         data_dir = ctx.obj.get('data_dir', get_xdg_data_dir())
-        ctx.obj['tracking_manifest'] = TrackingManifest(data_dir)
-    manifest: TrackingManifest = ctx.obj['tracking_manifest']
-    return manifest
+        manifest = TrackingManifest(data_dir)
+        # Safety net for deferred activity updates that were never flushed
+        atexit.register(manifest.flush_if_dirty)
+        ctx.obj['tracking_manifest'] = manifest
+    cached: TrackingManifest = ctx.obj['tracking_manifest']
+    return cached
+
+
+def flush_tracking_manifest(ctx: click.Context) -> None:
+    """Persist deferred tracking manifest changes, if the manifest was loaded."""
+    manifest: Optional['TrackingManifest'] = ctx.obj.get('tracking_manifest')
+    if manifest is not None:
+        manifest.flush_if_dirty()
 
 
 def map_tracked_threads(ctx: click.Context) -> List[str]:
@@ -1504,6 +2046,8 @@ def map_tracked_threads(ctx: click.Context) -> List[str]:
     Returns:
         List of track_ids that were mapped.
     """
+    from korgalore.lei_feed import LeiFeed
+
     manifest = get_tracking_manifest(ctx)
 
     # Auto-expire inactive threads
@@ -1522,26 +2066,35 @@ def map_tracked_threads(ctx: click.Context) -> List[str]:
     deliveries = ctx.obj.get('deliveries', {})
     mapped: List[str] = []
 
+    # Ask lei for its searches once rather than once per tracked thread
+    known_searches = LeiFeed.list_known_searches()
+
+    # Resolve each target once, however many threads deliver to it
+    by_target: DefaultDict[str, List[Any]] = defaultdict(list)
     for tracked in active:
-        lei_url = f'lei:{tracked.lei_path}'
-        try:
-            lei_feed = LeiFeed(tracked.track_id, lei_url)
-        except ConfigurationError as e:
-            logger.warning('Tracked thread %s not recognized by lei: %s',
-                          tracked.track_id, str(e))
-            continue
+        by_target[tracked.target].append(tracked)
 
+    for target_name, threads in by_target.items():
         try:
-            target = get_target(ctx, tracked.target)
+            target = get_target(ctx, target_name)
         except click.Abort:
-            logger.warning('Target "%s" not available for tracked thread %s',
-                          tracked.target, tracked.track_id)
+            logger.warning('Target "%s" not available for tracked threads: %s',
+                          target_name, ', '.join(t.track_id for t in threads))
             continue
 
-        # Add to feeds and deliveries
-        feeds[tracked.track_id] = lei_feed
-        deliveries[tracked.track_id] = (lei_feed, target, tracked.labels, None)
-        mapped.append(tracked.track_id)
+        for tracked in threads:
+            lei_url = f'lei:{tracked.lei_path}'
+            try:
+                lei_feed = LeiFeed(tracked.track_id, lei_url, known_searches=known_searches)
+            except ConfigurationError as e:
+                logger.warning('Tracked thread %s not recognized by lei: %s',
+                              tracked.track_id, str(e))
+                continue
+
+            # Add to feeds and deliveries
+            feeds[tracked.track_id] = lei_feed
+            deliveries[tracked.track_id] = (lei_feed, target, tracked.labels, None)
+            mapped.append(tracked.track_id)
 
     return mapped
 
@@ -1574,16 +2127,20 @@ def track(ctx: click.Context) -> None:
 def track_add(ctx: click.Context, msgid_or_url: str, target: Optional[str],
               labels: Tuple[str, ...]) -> None:
     """Start tracking a thread by message ID or lore URL."""
+    from korgalore.lei_feed import LeiFeed
+    from korgalore.pi_feed import PIFeed
+    from korgalore.tracking import TrackStatus, create_lei_thread_search, update_lei_search
+
     config = ctx.obj.get('config', {})
     targets = config.get('targets', {})
 
     # Auto-select target if not specified (use first configured target)
     if not target:
-        target = list(targets.keys())[0]
+        target = next(iter(targets))
         logger.info('Using default target: %s', target)
     elif target not in targets:
         logger.critical('Target "%s" not found in configuration.', target)
-        logger.critical('Known targets: %s', ', '.join(targets.keys()))
+        logger.critical('Known targets: %s', ', '.join(targets))
         raise click.Abort()
 
     # Extract message ID from URL if needed
@@ -1645,8 +2202,7 @@ def track_add(ctx: click.Context, msgid_or_url: str, target: Optional[str],
     try:
         node = get_lore_node(ctx)
         raw_message = node.get_message_by_msgid(msgid)
-        msg = parse_message(raw_message)
-        subject = msg.get('Subject', '(no subject)')
+        subject = PIFeed.parse_subject(raw_message)
     except liblore.RemoteError:
         logger.warning('Could not fetch message to get subject')
 
@@ -1688,18 +2244,19 @@ def track_add(ctx: click.Context, msgid_or_url: str, target: Optional[str],
 
     logger.info('Delivering %d messages to target...', len(commits))
 
-    bozo_set = ctx.obj.get('bozofilter', set())
+    bozo_set = ctx.obj.get('bozofilter', frozenset())
     delivered = 0
     for commit in commits:
         result = deliver_commit(thread.track_id, target_service, lei_feed, 0, commit,
                                 labels_list, was_failing=False, bozofilter=bozo_set)
-        if result and result not in (SKIPPED_BOZOFILTER, SKIPPED_NOOP_COMMIT):
+        if isinstance(result, str) and result:
             delivered += 1
 
     # Initialize feed state so subsequent pulls don't re-initialize
     lei_feed.init_feed()
 
     manifest.update_activity(thread.track_id, delivered)
+    manifest.flush_if_dirty()
     logger.info('Delivered %d messages.', delivered)
 
 
@@ -1708,6 +2265,8 @@ def track_add(ctx: click.Context, msgid_or_url: str, target: Optional[str],
 @click.pass_context
 def track_list(ctx: click.Context, inactive: bool) -> None:
     """List tracked threads."""
+    from korgalore.tracking import TrackStatus
+
     manifest = get_tracking_manifest(ctx)
 
     if inactive:
@@ -1781,6 +2340,8 @@ def track_pause(ctx: click.Context, track_id: str) -> None:
 @click.pass_context
 def track_resume(ctx: click.Context, track_id: str) -> None:
     """Resume tracking for a paused or expired thread."""
+    from korgalore.tracking import TrackStatus
+
     manifest = get_tracking_manifest(ctx)
 
     try:
@@ -1832,21 +2393,24 @@ def subscribe_add(ctx: click.Context, url: str, target: Optional[str],
     URL can be a lore.kernel.org URL (e.g. https://lore.kernel.org/lkml/)
     or a local lei search path.
     """
+    from korgalore.lore_feed import LoreFeed
+    from korgalore.lei_feed import LeiFeed
+
     config = ctx.obj.get('config', {})
     targets = config.get('targets', {})
 
     # Auto-select target if not specified (use first configured target)
     if not target:
-        target = list(targets.keys())[0]
+        target = next(iter(targets))
         logger.info('Using default target: %s', target)
     elif target not in targets:
         logger.critical('Target "%s" not found in configuration.', target)
-        logger.critical('Known targets: %s', ', '.join(targets.keys()))
+        logger.critical('Known targets: %s', ', '.join(targets))
         raise click.Abort()
 
     # Determine feed type and validate
     try:
-        if url.startswith('https://') or url.startswith('http://'):
+        if url.startswith(('https://', 'http://')):
             LoreFeed.validate_public_inbox_url(url)
             feed_key = normalize_feed_key(url)
         else:
@@ -1886,7 +2450,7 @@ def subscribe_add(ctx: click.Context, url: str, target: Optional[str],
     conf_d.mkdir(parents=True, exist_ok=True)
     config_content = generate_subscription_config(feed_key, url, target, labels_list)
     config_file = conf_d / f'sub-{feed_key}.toml'
-    config_file.write_text(config_content)
+    atomic_write_text(config_file, config_content)
 
     logger.info('Subscribed to %s', url)
     logger.info('Configuration written to: %s', config_file)
@@ -2070,6 +2634,51 @@ def gui(ctx: click.Context) -> None:
         raise click.Abort()
 
 
+def create_subsystem_query(kind: str, query: str, key: str, lei_base_path: Path,
+                           threads: bool) -> bool:
+    """Create one lei search for a tracked subsystem and initialise its feed.
+
+    Each call works on its own search directory and LeiFeed instance, so
+    the searches of a subsystem can be created concurrently.
+
+    Args:
+        kind: Query kind, used as the search/delivery suffix ('mailinglist' or 'patches').
+        query: The lei query to run.
+        key: Normalized subsystem key.
+        lei_base_path: Directory holding the subsystem's lei searches.
+        threads: Include entire threads in the search results.
+
+    Returns:
+        True if the search was created, False on failure.
+    """
+    from korgalore.lei_feed import LeiFeed
+    from korgalore.tracking import create_lei_query_search
+
+    lei_path = lei_base_path / f'{key}-{kind}'
+    try:
+        retcode, output = create_lei_query_search(query, lei_path, threads=threads)
+        if retcode != 0:
+            logger.error('Lei query failed for %s: %s', kind, output.decode())
+            return False
+        # Initialize feed from start so all existing messages are delivered
+        feed = LeiFeed(f'{key}-{kind}', f'lei:{lei_path}')
+        epoch = feed.get_highest_epoch()
+        first_commit = feed.get_first_commit(epoch)
+        if first_commit:
+            feed.init_feed(from_start=True)
+            # Also initialize delivery state from the same starting point
+            feed.save_delivery_info(f'{key}-{kind}', epoch=epoch,
+                                    latest_commit=first_commit)
+        else:
+            # No messages matched the query; skip init_feed since the
+            # repo is empty and will be populated on the next lei up.
+            logger.warning('No messages found for %s query', kind)
+        return True
+    except PublicInboxError as e:
+        logger.error('Failed to create %s query: %s', kind, str(e))
+        return False
+
+
 @main.command('track-subsystem')
 @click.argument('subsystem_name', type=str, required=False, default=None)
 @click.option('--maintainers', '-m', default=None,
@@ -2103,6 +2712,13 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
     Use --forget to remove tracking for a previously tracked subsystem.
     Use --list to display all currently tracked subsystems.
     """
+    from korgalore.maintainers import (
+        get_subsystem, normalize_subsystem_name,
+        build_mailinglist_query, build_patches_query,
+        generate_subsystem_config, DEFAULT_CATCHALL_LISTS
+    )
+    from korgalore.tracking import forget_lei_search
+
     # Parameter validation
     if not do_list and not subsystem_name:
         raise click.UsageError('SUBSYSTEM_NAME is required unless --list is specified.')
@@ -2181,23 +2797,25 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
 
         # Read subsystem name from config before removing, for better log output
         forget_display_name = subsystem_name
-        if config_file.exists():
+        try:
+            config_text = config_file.read_text()
+        except FileNotFoundError:
+            logger.warning('Config file not found: %s', config_file)
+        else:
             try:
-                config_data = tomllib.loads(config_file.read_text())
+                config_data = tomllib.loads(config_text)
                 stored_name = config_data.get('subsystem', {}).get('name')
                 if stored_name:
                     forget_display_name = stored_name
             except Exception:
                 pass
-            config_file.unlink()
+            config_file.unlink(missing_ok=True)
             logger.info('Removed config file: %s', config_file)
-        else:
-            logger.warning('Config file not found: %s', config_file)
 
         # Forget lei searches
         lei_base_path = data_dir / 'lei'
-        for suffix in ('mailinglist', 'patches'):
-            lei_path = lei_base_path / f'{key}-{suffix}'
+        for lei_path in (lei_base_path / f'{key}-mailinglist',
+                         lei_base_path / f'{key}-patches'):
             if lei_path.exists():
                 try:
                     retcode, output = forget_lei_search(lei_path)
@@ -2228,7 +2846,7 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
         else:
             # Fetch from kernel.org as fallback
             data_dir = ctx.obj.get('data_dir', get_xdg_data_dir())
-            maintainers_path = get_maintainers_file(data_dir)
+            maintainers_path = get_maintainers_file(data_dir, get_ctx_requests_session(ctx))
 
     config = ctx.obj.get('config', {})
 
@@ -2244,11 +2862,11 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
 
     # Auto-select target if not specified (use first configured target)
     if not target:
-        target = list(targets.keys())[0]
+        target = next(iter(targets))
         logger.info('Using default target: %s', target)
     elif target not in targets:
         logger.critical('Target "%s" not found in configuration.', target)
-        logger.critical('Known targets: %s', ', '.join(targets.keys()))
+        logger.critical('Known targets: %s', ', '.join(targets))
         raise click.Abort()
 
     # Get target instance for default labels
@@ -2277,43 +2895,17 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
     data_dir = ctx.obj.get('data_dir', get_xdg_data_dir())
     lei_base_path = data_dir / 'lei'
 
-    # Build and create queries
-    queries_created = 0
+    # Build the queries
     skipped_patterns: List[str] = []
-    mailinglist_created = False
-    patches_created = False
+    queries: Dict[str, str] = dict()
 
     # 1. Mailing list query
     mailinglist_query, excluded_lists = build_mailinglist_query(entry, since, catchall_lists)
     if excluded_lists:
         logger.info('Excluding catch-all lists: %s', ', '.join(excluded_lists))
     if mailinglist_query:
-        lei_path = lei_base_path / f'{key}-mailinglist'
         logger.info('Creating mailinglist query: %s', mailinglist_query)
-        try:
-            retcode, output = create_lei_query_search(mailinglist_query, lei_path,
-                                                      threads=threads)
-            if retcode != 0:
-                logger.error('Lei query failed for mailinglist: %s', output.decode())
-            else:
-                # Initialize feed from start so all existing messages are delivered
-                feed = LeiFeed(f'{key}-mailinglist', f'lei:{lei_path}')
-                epoch = feed.get_highest_epoch()
-                first_commit = feed.get_first_commit(epoch)
-                if first_commit:
-                    feed.init_feed(from_start=True)
-                    # Also initialize delivery state from the same starting point
-                    delivery_name = f'{key}-mailinglist'
-                    feed.save_delivery_info(delivery_name, epoch=epoch,
-                                            latest_commit=first_commit)
-                else:
-                    # No messages matched the query; skip init_feed since the
-                    # repo is empty and will be populated on the next lei up.
-                    logger.warning('No messages found for mailinglist query')
-                queries_created += 1
-                mailinglist_created = True
-        except PublicInboxError as e:
-            logger.error('Failed to create mailinglist query: %s', str(e))
+        queries['mailinglist'] = mailinglist_query
     elif excluded_lists:
         logger.warning('No mailing lists remain after excluding catch-all lists')
     else:
@@ -2323,35 +2915,26 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
     patches_query, skipped = build_patches_query(entry, since)
     skipped_patterns.extend(skipped)
     if patches_query:
-        lei_path = lei_base_path / f'{key}-patches'
         logger.info('Creating patches query: %s', patches_query)
-        try:
-            retcode, output = create_lei_query_search(patches_query, lei_path,
-                                                      threads=threads)
-            if retcode != 0:
-                logger.error('Lei query failed for patches: %s', output.decode())
-            else:
-                # Initialize feed from start so all existing messages are delivered
-                feed = LeiFeed(f'{key}-patches', f'lei:{lei_path}')
-                epoch = feed.get_highest_epoch()
-                first_commit = feed.get_first_commit(epoch)
-                if first_commit:
-                    feed.init_feed(from_start=True)
-                    # Also initialize delivery state from the same starting point
-                    delivery_name = f'{key}-patches'
-                    feed.save_delivery_info(delivery_name, epoch=epoch,
-                                            latest_commit=first_commit)
-                else:
-                    # No messages matched the query; skip init_feed since the
-                    # repo is empty and will be populated on the next lei up.
-                    logger.warning('No messages found for patches query')
-                queries_created += 1
-                patches_created = True
-        except PublicInboxError as e:
-            logger.error('Failed to create patches query: %s', str(e))
+        queries['patches'] = patches_query
     else:
         logger.warning('No file patterns found for subsystem')
 
+    # The searches are independent and each spends most of its time
+    # waiting on lei and the remote inbox, so create them concurrently
+    created: Set[str] = set()
+    if queries:
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures = {executor.submit(create_subsystem_query, kind, query, key,
+                                       lei_base_path, threads): kind
+                       for kind, query in queries.items()}
+            for future in as_completed(futures):
+                if future.result():
+                    created.add(futures[future])
+    queries_created = len(created)
+    mailinglist_created = 'mailinglist' in created
+    patches_created = 'patches' in created
+
     if queries_created == 0:
         logger.critical('No queries could be created for subsystem.')
         raise click.Abort()
@@ -2379,7 +2962,7 @@ def track_subsystem(ctx: click.Context, subsystem_name: Optional[str],
     )
 
     config_file = conf_d / f'{key}.toml'
-    config_file.write_text(config_content)
+    atomic_write_text(config_file, config_content)
 
     logger.info('Created %d lei queries for subsystem "%s"', queries_created, entry.name)
     logger.info('Configuration written to: %s', config_file)
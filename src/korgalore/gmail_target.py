@@ -1,16 +1,20 @@
 import os
+import base64
+import functools
 import logging
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow # type: ignore
-from googleapiclient.discovery import build # type: ignore
+from googleapiclient.discovery import build_from_document # type: ignore
+from googleapiclient.discovery_cache import get_static_doc # type: ignore
 from googleapiclient.errors import HttpError # type: ignore
 
 from google.auth.exceptions import RefreshError
 
-from korgalore import ConfigurationError, RemoteError, AuthenticationError
+from korgalore import ConfigurationError, RemoteError, AuthenticationError, atomic_write_text, json_loads
 from korgalore.message import RawMessage
 
 logger = logging.getLogger('korgalore')
@@ -24,6 +28,54 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.insert',
     ]
 
+# Maximum number of calls the Gmail API accepts in one batch request
+GMAIL_BATCH_LIMIT = 100
+
+# Bound once; called for every imported message
+_b64encode = base64.urlsafe_b64encode
+
+
+def _token_mtime_ns(token_file: str) -> Optional[int]:
+    """Return the modification time of a token file, or None if it is missing."""
+    try:
+        return os.stat(token_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _load_token_cached(token_file: str, mtime_ns: int) -> Credentials:
+    """Load OAuth credentials from a token file, once per file version.
+
+    Targets sharing a token file (and repeated target instantiation, as
+    happens in the GUI after every pull) reuse the same parsed credentials
+    until the file changes on disk.
+    """
+    return Credentials.from_authorized_user_file(token_file, SCOPES)  # type: ignore
+
+
+@functools.lru_cache(maxsize=1)
+def _gmail_discovery_document() -> str:
+    """Return the Gmail API discovery document bundled with the API client.
+
+    Building the service from this document avoids locating and reading
+    it again on every connect().
+    """
+    doc = get_static_doc('gmail', 'v1')
+    if doc is None:
+        raise ConfigurationError('Gmail API discovery document not available in googleapiclient.')
+    return str(doc)
+
+
+def _gmail_service_description() -> Dict[str, Any]:
+    """Parse the cached Gmail discovery document for build_from_document().
+
+    A fresh dict is returned on every call, because building the service
+    modifies the description it is given.
+    """
+    description: Dict[str, Any] = json_loads(_gmail_discovery_document())
+    return description
+
 
 class GmailTarget:
     """Target class for delivering email messages to Gmail via the API."""
@@ -50,6 +102,8 @@ class GmailTarget:
         self.creds: Optional[Credentials] = None
         self.service: Optional[Any] = None
         self._label_map: Optional[Dict[str, str]] = None
+        # Translated label IDs, keyed by the label names they came from
+        self._label_ids: Dict[Tuple[str, ...], List[str]] = dict()
         # Store expanded paths for potential re-authentication
         self._credentials_file = os.path.expandvars(os.path.expanduser(credentials_file))
         self._token_file = os.path.expandvars(os.path.expanduser(token_file))
@@ -68,8 +122,9 @@ class GmailTarget:
             AuthenticationError: If token is expired/revoked and re-auth is needed.
         """
         # The file token.json stores the user's access and refresh tokens
-        if os.path.exists(self._token_file):
-            self.creds = Credentials.from_authorized_user_file(self._token_file, SCOPES) # type: ignore
+        token_mtime_ns = _token_mtime_ns(self._token_file)
+        if token_mtime_ns is not None:
+            self.creds = _load_token_cached(self._token_file, token_mtime_ns)
 
         # If there are no (valid) credentials available, let the user log in
         if not self.creds or not self.creds.valid:
@@ -79,10 +134,8 @@ class GmailTarget:
                 except RefreshError:
                     logger.warning('Gmail token for %s has expired or been revoked.',
                                    self.identifier)
-                    invalid_token_file = self._token_file + '.invalid'
-                    if os.path.exists(invalid_token_file):
-                        os.remove(invalid_token_file)
-                    os.rename(self._token_file, invalid_token_file)
+                    # os.replace overwrites any older .invalid file in one step
+                    os.replace(self._token_file, self._token_file + '.invalid')
                     self._needs_auth = True
                     if not self._interactive:
                         # In non-interactive mode, just return - caller will check needs_auth
@@ -93,37 +146,66 @@ class GmailTarget:
                         target_id=self.identifier,
                         target_type='gmail'
                     )
-            elif os.path.exists(self._credentials_file):
-                if not self._interactive:
-                    # In non-interactive mode (GUI), don't run OAuth flow
-                    # Just mark as needing auth and return - caller will check needs_auth
-                    self._needs_auth = True
-                    return
+            elif not self._interactive:
+                if not os.path.exists(self._credentials_file):
+                    raise ConfigurationError(
+                        f"{self._credentials_file} not found. Please download it from Google Cloud Console."
+                    )
+                # In non-interactive mode (GUI), don't run OAuth flow
+                # Just mark as needing auth and return - caller will check needs_auth
+                self._needs_auth = True
+                return
+            else:
+                flow = self._load_client_secrets()
                 logger.critical('Log in to Gmail account for %s', self.identifier)
-
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self._credentials_file, SCOPES)
                 self.creds = flow.run_local_server(port=0)
-            else:
-                raise ConfigurationError(
-                    f"{self._credentials_file} not found. Please download it from Google Cloud Console."
-                )
 
             # Save the credentials for the next run
-            with open(self._token_file, 'w') as token:
-                token.write(self.creds.to_json())
+            self._save_token()
 
         self._needs_auth = False
 
+    def _save_token(self) -> None:
+        """Write the in-memory credentials to the token file.
+
+        The write is atomic, so an interrupted write never leaves a
+        truncated token behind that would force another login.
+        """
+        atomic_write_text(Path(self._token_file), self.creds.to_json())  # type: ignore[union-attr]
+
+    def _load_client_secrets(self) -> Any:
+        """Create the OAuth flow from the client credentials file.
+
+        Raises:
+            ConfigurationError: If credentials file is not found.
+        """
+        try:
+            return InstalledAppFlow.from_client_secrets_file(self._credentials_file, SCOPES)
+        except FileNotFoundError:
+            raise ConfigurationError(
+                f"{self._credentials_file} not found. Please download it from Google Cloud Console."
+            )
 
     def connect(self) -> None:
         """Establish connection to the Gmail API service.
 
-        Creates the Gmail API service object if not already connected.
+        Creates the Gmail API service object if not already connected, and
+        loads the label map so the first import does not need an extra
+        round-trip to resolve labels.
+
+        Raises:
+            RemoteError: If the labels cannot be listed.
         """
         if self.service is None:
             logger.debug('Connecting to Gmail service for %s', self.identifier)
-            self.service = build('gmail', 'v1', credentials=self.creds, cache_discovery=False)
+            self.service = build_from_document(_gmail_service_description(), credentials=self.creds)
+        if self._label_map is None:
+            self._load_label_map()
+
+    def _load_label_map(self) -> None:
+        """Fetch all labels from Gmail and index their IDs by name."""
+        self._label_map = {label['name']: label['id'] for label in self.list_labels()}
+        self._label_ids.clear()
 
     def list_labels(self) -> List[Dict[str, str]]:
         """List all labels in the user's mailbox.
@@ -139,30 +221,53 @@ class GmailTarget:
         except HttpError as error:
             raise RemoteError(f'An error occurred: {error}')
 
-    def translate_labels(self, labels: List[str]) -> List[str]:
+    def translate_labels(self, labels: Sequence[str]) -> List[str]:
         """Translate label names to Gmail label IDs.
 
+        Deliveries use the same few label lists for every message, so each
+        distinct list is translated once and the result reused.
+
         Args:
             labels: List of label names to translate.
 
         Returns:
-            List of corresponding Gmail label IDs.
+            List of corresponding Gmail label IDs. The list is shared
+            between calls and must not be modified.
 
         Raises:
             ConfigurationError: If any label is not found in Gmail.
         """
+        key = tuple(labels)
+        cached = self._label_ids.get(key)
+        if cached is not None:
+            return cached
         # Translate label names to their corresponding IDs
         if self._label_map is None:
             # Get all labels from Gmail
-            self._label_map = {label['name']: label['id'] for label in self.list_labels()}
+            self._load_label_map()
+        assert self._label_map is not None
         translated: List[str] = []
         for label in labels:
             label_id = self._label_map.get(label, None)
             if label_id is None:
                 raise ConfigurationError(f"Label '{label}' not found in Gmail '{self.identifier}'.")
             translated.append(label_id)
+        self._label_ids[key] = translated
         return translated
 
+    @staticmethod
+    def _build_message_body(raw_message: bytes, label_ids: Optional[List[str]],
+                            feed_name: Optional[str], delivery_name: Optional[str]) -> Dict[str, Any]:
+        """Build the body of a messages.import call for one message."""
+        msg = RawMessage(raw_message)
+        message_body: Dict[str, Any] = {
+            # base64 output is pure ASCII, which decodes faster than utf-8
+            'raw': _b64encode(msg.as_bytes(feed_name, delivery_name)).decode('ascii')
+        }
+        if label_ids:
+            message_body['labelIds'] = label_ids
+        return message_body
+
     def import_message(
         self,
         raw_message: bytes,
@@ -187,17 +292,8 @@ class GmailTarget:
             RemoteError: If the Gmail API call fails.
         """
         try:
-            import base64
-
-            msg = RawMessage(raw_message)
-            encoded_message = base64.urlsafe_b64encode(
-                msg.as_bytes(feed_name, delivery_name)
-            ).decode()
-            message_body: Dict[str, Any] = {'raw': encoded_message}
-
-            if labels:
-                label_ids = self.translate_labels(labels)
-                message_body['labelIds'] = label_ids
+            label_ids = self.translate_labels(labels) if labels else None
+            message_body = self._build_message_body(raw_message, label_ids, feed_name, delivery_name)
 
             # Upload the message
             result = self.service.users().messages().import_(  # type: ignore
@@ -210,6 +306,63 @@ class GmailTarget:
         except HttpError as error:
             raise RemoteError(f'An error occurred: {error}')
 
+    def import_messages(
+        self,
+        raw_messages: List[bytes],
+        labels: List[str],
+        feed_name: Optional[str] = None,
+        delivery_name: Optional[str] = None,
+        subfolder: Optional[str] = None
+    ) -> List[Optional[Exception]]:
+        """Import several raw email messages into Gmail using batch requests.
+
+        Messages are sent in batches of up to GMAIL_BATCH_LIMIT calls, so
+        each batch costs a single HTTP round-trip.
+
+        Args:
+            raw_messages: The raw email messages as bytes.
+            labels: List of label names to apply to every message.
+            feed_name: Optional feed name for trace header.
+            delivery_name: Optional delivery name for trace header.
+            subfolder: Ignored for Gmail (use labels for folder assignment).
+
+        Returns:
+            One entry per message: None if it was imported, or the
+            exception describing why it was not.
+
+        Raises:
+            ConfigurationError: If any label is not found in Gmail.
+        """
+        label_ids = self.translate_labels(labels) if labels else None
+        errors: List[Optional[Exception]] = [None] * len(raw_messages)
+
+        def _record_result(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is not None:
+                errors[int(request_id)] = RemoteError(f'An error occurred: {exception}')
+
+        for start in range(0, len(raw_messages), GMAIL_BATCH_LIMIT):
+            chunk = range(start, min(start + GMAIL_BATCH_LIMIT, len(raw_messages)))
+            batch = self.service.new_batch_http_request(callback=_record_result)  # type: ignore
+            for idx in chunk:
+                message_body = self._build_message_body(raw_messages[idx], label_ids,
+                                                        feed_name, delivery_name)
+                batch.add(
+                    self.service.users().messages().import_(userId='me', body=message_body),  # type: ignore
+                    request_id=str(idx)
+                )
+            try:
+                batch.execute()
+            except HttpError as error:
+                for idx in chunk:
+                    errors[idx] = RemoteError(f'An error occurred: {error}')
+
+        return errors
+
+    @property
+    def supports_reauth(self) -> bool:
+        """Whether reauthenticate() can be used; always true for Gmail."""
+        return True
+
     @property
     def needs_auth(self) -> bool:
         """Check if this target needs re-authentication."""
@@ -219,26 +372,20 @@ class GmailTarget:
         """Perform OAuth re-authentication flow.
 
         Opens a browser window for the user to log in and authorize the app.
-        Updates credentials upon successful authentication.
+        Updates credentials upon successful authentication and rebuilds the
+        service around them, without reading the token back from disk.
 
         Raises:
             ConfigurationError: If credentials file is not found.
         """
-        if not os.path.exists(self._credentials_file):
-            raise ConfigurationError(
-                f"{self._credentials_file} not found. Please download it from Google Cloud Console."
-            )
-
+        flow = self._load_client_secrets()
         logger.info('Starting re-authentication for Gmail account %s', self.identifier)
-
-        flow = InstalledAppFlow.from_client_secrets_file(
-            self._credentials_file, SCOPES)
         self.creds = flow.run_local_server(port=0)
 
         # Save the credentials
-        with open(self._token_file, 'w') as token:
-            token.write(self.creds.to_json())
+        self._save_token()
 
         self._needs_auth = False
-        self.service = None  # Reset service to force reconnect with new creds
+        # Rebuild the service with the new creds from the cached discovery doc
+        self.service = build_from_document(_gmail_service_description(), credentials=self.creds)
         logger.info('Re-authentication successful for %s', self.identifier)
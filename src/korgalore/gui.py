@@ -4,11 +4,11 @@ import logging
 import math
 import os
 import signal
-import subprocess
 import sys
 import threading
 import time
-from typing import Optional, Any
+from pathlib import Path
+from typing import Optional, Any, Callable, Dict, Tuple
 
 import click
 
@@ -19,36 +19,59 @@ from korgalore.cli import (
 )
 import liblore
 from korgalore.bozofilter import ensure_bozofilter_exists, load_bozofilter
-from korgalore.gmail_target import GmailTarget
-from korgalore.imap_target import ImapTarget
-
-# Optional GTK/AppIndicator3 support - checked at runtime
-# AppIndicator3 is called AyatanaAppIndicator3 on some systems (e.g., Debian)
-HAS_GTK = False
-try:
-    import gi  # type: ignore
-    gi.require_version('Gtk', '3.0')
-    from gi.repository import Gtk, GLib, Gio  # type: ignore
-    # Try AppIndicator3 first, fall back to AyatanaAppIndicator3
+
+# Optional GTK/AppIndicator3 support - imported on first use by
+# _ensure_gtk_imported(), so importing this module does not load GI.
+# None until the import has been attempted.
+HAS_GTK: Optional[bool] = None
+Gtk: Any = None
+GLib: Any = None
+Gio: Any = None
+AppIndicator3: Any = None
+
+
+def _ensure_gtk_imported() -> bool:
+    """Import the GTK bindings into the module globals, once.
+
+    Returns:
+        True if GTK and an AppIndicator implementation are available.
+    """
+    global HAS_GTK, Gtk, GLib, Gio, AppIndicator3
+    if HAS_GTK is not None:
+        return HAS_GTK
     try:
-        gi.require_version('AppIndicator3', '0.1')
-        from gi.repository import AppIndicator3
-    except ValueError:
-        gi.require_version('AyatanaAppIndicator3', '0.1')
-        from gi.repository import AyatanaAppIndicator3 as AppIndicator3
-    HAS_GTK = True
-except (ValueError, ImportError):
-    Gtk = None
-    GLib = None
-    Gio = None
-    AppIndicator3 = None
+        import gi  # type: ignore
+        gi.require_version('Gtk', '3.0')
+        from gi.repository import Gtk, GLib, Gio  # type: ignore
+        # Try AppIndicator3 first, fall back to AyatanaAppIndicator3
+        # AppIndicator3 is called AyatanaAppIndicator3 on some systems (e.g., Debian)
+        try:
+            gi.require_version('AppIndicator3', '0.1')
+            from gi.repository import AppIndicator3
+        except ValueError:
+            gi.require_version('AyatanaAppIndicator3', '0.1')
+            from gi.repository import AyatanaAppIndicator3 as AppIndicator3
+        HAS_GTK = True
+    except (ValueError, ImportError):
+        HAS_GTK = False
+    return HAS_GTK
 
 logger = logging.getLogger('korgalore.gui')
 
+# Minimum seconds between status refreshes for perform_pull progress
+PULL_STATUS_INTERVAL = 0.1
+
+# Prebuilt "Next sync" countdown labels, indexed by minutes, tens of
+# seconds and seconds respectively
+_MIN_LABELS = tuple(f"Next sync: ~{mins} min" for mins in range(61))
+_SEC_LABELS = tuple(f"Next sync: ~{secs} sec" for secs in range(0, 70, 10))
+_IN_LABELS = tuple(f"Next sync: in {secs}s" for secs in range(10))
+
 class KorgaloreApp:
     """Korgalore Taskbar Application."""
 
     def __init__(self, ctx: click.Context):
+        _ensure_gtk_imported()
         self.ctx = ctx
         self.ind = AppIndicator3.Indicator.new(
             "korgalore-indicator",
@@ -63,9 +86,8 @@ class KorgaloreApp:
         self._config_mtime = self._get_config_mtime()
 
         # Load config
-        config = ctx.obj.get('config', {})
-        gui_config = config.get('gui', {})
-        self.sync_interval = gui_config.get('sync_interval', 300)
+        self._targets_version = 0
+        self._refresh_config_snapshot()
         logger.info('Auto-sync interval set to %d seconds', self.sync_interval)
 
         # State
@@ -75,6 +97,33 @@ class KorgaloreApp:
         self.error_state = False
         self.auth_needed_target: Optional[str] = None  # Target ID needing re-auth
 
+        # Latest status posted by worker threads, applied by one idle callback
+        self._status_lock = threading.Lock()
+        self._status_pending: Optional[Tuple[str, Optional[str]]] = None
+        self._status_scheduled = False
+        # When pending status was last applied; guarded by _status_lock
+        self._last_status_drain = 0.0
+        # What the widgets currently show, to skip no-op updates
+        self._current_label: Optional[str] = None
+        self._current_icon: Optional[str] = None
+
+        # Pending one-shot source that refreshes the "Next sync" label
+        self._timer_source: Optional[int] = None
+        # The "Next sync" label is only refreshed while the menu is shown
+        self._menu_visible = False
+        self._last_next_sync_label: Optional[str] = None
+
+        # Yank dialog, built on first use and reused afterwards
+        self._yank_dialog: Optional[Any] = None
+        self._yank_entry: Optional[Any] = None
+        self._yank_target_label: Optional[Any] = None
+        self._yank_combo: Optional[Any] = None
+        self._yank_thread_check: Optional[Any] = None
+        # Target names currently listed in the yank dialog's combo
+        self._yank_targets: Tuple[str, ...] = ()
+        # Error shown instead of the yank dialog when no targets exist
+        self._no_targets_dialog: Optional[Any] = None
+
         # Network monitoring
         self.network_monitor = Gio.NetworkMonitor.get_default()
         self.network_available = self.network_monitor.get_network_available()
@@ -85,6 +134,8 @@ class KorgaloreApp:
 
         self.sync_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
+        # Wakes the background worker to re-check next_sync_time/stop_event
+        self._sync_wake = threading.Event()
 
     def _get_config_mtime(self) -> float:
         """Return the newest mtime of config files."""
@@ -103,6 +154,18 @@ class KorgaloreApp:
             pass
         return mtime
 
+    def _refresh_config_snapshot(self) -> None:
+        """Copy the config values the GUI reads repeatedly onto self.
+
+        Called at startup and after every config reload; bumps
+        _targets_version so cached target lists are refreshed.
+        """
+        config = self.ctx.obj.get('config', {})
+        self._gui_config: Dict[str, Any] = config.get('gui', {})
+        self.sync_interval = self._gui_config.get('sync_interval', 300)
+        self._target_names: Tuple[str, ...] = tuple(config.get('targets', {}).keys())
+        self._targets_version += 1
+
     def _check_reload_config(self) -> None:
         """Reload configuration if files have changed on disk."""
         current_mtime = self._get_config_mtime()
@@ -115,8 +178,7 @@ class KorgaloreApp:
             self.ctx.obj['targets'] = dict()
             self.ctx.obj['feeds'] = dict()
             self.ctx.obj['deliveries'] = dict()
-            gui_config = self.ctx.obj['config'].get('gui', {})
-            self.sync_interval = gui_config.get('sync_interval', 300)
+            self._refresh_config_snapshot()
             self._config_mtime = current_mtime
             logger.info("Configuration reloaded successfully.")
         else:
@@ -189,17 +251,33 @@ class KorgaloreApp:
         item_quit.connect("activate", self.quit)
         menu.append(item_quit)
 
+        # Track visibility so the countdown only ticks while it can be seen
+        menu.connect("show", self._on_menu_show)
+        menu.connect("hide", self._on_menu_hide)
+
         menu.show_all()
         return menu
 
+    def _on_menu_show(self, menu: Any) -> None:
+        """Refresh the countdown as soon as the menu becomes visible."""
+        self._menu_visible = True
+        self._reschedule_timers()
+
+    def _on_menu_hide(self, menu: Any) -> None:
+        """Stop refreshing the countdown while the menu is hidden."""
+        self._menu_visible = False
+        if self._timer_source is not None:
+            GLib.source_remove(self._timer_source)
+            self._timer_source = None
+
     def run(self) -> None:
         """Start the application."""
         # Start background sync thread
         self.sync_thread = threading.Thread(target=self.background_worker, daemon=True)
         self.sync_thread.start()
 
-        # Start timer update loop (every 1 second)
-        GLib.timeout_add_seconds(1, self.update_timers)
+        # Start the "Next sync" label updates
+        self._reschedule_timers()
 
         # Handle Ctrl+C
         signal.signal(signal.SIGINT, lambda *args: self.quit())
@@ -210,16 +288,62 @@ class KorgaloreApp:
     def quit(self, source: Any = None) -> None:
         logger.info("Quitting Korgalore GUI...")
         self.stop_event.set()
+        self._sync_wake.set()
         Gtk.main_quit()
 
     def update_status(self, text: str, icon_name: Optional[str] = None) -> None:
-        """Update UI status (thread-safe)."""
-        def _update() -> bool:
-            self.item_status.set_label(text)
-            if icon_name:
+        """Update UI status (thread-safe).
+
+        Bursts of updates (e.g. from the pull status callback) are coalesced:
+        only the latest status is kept, and at most one idle callback is
+        pending on the main loop at any time.
+        """
+        self._post_status(text, icon_name, 0.0)
+
+    def _pull_status(self, status: str) -> None:
+        """Forward perform_pull progress, refreshing at most every PULL_STATUS_INTERVAL.
+
+        Every update is kept as the latest status; only how often the
+        widgets are refreshed is limited, so the last update of a burst is
+        still shown once the interval is up.
+        """
+        self._post_status(status, "system-run-symbolic", PULL_STATUS_INTERVAL)
+
+    def _post_status(self, text: str, icon_name: Optional[str], min_interval: float) -> None:
+        """Store the latest status and schedule a single drain for it.
+
+        The drain runs no sooner than min_interval seconds after the
+        previous one.
+        """
+        with self._status_lock:
+            self._status_pending = (text, icon_name)
+            if self._status_scheduled:
+                return
+            self._status_scheduled = True
+            delay = self._last_status_drain + min_interval - time.monotonic()
+        # Cosmetic; must not delay input handling during a busy sync
+        if delay > 0:
+            GLib.timeout_add(math.ceil(delay * 1000), self._drain_status, priority=GLib.PRIORITY_LOW)
+        else:
+            GLib.idle_add(self._drain_status, priority=GLib.PRIORITY_LOW)
+
+    def _drain_status(self) -> bool:
+        """Apply the latest pending status (called from GLib.idle_add)."""
+        with self._status_lock:
+            pending = self._status_pending
+            self._status_pending = None
+            self._status_scheduled = False
+            self._last_status_drain = time.monotonic()
+        if pending is not None:
+            text, icon_name = pending
+            if text != self._current_label:
+                self.item_status.set_label(text)
+                self._current_label = text
+            # Icon changes go out over DBus, so only send real changes
+            if icon_name and icon_name != self._current_icon:
                 self.ind.set_icon(icon_name)
-            return False
-        GLib.idle_add(_update)
+                self._current_icon = icon_name
+        return False
 
     def _on_network_changed(self, monitor: Any, network_available: bool) -> None:
         """Handle network availability changes."""
@@ -232,69 +356,107 @@ class KorgaloreApp:
             # to allow network stack to fully stabilize
             logger.info('Network restored, scheduling sync in 10 seconds')
             self.next_sync_time = time.time() + 10
+            self._sync_wake.set()
             self.error_state = False
             self.update_status("Network restored, syncing soon...", "network-idle-symbolic")
         elif not network_available:
             # Network went down
             self.update_status("Network unavailable", "network-offline-symbolic")
+        self._reschedule_timers()
+
+    def _next_timer_interval(self) -> int:
+        """Return the seconds until the "Next sync" label can next change.
+
+        The label is quantized to minutes, then tens of seconds, so it only
+        needs refreshing every second during the final countdown. While
+        syncing or offline the label is static; run_sync and the network
+        monitor reschedule as soon as that changes.
+        """
+        if self.is_syncing or not self.network_available:
+            return 60
+        diff = self.next_sync_time - time.time()
+        if diff > 120:
+            return 60
+        if diff >= 20:
+            return 10
+        return 1
+
+    def _schedule_next_timer_tick(self) -> None:
+        """Schedule a one-shot refresh of the "Next sync" label."""
+        self._timer_source = GLib.timeout_add_seconds(
+            self._next_timer_interval(), self._on_timer_tick)
+
+    def _on_timer_tick(self) -> bool:
+        """Refresh the "Next sync" label and schedule the next refresh."""
+        self._timer_source = None
+        if not self._menu_visible:
+            return False
+        self.update_timers()
+        self._schedule_next_timer_tick()
+        return False  # One-shot; the next tick is scheduled explicitly
+
+    def _reschedule_timers(self) -> bool:
+        """Refresh the label now and restart the tick schedule.
+
+        Called when next_sync_time jumps or the sync state changes; must
+        run on the main loop (use GLib.idle_add from worker threads). Does
+        nothing beyond cancelling the pending tick while the menu is hidden.
+        """
+        if self._timer_source is not None:
+            GLib.source_remove(self._timer_source)
+            self._timer_source = None
+        if not self._menu_visible:
+            return False
+        self.update_timers()
+        self._schedule_next_timer_tick()
+        return False
 
-    def update_timers(self) -> bool:
+    def update_timers(self) -> None:
         """Update last/next sync timers in menu."""
-        now = time.time()
-
         # Next Sync
         if not self.network_available:
-            self.item_next_sync.set_label("Next sync: Waiting for network")
+            text = "Next sync: Waiting for network"
         elif self.is_syncing:
-            self.item_next_sync.set_label("Next sync: In progress...")
-        elif self.next_sync_time > now:
-            diff = int(self.next_sync_time - now)
+            text = "Next sync: In progress..."
+        else:
+            diff = int(self.next_sync_time - time.time())
             if diff > 60:
-                mins = round(diff / 60)
-                text = f"Next sync: ~{mins} min"
+                # Nearest minute
+                mins = (diff + 30) // 60
+                if mins < len(_MIN_LABELS):
+                    text = _MIN_LABELS[mins]
+                else:
+                    text = f"Next sync: ~{mins} min"
             elif diff >= 10:
-                secs = math.ceil(diff / 10) * 10
-                text = f"Next sync: ~{secs} sec"
+                # Round up to the next 10 seconds
+                text = _SEC_LABELS[(diff + 9) // 10]
+            elif diff > 0:
+                text = _IN_LABELS[diff]
             else:
-                text = f"Next sync: in {diff}s"
-            self.item_next_sync.set_label(text)
-        else:
-            # Should be syncing soon or now
-            self.item_next_sync.set_label("Next sync: Soon...")
+                # Should be syncing soon or now
+                text = "Next sync: Soon..."
 
-        return True  # Keep calling this
+        if text != self._last_next_sync_label:
+            self.item_next_sync.set_label(text)
+            self._last_next_sync_label = text
 
     def on_sync_now(self, source: Any) -> None:
         if self.is_syncing:
             return
-        # Run sync in a separate thread to not block UI
-        threading.Thread(target=self.run_sync, daemon=True).start()
+        self._request_sync()
+
+    def _request_sync(self) -> None:
+        """Ask the background worker to sync now (thread-safe)."""
+        self.next_sync_time = 0
+        self._sync_wake.set()
 
     def on_yank(self, source: Any) -> None:
         """Show the yank dialog."""
         # Must run dialog on main thread
         GLib.idle_add(self._show_yank_dialog)
 
-    def _show_yank_dialog(self) -> bool:
-        """Display the yank dialog (called from GLib.idle_add)."""
-        config = self.ctx.obj.get('config', {})
-        targets = config.get('targets', {})
-        target_names = list(targets.keys())
-
-        if not target_names:
-            dialog = Gtk.MessageDialog(
-                transient_for=None,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text="No targets configured"
-            )
-            dialog.format_secondary_text("Please configure at least one target in your configuration file.")
-            dialog.run()
-            dialog.destroy()
-            return False
-
-        # Create dialog
+    def _build_yank_dialog(self) -> None:
+        """Create the yank dialog widgets once; they are hidden, not destroyed."""
         dialog = Gtk.Dialog(
             title="Yank Message",
             transient_for=None,
@@ -305,6 +467,8 @@ class KorgaloreApp:
             Gtk.STOCK_OK, Gtk.ResponseType.OK
         )
         dialog.set_default_size(450, -1)
+        # Keep the widgets around when the window is closed
+        dialog.connect("delete-event", lambda *args: True)
 
         content_area = dialog.get_content_area()
         content_area.set_spacing(10)
@@ -322,35 +486,86 @@ class KorgaloreApp:
         entry_msgid.set_placeholder_text("e.g., <msgid@example.com> or https://lore.kernel.org/...")
         content_area.pack_start(entry_msgid, False, False, 0)
 
-        # Target dropdown (only show if multiple targets)
-        combo_target: Optional[Gtk.ComboBoxText] = None
-        if len(target_names) > 1:
-            label_target = Gtk.Label(label="Target:")
-            label_target.set_halign(Gtk.Align.START)
-            content_area.pack_start(label_target, False, False, 5)
+        # Target dropdown (only shown if there are multiple targets)
+        label_target = Gtk.Label(label="Target:")
+        label_target.set_halign(Gtk.Align.START)
+        label_target.set_no_show_all(True)
+        content_area.pack_start(label_target, False, False, 5)
 
-            combo_target = Gtk.ComboBoxText()
-            for name in target_names:
-                combo_target.append_text(name)
-            combo_target.set_active(0)
-            content_area.pack_start(combo_target, False, False, 0)
+        combo_target = Gtk.ComboBoxText()
+        combo_target.set_no_show_all(True)
+        content_area.pack_start(combo_target, False, False, 0)
 
         # Thread checkbox
         check_thread = Gtk.CheckButton(label="Yank entire thread")
         content_area.pack_start(check_thread, False, False, 10)
 
-        dialog.show_all()
-        response = dialog.run()
+        self._yank_dialog = dialog
+        self._yank_entry = entry_msgid
+        self._yank_target_label = label_target
+        self._yank_combo = combo_target
+        self._yank_thread_check = check_thread
+        self._yank_targets = ()
+
+    def _set_yank_targets(self, target_names: Tuple[str, ...]) -> None:
+        """Repopulate the target combo, only if the target list changed."""
+        # Same tuple object unless the config was reloaded
+        if target_names is self._yank_targets or target_names == self._yank_targets:
+            return
+        assert self._yank_combo is not None and self._yank_target_label is not None
+        self._yank_combo.remove_all()
+        for name in target_names:
+            self._yank_combo.append_text(name)
+        self._yank_combo.set_active(0)
+        multiple = len(target_names) > 1
+        self._yank_target_label.set_visible(multiple)
+        self._yank_combo.set_visible(multiple)
+        self._yank_targets = target_names
+
+    def _show_yank_dialog(self) -> bool:
+        """Display the yank dialog (called from GLib.idle_add)."""
+        target_names = self._target_names
+
+        if not target_names:
+            if self._no_targets_dialog is None:
+                dialog = Gtk.MessageDialog(
+                    transient_for=None,
+                    flags=0,
+                    message_type=Gtk.MessageType.ERROR,
+                    buttons=Gtk.ButtonsType.OK,
+                    text="No targets configured"
+                )
+                dialog.format_secondary_text("Please configure at least one target in your configuration file.")
+                dialog.connect("delete-event", lambda *args: True)
+                self._no_targets_dialog = dialog
+            self._no_targets_dialog.present()
+            self._no_targets_dialog.run()
+            self._no_targets_dialog.hide()
+            return False
+
+        if self._yank_dialog is None:
+            self._build_yank_dialog()
+        self._set_yank_targets(target_names)
+        assert self._yank_dialog is not None
+        assert self._yank_entry is not None and self._yank_thread_check is not None
+        assert self._yank_combo is not None
+
+        # Start from a clean form each time
+        self._yank_entry.set_text("")
+        self._yank_thread_check.set_active(False)
+
+        self._yank_dialog.show_all()
+        self._yank_entry.grab_focus()
+        response = self._yank_dialog.run()
+        self._yank_dialog.hide()
 
         if response == Gtk.ResponseType.OK:
-            msgid_or_url = entry_msgid.get_text().strip()
-            if combo_target is not None:
-                target_name = combo_target.get_active_text()
+            msgid_or_url = self._yank_entry.get_text().strip()
+            if len(target_names) > 1:
+                target_name = self._yank_combo.get_active_text()
             else:
                 target_name = target_names[0]
-            fetch_thread = check_thread.get_active()
-
-            dialog.destroy()
+            fetch_thread = self._yank_thread_check.get_active()
 
             if msgid_or_url and target_name:
                 # Run yank in background thread
@@ -359,8 +574,6 @@ class KorgaloreApp:
                     args=(target_name, msgid_or_url, fetch_thread),
                     daemon=True
                 ).start()
-        else:
-            dialog.destroy()
 
         return False
 
@@ -387,20 +600,36 @@ class KorgaloreApp:
             logger.error("Yank failed: %s", str(e))
             self.update_status(f"Yank failed: {e}", "dialog-error-symbolic")
 
+    def _spawn_editor(self, path: Path, on_exit: Callable[[Path], None]) -> None:
+        """Open a file with xdg-open and call on_exit(path) once it exits.
+
+        The child is watched from the main loop, so no thread has to sit
+        blocked for the lifetime of the editor.
+        """
+        logger.info("Opening file: %s", path)
+        try:
+            pid, _, _, _ = GLib.spawn_async(
+                ['xdg-open', str(path)],
+                flags=GLib.SpawnFlags.DO_NOT_REAP_CHILD | GLib.SpawnFlags.SEARCH_PATH
+            )
+        except GLib.Error as e:
+            logger.error("Failed to open %s: %s", path, str(e))
+            return
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_editor_exit, on_exit, path)
+
+    def _on_editor_exit(self, pid: int, status: int,
+                        on_exit: Callable[[Path], None], path: Path) -> None:
+        """Reap the editor process and run its completion handler."""
+        GLib.spawn_close_pid(pid)
+        on_exit(path)
+
     def on_edit_config(self, source: Any) -> None:
         """Open the configuration file in the user's preferred editor."""
-        # Run in background thread to not block UI while waiting for editor
-        threading.Thread(target=self._run_edit_config, daemon=True).start()
+        self._spawn_editor(get_xdg_config_dir() / 'korgalore.toml', self._on_config_edited)
 
-    def _run_edit_config(self) -> None:
-        """Execute config editing and validate after editor closes."""
-        cfgpath = get_xdg_config_dir() / 'korgalore.toml'
-        logger.info("Opening configuration file: %s", cfgpath)
+    def _on_config_edited(self, cfgpath: Path) -> None:
+        """Validate and reload the configuration after the editor closes."""
         try:
-            proc = subprocess.Popen(['xdg-open', str(cfgpath)])
-            proc.wait()
-
-            # Validate after editor closes
             is_valid, error_msg = validate_config_file(cfgpath)
             if is_valid:
                 logger.info("Configuration file is valid, reloading...")
@@ -409,9 +638,8 @@ class KorgaloreApp:
                 self.ctx.obj['targets'] = dict()
                 self.ctx.obj['feeds'] = dict()
                 self.ctx.obj['deliveries'] = dict()
-                # Update sync interval if changed
-                gui_config = self.ctx.obj['config'].get('gui', {})
-                self.sync_interval = gui_config.get('sync_interval', 300)
+                # Update sync interval and target names if changed
+                self._refresh_config_snapshot()
                 # Update mtime to avoid redundant reload on next sync
                 self._config_mtime = self._get_config_mtime()
                 logger.info("Configuration reloaded successfully.")
@@ -419,26 +647,20 @@ class KorgaloreApp:
                 logger.error("Configuration file has errors: %s", error_msg)
                 self.update_status(f"Config error: {error_msg}", "dialog-warning-symbolic")
         except Exception as e:
-            logger.error("Failed to open config file: %s", str(e))
+            logger.error("Failed to reload config file: %s", str(e))
 
     def on_edit_bozofilter(self, source: Any) -> None:
         """Open the bozofilter file in the user's preferred editor."""
-        threading.Thread(target=self._run_edit_bozofilter, daemon=True).start()
-
-    def _run_edit_bozofilter(self) -> None:
-        """Execute bozofilter editing and reload after editor closes."""
-        config_dir = get_xdg_config_dir()
-        bozofilter_path = ensure_bozofilter_exists(config_dir)
+        bozofilter_path = ensure_bozofilter_exists(get_xdg_config_dir())
+        self._spawn_editor(bozofilter_path, self._on_bozofilter_edited)
 
-        logger.info("Opening bozofilter file: %s", bozofilter_path)
+    def _on_bozofilter_edited(self, bozofilter_path: Path) -> None:
+        """Reload the bozofilter after the editor closes."""
         try:
-            proc = subprocess.Popen(['xdg-open', str(bozofilter_path)])
-            proc.wait()
-            # Reload bozofilter after editor closes
-            self.ctx.obj['bozofilter'] = load_bozofilter(config_dir)
+            self.ctx.obj['bozofilter'] = load_bozofilter(bozofilter_path.parent)
             logger.info("Bozofilter reloaded successfully.")
         except Exception as e:
-            logger.error("Failed to edit bozofilter: %s", str(e))
+            logger.error("Failed to reload bozofilter: %s", str(e))
 
     def on_about(self, source: Any) -> None:
         """Show the About dialog."""
@@ -462,14 +684,17 @@ class KorgaloreApp:
         """Periodically run sync."""
         logger.info("Background worker started")
         # Initial sync after a short delay
-        time.sleep(2)
-        if not self.stop_event.is_set():
-            self.run_sync()
+        self.next_sync_time = time.time() + 2
 
         while not self.stop_event.is_set():
-            # Sleep in 1-second chunks, checking if it's time to sync
-            # This handles both the regular interval and manual sync resets
-            time.sleep(1)
+            # Sleep until the next sync is due. Anything that moves
+            # next_sync_time, finishes a sync or quits sets _sync_wake so
+            # the deadline is recomputed.
+            timeout: Optional[float] = None
+            if not self.is_syncing:
+                timeout = max(0.0, self.next_sync_time - time.time())
+            self._sync_wake.wait(timeout=timeout)
+            self._sync_wake.clear()
             if self.stop_event.is_set():
                 return
             if time.time() >= self.next_sync_time and not self.is_syncing:
@@ -493,10 +718,11 @@ class KorgaloreApp:
         self._check_reload_config()
 
         self.is_syncing = True
-        GLib.idle_add(lambda: self.item_sync.set_sensitive(False))
+        GLib.idle_add(self._sync_disable)
         self.update_status("Syncing...", "system-run-symbolic")
         # Ensure next sync shows as processing
         self.next_sync_time = 0
+        GLib.idle_add(self._reschedule_timers, priority=GLib.PRIORITY_LOW)
 
         try:
             logger.info("Starting sync...")
@@ -511,7 +737,8 @@ class KorgaloreApp:
                 no_update=False,
                 force=False,
                 delivery_name=None,
-                status_callback=lambda s: self.update_status(s, "system-run-symbolic")
+                status_callback=self._pull_status,
+                cancel_token=self.stop_event
             )
 
             self.last_sync_time = time.time()
@@ -540,7 +767,9 @@ class KorgaloreApp:
             self.is_syncing = False
             # Reset countdown timer after sync completes
             self.next_sync_time = time.time() + self.sync_interval
-            GLib.idle_add(lambda: self.item_sync.set_sensitive(True))
+            self._sync_wake.set()
+            GLib.idle_add(self._reschedule_timers, priority=GLib.PRIORITY_LOW)
+            GLib.idle_add(self._sync_enable)
 
     def _show_auth_button(self) -> bool:
         """Show the authenticate button (called from GLib.idle_add)."""
@@ -552,6 +781,26 @@ class KorgaloreApp:
         self.item_auth.hide()
         return False
 
+    def _sync_enable(self) -> bool:
+        """Enable the Sync Now item (called from GLib.idle_add)."""
+        self.item_sync.set_sensitive(True)
+        return False
+
+    def _sync_disable(self) -> bool:
+        """Disable the Sync Now item (called from GLib.idle_add)."""
+        self.item_sync.set_sensitive(False)
+        return False
+
+    def _auth_enable(self) -> bool:
+        """Enable the Authenticate item (called from GLib.idle_add)."""
+        self.item_auth.set_sensitive(True)
+        return False
+
+    def _auth_disable(self) -> bool:
+        """Disable the Authenticate item (called from GLib.idle_add)."""
+        self.item_auth.set_sensitive(False)
+        return False
+
     def on_authenticate(self, source: Any) -> None:
         """Handle authenticate menu item click."""
         if not self.auth_needed_target:
@@ -566,7 +815,7 @@ class KorgaloreApp:
             return
 
         self.update_status(f"Authenticating {target_id}...", "system-run-symbolic")
-        GLib.idle_add(lambda: self.item_auth.set_sensitive(False))
+        GLib.idle_add(self._auth_disable)
 
         try:
             # Find the target in our context
@@ -579,11 +828,8 @@ class KorgaloreApp:
                 return
 
             # Check if target supports re-authentication
-            if isinstance(target, GmailTarget):
-                # Run the Gmail re-authentication flow (this opens a browser)
-                target.reauthenticate()
-            elif isinstance(target, ImapTarget) and target.auth_type == 'oauth2':
-                # Run the IMAP OAuth2 re-authentication flow (this opens a browser)
+            if getattr(target, 'supports_reauth', False):
+                # Run the target's re-authentication flow (this opens a browser)
                 target.reauthenticate()
             else:
                 logger.error("Target %s does not support re-authentication", target_id)
@@ -597,20 +843,19 @@ class KorgaloreApp:
             logger.info("Re-authentication successful for %s", target_id)
 
             # Automatically start sync after successful authentication
-            GLib.idle_add(lambda: self.item_auth.set_sensitive(True))
-            self.run_sync()
+            self._request_sync()
             return
 
         except Exception as e:
             logger.error("Re-authentication failed: %s", str(e))
             self.update_status(f"Auth failed: {target_id}", "dialog-error-symbolic")
         finally:
-            GLib.idle_add(lambda: self.item_auth.set_sensitive(True))
+            GLib.idle_add(self._auth_enable)
 
 
 def start_gui(ctx: click.Context) -> None:
     """Entry point for the GUI."""
-    if not HAS_GTK:
+    if not _ensure_gtk_imported():
         if 'pipx/venvs' in sys.prefix:
             raise RuntimeError(
                 'GUI dependencies not available.\n'
@@ -1,9 +1,17 @@
 """Service for delivering messages to IMAP mail servers."""
 
+import atexit
+import hashlib
 import logging
 import imaplib
+import re
+import socket
+import sqlite3
+import ssl
+import threading
+import time
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, cast, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, TYPE_CHECKING
 
 from korgalore import ConfigurationError, RemoteError
 from korgalore.message import RawMessage
@@ -13,6 +21,258 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger('korgalore')
 
+# Number of Message-IDs looked up with a single UID SEARCH
+PRELOAD_BATCH_SIZE = 100
+
+_FETCHED_MSGID_RE = re.compile(rb'^Message-ID:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+_APPENDUID_RE = re.compile(rb'\[APPENDUID (\d+) ')
+_STATUS_UIDVALIDITY_RE = re.compile(rb'UIDVALIDITY (\d+)')
+# Line endings as imaplib's IMAP4.append() maps them to CRLF
+_MAP_CRLF_RE = re.compile(rb'\r\n|\r|\n')
+
+# Number of Message-ID hashes looked up in the delivery cache per query,
+# well below SQLite's limit on bound parameters
+DELIVERED_CACHE_BATCH_SIZE = 500
+
+# Number of APPEND commands sent before their responses are read, when
+# the server accepts non-synchronizing literals (LITERAL+)
+APPEND_PIPELINE_DEPTH = 32
+
+# Pooled connections idle for longer than this are logged out instead of
+# reused; RFC 3501 servers may drop idle clients after 30 minutes
+IMAP_POOL_MAX_IDLE = 25 * 60
+
+# Authenticated connections kept between sync runs, keyed by
+# (server, username, auth_type), with the time they were returned
+_IMAP_POOL: Dict[Tuple[str, str, str], Tuple[imaplib.IMAP4_SSL, float]] = {}
+_IMAP_POOL_LOCK = threading.Lock()
+
+# TLS sessions from earlier connections, keyed by (host, port), so that
+# reconnecting to a server can resume instead of doing a full handshake
+_TLS_SESSIONS: Dict[Tuple[str, int], ssl.SSLSession] = {}
+_TLS_CONTEXT: Optional[ssl.SSLContext] = None
+
+
+def _tls_context() -> ssl.SSLContext:
+    """Return the SSL context shared by all IMAP connections.
+
+    Sessions can only be resumed from the context that created them.
+    """
+    global _TLS_CONTEXT
+    if _TLS_CONTEXT is None:
+        _TLS_CONTEXT = ssl.create_default_context()
+    return _TLS_CONTEXT
+
+
+class ResumingIMAP4SSL(imaplib.IMAP4_SSL):
+    """IMAP4_SSL connection that resumes earlier TLS sessions to its server."""
+
+    def __init__(self, host: str = '', port: int = 993, *,
+                 ssl_context: Optional[ssl.SSLContext] = None,
+                 timeout: Optional[float] = None) -> None:
+        super().__init__(host, port, ssl_context=ssl_context or _tls_context(),
+                         timeout=timeout)
+
+    def _create_socket(self, timeout: Optional[float]) -> socket.socket:
+        sock = imaplib.IMAP4._create_socket(self, timeout)  # type: ignore[attr-defined]
+        session = None
+        if self.ssl_context is _TLS_CONTEXT:
+            session = _TLS_SESSIONS.get((self.host, self.port))
+        return cast(socket.socket,
+                    self.ssl_context.wrap_socket(sock, server_hostname=self.host,
+                                                 session=session))
+
+    def save_tls_session(self) -> None:
+        """Remember this connection's TLS session for the next connect.
+
+        Called once the connection has exchanged some data, since TLS 1.3
+        servers only send session tickets after the handshake.
+        """
+        sock = self.sock
+        if not isinstance(sock, ssl.SSLSocket) or self.ssl_context is not _TLS_CONTEXT:
+            return
+        if sock.session_reused:
+            logger.debug('Resumed TLS session with %s', self.host)
+        if sock.session is not None:
+            _TLS_SESSIONS[(self.host, self.port)] = sock.session
+
+
+def _logout_quietly(imap: imaplib.IMAP4_SSL) -> None:
+    """Log out of an IMAP connection, ignoring errors."""
+    try:
+        imap.logout()
+    except (OSError, imaplib.IMAP4.error) as e:
+        logger.debug('Error closing IMAP connection: %s', e)
+
+
+def _take_pooled(key: Tuple[str, str, str]) -> Optional[imaplib.IMAP4_SSL]:
+    """Take a live pooled connection for key out of the pool, if any."""
+    with _IMAP_POOL_LOCK:
+        entry = _IMAP_POOL.pop(key, None)
+    if entry is None:
+        return None
+    imap, returned = entry
+    if time.monotonic() - returned > IMAP_POOL_MAX_IDLE:
+        _logout_quietly(imap)
+        return None
+    # Make sure the server has not dropped us in the meantime
+    try:
+        status, _ = imap.noop()
+    except (OSError, imaplib.IMAP4.error) as e:
+        logger.debug('Pooled IMAP connection is gone: %s', e)
+        return None
+    if status != 'OK':
+        _logout_quietly(imap)
+        return None
+    return imap
+
+
+def _return_pooled(key: Tuple[str, str, str], imap: imaplib.IMAP4_SSL) -> None:
+    """Put a connection back into the pool, replacing any older one."""
+    with _IMAP_POOL_LOCK:
+        previous = _IMAP_POOL.pop(key, None)
+        _IMAP_POOL[key] = (imap, time.monotonic())
+    if previous is not None:
+        _logout_quietly(previous[0])
+
+
+def close_all() -> None:
+    """Log out of every pooled IMAP connection."""
+    with _IMAP_POOL_LOCK:
+        entries = list(_IMAP_POOL.values())
+        _IMAP_POOL.clear()
+    for imap, _ in entries:
+        _logout_quietly(imap)
+
+
+atexit.register(close_all)
+
+
+def _msgid_hash(msgid: str) -> bytes:
+    """Return the short hash a Message-ID is stored under in DeliveredCache."""
+    return hashlib.blake2b(msgid.encode(errors='replace'), digest_size=8).digest()
+
+
+class DeliveredCache:
+    """On-disk record of Message-IDs known to be in an account's IMAP folders.
+
+    Lets duplicate checks for messages korgalore has delivered before be
+    answered locally instead of with a SEARCH on the server. Only positive
+    answers come from here: a Message-ID that isn't recorded is still
+    looked up on the server. A folder's entries are dropped when the
+    server reports a new UIDVALIDITY for it, since that means the folder
+    was recreated. Database errors disable the cache for the rest of the
+    run instead of failing delivery.
+    """
+
+    def __init__(self, path: str, account: str) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file, shared by all IMAP targets
+            account: Key separating this account's entries from others'
+        """
+        self.path = path
+        self.account = account
+        self._db: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._dirty = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use, creating the tables if needed."""
+        if self._db is None and not self._disabled:
+            try:
+                # Targets may be used from a different thread on each run
+                db = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+                db.execute('PRAGMA journal_mode=WAL')
+                db.execute('PRAGMA synchronous=NORMAL')
+                db.execute('CREATE TABLE IF NOT EXISTS delivered ('
+                           'account TEXT NOT NULL, folder TEXT NOT NULL, msgid_hash BLOB NOT NULL, '
+                           'PRIMARY KEY (account, folder, msgid_hash)) WITHOUT ROWID')
+                db.execute('CREATE TABLE IF NOT EXISTS folders ('
+                           'account TEXT NOT NULL, folder TEXT NOT NULL, uidvalidity TEXT NOT NULL, '
+                           'PRIMARY KEY (account, folder)) WITHOUT ROWID')
+                db.commit()
+                self._db = db
+            except sqlite3.Error as e:
+                self._disable(e)
+        return self._db
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the cache after a database error."""
+        logger.warning('Not using IMAP delivery cache %s: %s', self.path, error)
+        self._disabled = True
+        if self._db is not None:
+            try:
+                self._db.close()
+            except sqlite3.Error:
+                pass
+            self._db = None
+
+    def contains(self, folder: str, msgids: List[str]) -> Set[str]:
+        """Return the subset of msgids recorded as present in folder."""
+        db = self._connect()
+        found: Set[str] = set()
+        if db is None or not msgids:
+            return found
+        by_hash = {_msgid_hash(msgid): msgid for msgid in msgids}
+        hashes = list(by_hash)
+        try:
+            for start in range(0, len(hashes), DELIVERED_CACHE_BATCH_SIZE):
+                batch = hashes[start:start + DELIVERED_CACHE_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+                rows = db.execute(
+                    'SELECT msgid_hash FROM delivered WHERE account = ? AND folder = ? '
+                    f'AND msgid_hash IN ({placeholders})',
+                    (self.account, folder, *batch))
+                found.update(by_hash[row[0]] for row in rows)
+        except sqlite3.Error as e:
+            self._disable(e)
+            return set()
+        return found
+
+    def add(self, folder: str, msgids: List[str]) -> None:
+        """Record msgids as present in folder."""
+        db = self._connect()
+        if db is None or not msgids:
+            return
+        try:
+            db.executemany('INSERT OR IGNORE INTO delivered VALUES (?, ?, ?)',
+                           [(self.account, folder, _msgid_hash(msgid)) for msgid in msgids])
+            self._dirty = True
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def set_uidvalidity(self, folder: str, uidvalidity: str) -> None:
+        """Record a folder's UIDVALIDITY, forgetting its entries if it changed."""
+        db = self._connect()
+        if db is None:
+            return
+        try:
+            row = db.execute('SELECT uidvalidity FROM folders WHERE account = ? AND folder = ?',
+                             (self.account, folder)).fetchone()
+            if row is not None and row[0] == uidvalidity:
+                return
+            if row is not None:
+                logger.debug('UIDVALIDITY of folder %s changed, clearing delivery cache', folder)
+                db.execute('DELETE FROM delivered WHERE account = ? AND folder = ?',
+                           (self.account, folder))
+            db.execute('INSERT OR REPLACE INTO folders VALUES (?, ?, ?)',
+                       (self.account, folder, uidvalidity))
+            self._dirty = True
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def commit(self) -> None:
+        """Write out recorded entries."""
+        if self._db is None or not self._dirty:
+            return
+        try:
+            self._db.commit()
+            self._dirty = False
+        except sqlite3.Error as e:
+            self._disable(e)
+
 
 class ImapTarget:
     """Target for delivering messages to IMAP mail servers."""
@@ -28,7 +288,8 @@ class ImapTarget:
                  client_id: Optional[str] = None,
                  tenant: str = 'common',
                  token: Optional[str] = None,
-                 interactive: bool = True) -> None:
+                 interactive: bool = True,
+                 dedup_db: Optional[str] = None) -> None:
         """Initialize IMAP service.
 
         Args:
@@ -45,6 +306,8 @@ class ImapTarget:
             token: Path to OAuth2 token file (optional, auto-generated if not specified)
             interactive: If True, run OAuth flow interactively when needed.
                         If False, raise AuthenticationError instead (for GUI mode).
+            dedup_db: Optional path to a DeliveredCache database, used to skip
+                      server-side duplicate checks for messages seen before.
 
         Raises:
             ConfigurationError: If configuration is invalid
@@ -119,6 +382,19 @@ class ImapTarget:
 
         # Connection timeout
         self.timeout = timeout
+        self._pool_key = (server, username, auth_type)
+
+        # Results of Message-ID lookups for the current connection, per
+        # folder: msgid -> whether the message is already in the folder
+        self._known_msgids: Dict[str, Dict[str, bool]] = {}
+        # (folder, readonly) currently selected on the connection, so it is
+        # not selected again before every search
+        self._selected_folder: Optional[Tuple[str, bool]] = None
+        # UIDVALIDITY last reported by SELECT, STATUS or APPENDUID, per folder
+        self._uidvalidity: Dict[str, bytes] = {}
+        self._delivered: Optional[DeliveredCache] = None
+        if dedup_db:
+            self._delivered = DeliveredCache(dedup_db, f'{username}@{server}')
 
     @property
     def needs_auth(self) -> bool:
@@ -127,6 +403,11 @@ class ImapTarget:
             return self._oauth2_authenticator.needs_auth
         return False
 
+    @property
+    def supports_reauth(self) -> bool:
+        """Whether reauthenticate() can be used (OAuth2 targets only)."""
+        return self._oauth2_authenticator is not None
+
     def reauthenticate(self) -> None:
         """Perform OAuth2 re-authentication flow.
 
@@ -144,13 +425,57 @@ class ImapTarget:
 
         self._oauth2_authenticator.reauthenticate()
         # Reset connection to force reconnect with new credentials
+        if self.imap is not None:
+            _logout_quietly(self.imap)
         self.imap = None
+        pooled = _take_pooled(self._pool_key)
+        if pooled is not None:
+            _logout_quietly(pooled)
+        self._forget_connection_state()
+
+    def _forget_connection_state(self) -> None:
+        """Drop everything remembered about the current connection."""
+        self._known_msgids = {}
+        self._selected_folder = None
+        self._uidvalidity = {}
+
+    def _ensure_selected(self, folder: str, readonly: bool = True) -> bool:
+        """Select a folder, unless it is already the selected one.
+
+        Args:
+            folder: Folder to select
+            readonly: Select with EXAMINE semantics
+
+        Returns:
+            True if the folder is selected.
+
+        Raises:
+            imaplib.IMAP4.error: If the SELECT command fails.
+        """
+        imap = self.imap
+        if imap is None:
+            return False
+        if self._selected_folder == (folder, readonly):
+            return True
+        self._selected_folder = None
+        status, _ = imap.select(folder, readonly=readonly)
+        if status != 'OK':
+            return False
+        self._selected_folder = (folder, readonly)
+        if self._delivered is not None:
+            # The SELECT response carries the folder's UIDVALIDITY, so the
+            # delivery cache never needs a STATUS for the selected folder
+            _, data = imap.response('UIDVALIDITY')
+            if data and isinstance(data[0], bytes):
+                self._note_uidvalidity(folder, data[0])
+        return True
 
     def connect(self) -> None:
         """Establish connection to the IMAP server and verify folder exists.
 
-        Creates an SSL connection, authenticates with the server, and verifies
-        the target folder exists.
+        Reuses a pooled connection to the same account when one is still
+        alive, otherwise creates an SSL connection and authenticates with
+        the server. Either way, verifies the target folder exists.
 
         Raises:
             RemoteError: If authentication fails.
@@ -158,28 +483,36 @@ class ImapTarget:
             AuthenticationError: If OAuth2 authentication is required.
         """
         if self.imap is None:
-            # Connect with SSL on port 993
-            self.imap = imaplib.IMAP4_SSL(self.server, timeout=self.timeout)
-
-            # Authenticate based on auth_type
-            try:
-                if self.auth_type == 'oauth2':
-                    self._authenticate_oauth2()
-                else:
-                    if self.password is None:
-                        raise RemoteError(
-                            f"No password available for IMAP target: {self.identifier}"
-                        )
-                    self.imap.login(self.username, self.password)
-            except imaplib.IMAP4.error as e:
-                raise RemoteError(
-                    f"IMAP authentication failed for {self.server}: {e}"
-                ) from e
+            # Reuse a connection left over from an earlier run if possible
+            pooled = _take_pooled(self._pool_key)
+            self._forget_connection_state()
+            if pooled is not None:
+                self.imap = pooled
+                logger.debug('Reusing pooled IMAP connection for %s', self.identifier)
+            else:
+                # Connect with SSL on port 993
+                imap = ResumingIMAP4SSL(self.server, timeout=self.timeout)
+                self.imap = imap
+
+                # Authenticate based on auth_type
+                try:
+                    if self.auth_type == 'oauth2':
+                        self._authenticate_oauth2()
+                    else:
+                        if self.password is None:
+                            raise RemoteError(
+                                f"No password available for IMAP target: {self.identifier}"
+                            )
+                        self.imap.login(self.username, self.password)
+                except imaplib.IMAP4.error as e:
+                    raise RemoteError(
+                        f"IMAP authentication failed for {self.server}: {e}"
+                    ) from e
+                imap.save_tls_session()
 
             # Verify folder exists (don't auto-create)
             try:
-                status, _ = self.imap.select(self.folder, readonly=True)
-                if status != 'OK':
+                if not self._ensure_selected(self.folder):
                     raise ConfigurationError(
                         f"Folder '{self.folder}' does not exist on IMAP server {self.server}"
                     )
@@ -235,8 +568,7 @@ class ImapTarget:
 
         try:
             # Select the folder (read-only for search)
-            status, _ = imap.select(folder, readonly=True)
-            if status != 'OK':
+            if not self._ensure_selected(folder):
                 logger.debug('Failed to select folder %s for search', folder)
                 return False
 
@@ -260,6 +592,97 @@ class ImapTarget:
             logger.debug('Failed to check for existing message: %s', e)
             return False
 
+    def _effective_folder(self, subfolder: Optional[str]) -> str:
+        """Return the folder messages for the given subfolder go to."""
+        if subfolder:
+            return self.folder + '/' + subfolder
+        return self.folder
+
+    def preload_existing_message_ids(self, msgids: List[str],
+                                     folder: Optional[str] = None) -> Set[str]:
+        """Look up which of the given Message-IDs already exist in a folder.
+
+        Instead of one SEARCH per message, the Message-IDs are looked up
+        PRELOAD_BATCH_SIZE at a time with a single UID SEARCH of OR-ed
+        HEADER criteria, and the headers of the matches are fetched in one
+        round-trip to see exactly which Message-IDs are present. The
+        results are remembered for the current connection, so later calls
+        to import_message() don't search for these messages again.
+
+        Args:
+            msgids: Message-ID header values (with angle brackets)
+            folder: Folder to look in (default: the target's folder)
+
+        Returns:
+            The subset of msgids already present in the folder. Message-IDs
+            that could not be looked up are not remembered, and are checked
+            individually on import.
+        """
+        imap = self.imap
+        if folder is None:
+            folder = self.folder
+        existing: Set[str] = set()
+        if imap is None or not msgids:
+            return existing
+
+        known = self._known_msgids.setdefault(folder, {})
+        wanted = list(dict.fromkeys(m for m in msgids if m not in known))
+        if wanted:
+            cached = self._cached_present(folder, wanted)
+            if cached:
+                for msgid in cached:
+                    known[msgid] = True
+                wanted = [m for m in wanted if m not in cached]
+        existing.update(m for m in msgids if known.get(m))
+        if not wanted:
+            return existing
+
+        try:
+            if not self._ensure_selected(folder):
+                logger.debug('Failed to select folder %s for search', folder)
+                return existing
+        except imaplib.IMAP4.error as e:
+            logger.debug('Failed to select folder %s for search: %s', folder, e)
+            return existing
+
+        for start in range(0, len(wanted), PRELOAD_BATCH_SIZE):
+            batch = wanted[start:start + PRELOAD_BATCH_SIZE]
+            # OR takes two search keys, so n keys need n-1 prefixed ORs
+            criteria: List[str] = ['OR'] * (len(batch) - 1)
+            for msgid in batch:
+                criteria.extend(('HEADER', 'Message-ID', msgid))
+            try:
+                status, data = imap.uid('SEARCH', *criteria)
+                if status != 'OK':
+                    logger.debug('IMAP UID SEARCH failed: %s', data)
+                    continue
+                uids = data[0].split() if data and data[0] else []
+                found: Set[str] = set()
+                if uids:
+                    status, data = imap.uid('FETCH', b','.join(uids).decode(),
+                                            '(BODY.PEEK[HEADER.FIELDS (MESSAGE-ID)])')
+                    if status != 'OK':
+                        logger.debug('IMAP UID FETCH failed: %s', data)
+                        continue
+                    for item in data:
+                        if isinstance(item, tuple) and len(item) > 1:
+                            match = _FETCHED_MSGID_RE.search(item[1])
+                            if match:
+                                found.add(match.group(1).decode(errors='replace'))
+            except imaplib.IMAP4.error as e:
+                logger.debug('Failed to look up existing messages: %s', e)
+                continue
+            for msgid in batch:
+                known[msgid] = msgid in found
+            present = found.intersection(batch)
+            existing.update(present)
+            if self._delivered is not None:
+                self._delivered.add(folder, list(present))
+
+        logger.debug('%d of %d Message-IDs already in folder %s',
+                     len(existing), len(msgids), folder)
+        return existing
+
     def import_message(
         self,
         raw_message: bytes,
@@ -283,6 +706,16 @@ class ImapTarget:
         Raises:
             RemoteError: On delivery errors
         """
+        try:
+            return self._import_raw_message(RawMessage(raw_message), feed_name,
+                                            delivery_name, self._effective_folder(subfolder))
+        finally:
+            if self._delivered is not None:
+                self._delivered.commit()
+
+    def _import_raw_message(self, msg: RawMessage, feed_name: Optional[str],
+                            delivery_name: Optional[str], effective_folder: str) -> Any:
+        """Append a message to a folder unless it is already there."""
         imap = self.imap
         if imap is None:
             self.connect()
@@ -290,18 +723,13 @@ class ImapTarget:
             if imap is None:
                 raise RemoteError("IMAP connection not established.")
 
-        # Compute effective folder: base folder + subfolder if specified
-        effective_folder = self.folder
-        if subfolder:
-            effective_folder = self.folder + '/' + subfolder
-
-        msg = RawMessage(raw_message)
-
         # Check if message already exists in target folder
-        if msg.message_id and self._check_message_exists(msg.message_id, effective_folder):
-            logger.debug('Skipping import: message %s already in folder %s',
-                        msg.message_id, effective_folder)
-            return {'skipped': True}
+        msgid = msg.message_id
+        try:
+            if msgid and self._already_present(msgid, effective_folder):
+                return {'skipped': True}
+        except OSError as e:
+            raise RemoteError(f"IMAP delivery failed: {e}") from e
 
         try:
             # Append message to folder
@@ -326,6 +754,7 @@ class ImapTarget:
 
                 logger.debug('Delivered message to IMAP folder %s: %s',
                            effective_folder, data)
+                self._note_appended(effective_folder, msgid, data)
 
             except imaplib.IMAP4.error as e:
                 raise RemoteError(
@@ -341,19 +770,247 @@ class ImapTarget:
                 f"IMAP delivery failed: {e}"
             ) from e
 
+    def _cached_present(self, folder: str, msgids: List[str]) -> Set[str]:
+        """Return the msgids the delivery cache has recorded in a folder.
+
+        The folder's UIDVALIDITY must be known for the connection first,
+        so entries for a recreated folder are dropped before they are
+        trusted. Selecting a folder records it; for other folders the
+        first lookup asks the server with STATUS, which RFC 3501 says
+        not to use on the selected folder.
+        """
+        imap = self.imap
+        if self._delivered is None or imap is None or not msgids:
+            return set()
+        if folder not in self._uidvalidity:
+            if self._selected_folder is not None and self._selected_folder[0] == folder:
+                logger.debug('No UIDVALIDITY in SELECT response for folder %s', folder)
+                return set()
+            try:
+                status, data = imap.status(folder, '(UIDVALIDITY)')
+            except imaplib.IMAP4.error as e:
+                logger.debug('Failed to get UIDVALIDITY of folder %s: %s', folder, e)
+                return set()
+            match = None
+            if status == 'OK' and data and isinstance(data[0], bytes):
+                match = _STATUS_UIDVALIDITY_RE.search(data[0])
+            if match is None:
+                logger.debug('No UIDVALIDITY for folder %s: %s', folder, data)
+                return set()
+            self._note_uidvalidity(folder, match.group(1))
+        return self._delivered.contains(folder, msgids)
+
+    def _already_present(self, msgid: str, folder: str) -> bool:
+        """Check for a message in a folder, using preloaded lookups if any."""
+        known = self._known_msgids.setdefault(folder, {})
+        exists = known.get(msgid)
+        if exists is None and self._cached_present(folder, [msgid]):
+            exists = known[msgid] = True
+        if exists is None:
+            exists = self._check_message_exists(msgid, folder)
+            if exists and self._delivered is not None:
+                self._delivered.add(folder, [msgid])
+        if exists:
+            logger.debug('Skipping import: message %s already in folder %s',
+                         msgid, folder)
+        return exists
+
+    def _can_pipeline_appends(self) -> bool:
+        """Whether APPENDs can be sent without waiting for each response.
+
+        That needs non-synchronizing literals (RFC 7888 LITERAL+), since a
+        plain literal makes the client wait for the server's continuation.
+        """
+        imap = self.imap
+        return imap is not None and 'LITERAL+' in imap.capabilities and not imap.utf8_enabled
+
+    def _append_pipelined(self, folder: str,
+                          payloads: List[bytes]) -> List[Union[List[Any], RemoteError]]:
+        """APPEND several messages, reading the responses after sending them.
+
+        Up to APPEND_PIPELINE_DEPTH commands are written back to back with
+        LITERAL+ literals, then their tagged responses are collected by tag,
+        so the whole window costs about one round-trip instead of one each.
+
+        Args:
+            folder: Folder to append to
+            payloads: Messages ready for delivery (CRLF line endings)
+
+        Returns:
+            One entry per payload: the APPEND response data, or the
+            RemoteError describing why the message was not delivered.
+        """
+        imap = self.imap
+        if imap is None:
+            raise RemoteError("IMAP connection not established.")
+        # imaplib has no public interface for pipelining, so this uses the
+        # same tag bookkeeping as IMAP4._command() and _command_complete()
+        command = b' APPEND ' + folder.encode(imap._encoding) + b' {'
+        results: List[Union[List[Any], RemoteError]] = list()
+        for start in range(0, len(payloads), APPEND_PIPELINE_DEPTH):
+            window = payloads[start:start + APPEND_PIPELINE_DEPTH]
+            tags: List[bytes] = list()
+            try:
+                for payload in window:
+                    # What imap.append() sends: bare CR becomes CRLF too
+                    payload = _MAP_CRLF_RE.sub(b'\r\n', payload)
+                    tag = imap._new_tag()
+                    tags.append(tag)
+                    imap.send(tag + command + str(len(payload)).encode() + b'+}\r\n'
+                              + payload + b'\r\n')
+            except OSError as e:
+                # The connection is gone; nothing else will get through
+                for tag in tags:
+                    imap.tagged_commands.pop(tag, None)
+                error = RemoteError(f"IMAP delivery failed: {e}")
+                results.extend([error] * (len(payloads) - start))
+                return results
+
+            for n, tag in enumerate(tags):
+                try:
+                    typ, data = imap._command_complete('APPEND', tag)
+                except (OSError, imaplib.IMAP4.abort) as e:
+                    # The connection broke mid-window; keep what was
+                    # acknowledged and fail everything still unconfirmed
+                    for unread in tags[n:]:
+                        imap.tagged_commands.pop(unread, None)
+                    error = RemoteError(f"IMAP delivery failed: {e}")
+                    results.extend([error] * (len(payloads) - len(results)))
+                    return results
+                except imaplib.IMAP4.error as e:
+                    results.append(RemoteError(
+                        f"Failed to append message to folder '{folder}': {e}"))
+                    continue
+                if typ != 'OK':
+                    results.append(RemoteError(
+                        f"IMAP APPEND failed with status: {typ}, response: {data}"))
+                    continue
+                logger.debug('Delivered message to IMAP folder %s: %s', folder, data)
+                results.append(data)
+        return results
+
+    def _note_uidvalidity(self, folder: str, uidvalidity: bytes) -> bool:
+        """Record a folder's UIDVALIDITY as reported by the server.
+
+        Returns:
+            True if it differs from the one seen earlier on this
+            connection, in which case the Message-ID lookups for the
+            folder have been forgotten.
+        """
+        previous = self._uidvalidity.get(folder)
+        self._uidvalidity[folder] = uidvalidity
+        if self._delivered is not None:
+            self._delivered.set_uidvalidity(folder, uidvalidity.decode())
+        if previous is not None and previous != uidvalidity:
+            logger.debug('UIDVALIDITY of folder %s changed, forgetting lookups', folder)
+            self._known_msgids.pop(folder, None)
+            return True
+        return False
+
+    def _note_appended(self, folder: str, msgid: Optional[str], data: List[Any]) -> None:
+        """Remember a delivered message, and notice UIDVALIDITY changes.
+
+        If the server reports a different UIDVALIDITY for the folder than
+        before, the folder was recreated: the selection and the Message-ID
+        lookups for it no longer apply.
+        """
+        match = _APPENDUID_RE.search(data[0]) if data and isinstance(data[0], bytes) else None
+        if match and self._note_uidvalidity(folder, match.group(1)):
+            if self._selected_folder is not None and self._selected_folder[0] == folder:
+                self._selected_folder = None
+        if msgid:
+            self._known_msgids.setdefault(folder, {})[msgid] = True
+            if self._delivered is not None:
+                self._delivered.add(folder, [msgid])
+
+    def import_messages(
+        self,
+        raw_messages: List[bytes],
+        labels: List[str],
+        feed_name: Optional[str] = None,
+        delivery_name: Optional[str] = None,
+        subfolder: Optional[str] = None
+    ) -> List[Optional[Exception]]:
+        """Import several raw email messages over the current connection.
+
+        Args:
+            raw_messages: Raw email bytes (RFC 2822/5322 format)
+            labels: Ignored for IMAP (single folder only)
+            feed_name: Optional feed name for trace header
+            delivery_name: Optional delivery name for trace header
+            subfolder: Optional subfolder path relative to target's folder
+
+        Returns:
+            One entry per message: None if it was delivered (or already
+            present), or the RemoteError describing why it was not.
+        """
+        try:
+            return self._import_messages(raw_messages, feed_name, delivery_name,
+                                         self._effective_folder(subfolder))
+        finally:
+            if self._delivered is not None:
+                self._delivered.commit()
+
+    def _import_messages(self, raw_messages: List[bytes], feed_name: Optional[str],
+                         delivery_name: Optional[str],
+                         effective_folder: str) -> List[Optional[Exception]]:
+        """Import messages into a folder; see import_messages()."""
+        messages = [RawMessage(raw_message) for raw_message in raw_messages]
+        # Look up which messages already exist in a few round-trips rather
+        # than with one SEARCH per message
+        msgids = [msg.message_id for msg in messages if msg.message_id]
+        if self.imap is not None and len(msgids) > 1:
+            self.preload_existing_message_ids(msgids, effective_folder)
+
+        errors: List[Optional[Exception]] = list()
+        if not self._can_pipeline_appends():
+            for msg in messages:
+                try:
+                    self._import_raw_message(msg, feed_name, delivery_name, effective_folder)
+                    errors.append(None)
+                except RemoteError as e:
+                    errors.append(e)
+            return errors
+
+        # Send the APPENDs for everything not already in the folder without
+        # waiting for each response in turn
+        errors = [None] * len(messages)
+        pending: List[Tuple[int, Optional[str], bytes]] = list()
+        queued: Set[str] = set()
+        for i, msg in enumerate(messages):
+            msgid = msg.message_id
+            if msgid:
+                try:
+                    if msgid in queued or self._already_present(msgid, effective_folder):
+                        continue
+                except OSError as e:
+                    # Nothing has been appended yet; only the messages
+                    # already known to be present made it
+                    error = RemoteError(f"IMAP delivery failed: {e}")
+                    for j, _, _ in pending:
+                        errors[j] = error
+                    errors[i:] = [error] * (len(messages) - i)
+                    return errors
+                queued.add(msgid)
+            pending.append((i, msgid, msg.as_bytes(feed_name, delivery_name)))
+
+        results = self._append_pipelined(effective_folder, [payload for _, _, payload in pending])
+        for (i, msgid, _), result in zip(pending, results):
+            if isinstance(result, RemoteError):
+                errors[i] = result
+            else:
+                self._note_appended(effective_folder, msgid, result)
+        return errors
+
     def disconnect(self) -> None:
-        """Close the IMAP connection.
+        """Release the IMAP connection.
 
-        Safely closes the IMAP connection if one is open. Should be called
-        after delivery is complete to avoid keeping connections open
-        unnecessarily between sync runs.
+        The authenticated connection is returned to a process-wide pool, so
+        the next connect() to the same account skips the TLS handshake and
+        login. Pooled connections are logged out by close_all() at exit.
         """
         if self.imap is not None:
-            try:
-                self.imap.logout()
-                logger.debug('IMAP connection closed for %s', self.identifier)
-            except (OSError, imaplib.IMAP4.error) as e:
-                logger.debug('Error closing IMAP connection for %s: %s',
-                            self.identifier, e)
-            finally:
-                self.imap = None
+            _return_pooled(self._pool_key, self.imap)
+            logger.debug('IMAP connection released for %s', self.identifier)
+            self.imap = None
+            self._forget_connection_state()
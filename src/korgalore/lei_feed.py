@@ -1,28 +1,40 @@
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from korgalore.pi_feed import PIFeed
-from korgalore import run_git_command, run_lei_command, GitError, PublicInboxError, ConfigurationError, StateError
+from korgalore import (run_git_command, run_lei_command, json_loads, GitError, PublicInboxError,
+                       ConfigurationError, StateError)
 
 logger = logging.getLogger('korgalore')
 
+# Upper bound on concurrent git show-ref calls when reading epoch refs
+SHOW_REF_WORKERS = 8
+
+
 class LeiFeed(PIFeed):
     """Feed class for interacting with lei (local email interface) searches."""
 
-    def __init__(self, feed_key: str, lei_url: str) -> None:
+    def __init__(self, feed_key: str, lei_url: str,
+                 known_searches: Optional[List[str]] = None) -> None:
         """Initialize a LeiFeed instance.
 
         Args:
             feed_key: Unique identifier for this feed.
             lei_url: LEI URL in the format 'lei:/path/to/search'.
+            known_searches: Output paths of known v2 lei searches, as
+                returned by list_known_searches(). Callers creating many
+                feeds at once pass this to avoid running lei for each one.
 
         Raises:
             ConfigurationError: If the LEI search is not known to lei.
         """
         self.known_searches: List[str] = list()
-        self._load_known_searches()
+        if known_searches is None:
+            self._load_known_searches()
+        else:
+            self.known_searches = known_searches
         feed_dir = Path(lei_url[4:])  # Strip 'lei:' prefix
         if str(feed_dir) not in self.known_searches:
             raise ConfigurationError(f"LEI search '{feed_dir}' is not known.")
@@ -45,11 +57,11 @@ class LeiFeed(PIFeed):
             PublicInboxError: If lei ls-search fails or the path is not found.
         """
         args = ['ls-search', '-l', '-f', 'json']
-        retcode, output = run_lei_command(args)
+        retcode, output = run_lei_command(args, strip=False)
         if retcode != 0:
             raise PublicInboxError(f"LEI list searches failed: {output.decode()}")
 
-        ls_data = json.loads(output.decode())
+        ls_data = json_loads(output)
         resolved_path = str(Path(path).resolve())
         for entry in ls_data:
             entry_output = entry.get('output', '')
@@ -71,8 +83,8 @@ class LeiFeed(PIFeed):
             GitError: If git show-ref fails on any epoch.
         """
         epochs = self.find_epochs()
-        epoch_info: List[Tuple[int, str]] = list()
-        for epoch in epochs:
+
+        def _show_ref(epoch: int) -> Tuple[int, str]:
             epoch_dir = self.get_gitdir(epoch)
             gitargs = ['show-ref']
             retcode, output, error = run_git_command(str(epoch_dir), gitargs)
@@ -81,28 +93,45 @@ class LeiFeed(PIFeed):
             # It's just one ref in lei repos
             refdata = output.decode()
             logger.debug('Epoch %d refdata: %s', epoch, refdata)
-            epoch_info.append((epoch, refdata))
-        return epoch_info
+            return epoch, refdata
 
-    def _load_known_searches(self) -> None:
-        """Load the list of known lei searches into self.known_searches.
+        if len(epochs) == 1:
+            return [_show_ref(epochs[0])]
+        # The work is all in git subprocesses, so threads overlap it well;
+        # map() keeps the results in epoch order.
+        with ThreadPoolExecutor(max_workers=min(SHOW_REF_WORKERS, len(epochs))) as executor:
+            return list(executor.map(_show_ref, epochs))
+
+    @staticmethod
+    def list_known_searches() -> List[str]:
+        """List the output paths of all known v2 lei searches.
 
-        Queries lei for all searches and filters to only include v2 format searches.
+        Returns:
+            Output paths of known searches, without the 'v2:' prefix.
 
         Raises:
             PublicInboxError: If the lei ls-search command fails.
         """
         args = ['ls-search', '-l', '-f', 'json']
-        retcode, output = run_lei_command(args)
+        retcode, output = run_lei_command(args, strip=False)
         if retcode != 0:
             raise PublicInboxError(f"LEI list searches failed: {output.decode()}")
-        json_output = output.decode()
-        ls_data = json.loads(json_output)
+        ls_data = json_loads(output)
         # Only return the names of v2 searches
+        known_searches: List[str] = list()
         for entry in ls_data:
-            output = entry.get('output', '')
-            if output.startswith('v2:'):
-                self.known_searches.append(output[3:])
+            entry_output = entry.get('output', '')
+            if entry_output.startswith('v2:'):
+                known_searches.append(entry_output[3:])
+        return known_searches
+
+    def _load_known_searches(self) -> None:
+        """Load the list of known lei searches into self.known_searches.
+
+        Raises:
+            PublicInboxError: If the lei ls-search command fails.
+        """
+        self.known_searches = self.list_known_searches()
 
     def init_feed(self, from_start: bool = False) -> None:
         """Initialize a new LEI feed by saving the current state.
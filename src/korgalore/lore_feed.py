@@ -1,18 +1,29 @@
-from typing import List, Dict, Tuple, Any, Optional
-from gzip import GzipFile
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from gzip import GzipFile, decompress
 from pathlib import Path
-import io
-import json
 
 import logging
+import re
 
 from liblore import LoreNode
-from korgalore import run_git_command, StateError, RemoteError
+from korgalore import run_git_command, json_dumps, json_loads, StateError, RemoteError
 from korgalore.pi_feed import PIFeed
 
 
 logger = logging.getLogger('korgalore')
 
+# Manifest keys end in the epoch repo, e.g. /lkml/git/7.git
+_EPOCH_RE = re.compile(r'/(\d+)\.git$')
+
+
+@dataclass(frozen=True, slots=True)
+class EpochInfo:
+    """One epoch repository listed in a public-inbox manifest."""
+    epoch: int
+    path: str
+    fpr: str
+
 
 class LoreFeed(PIFeed):
     """Service for interacting with lore.kernel.org public-inbox archives."""
@@ -72,8 +83,8 @@ class LoreFeed(PIFeed):
             node.close()
 
         try:
-            raw = GzipFile(fileobj=io.BytesIO(response.content)).read()
-            manifest = json.loads(raw)
+            # Don't keep the decompressed JSON around next to the parsed dict
+            manifest = json_loads(decompress(response.content))
         except Exception as e:
             raise RemoteError(
                 f"Failed to parse manifest from {manifest_url}: {e}"
@@ -98,21 +109,27 @@ class LoreFeed(PIFeed):
         return prefixes.pop()
 
     def get_manifest(self) -> Dict[str, Any]:
-        """Fetch and parse the gzipped manifest from the Lore server."""
+        """Fetch and parse the gzipped manifest from the Lore server.
+
+        The response is streamed straight through the gzip decoder, so the
+        compressed body is never buffered in memory as a whole.
+        """
         manifest_url = f"{self.feed_url.rstrip('/')}/manifest.js.gz"
         try:
-            response = self._node.request('GET', manifest_url)
+            response = self._node.request('GET', manifest_url, stream=True)
             response.raise_for_status()
         except Exception as e:
             raise RemoteError(
                 f"Failed to fetch manifest from {self.feed_url}: {e}"
             ) from e
-        # ungzip and parse the manifest
-        manifest: Dict[str, Any] = dict()
-        with GzipFile(fileobj=io.BytesIO(response.content)) as f:
-            mf = json.load(f)
-            for key, vals in mf.items():
-                manifest[key] = vals
+        # ungzip and parse the manifest; decode_content only undoes any
+        # transfer Content-Encoding, leaving the .gz file itself
+        try:
+            response.raw.decode_content = True
+            with GzipFile(fileobj=response.raw) as f:
+                manifest: Dict[str, Any] = json_loads(f.read())
+        finally:
+            response.close()
 
         return manifest
 
@@ -135,14 +152,17 @@ class LoreFeed(PIFeed):
         """Clone a git epoch repository from remote Lore server."""
         gitdir = self.get_gitdir(epoch)
         # does tgt_dir exist?
-        if Path(gitdir).exists():
+        if gitdir.exists():
             logger.debug(f"Target directory {gitdir} already exists, skipping clone.")
             return
 
         repo_url = f"{self.feed_url.rstrip('/')}/git/{epoch}.git"
         gitargs = ['clone', '--mirror']
         if shallow:
-            gitargs += ['--shallow-since=1.week.ago']
+            # Nothing before the tip of a shallow clone is ever delivered,
+            # so don't download those message blobs at all. Servers that
+            # don't allow filters just send everything.
+            gitargs += ['--shallow-since=1.week.ago', '--filter=blob:none']
         gitargs += [repo_url, str(gitdir)]
 
         mirror_config = self._git_mirror_config()
@@ -152,53 +172,55 @@ class LoreFeed(PIFeed):
             # that have no commits in the time window. Fall back to --depth=1
             # which always succeeds regardless of commit dates.
             logger.debug('Shallow clone failed, retrying with --depth=1: %s', error.decode())
-            gitargs = ['clone', '--mirror', '--depth=1', repo_url, str(gitdir)]
+            gitargs = ['clone', '--mirror', '--depth=1', '--filter=blob:none', repo_url, str(gitdir)]
             retcode, output, error = run_git_command(None, gitargs, git_config=mirror_config)
         if retcode != 0:
             raise RemoteError(f"Git clone failed (exit {retcode}): {error.decode()}")
+        if shallow:
+            # Keep the remote as a promisor, so the odd old blob (e.g. during
+            # rebase recovery) is fetched on demand, but drop the filter so
+            # that regular fetches bring in the new messages we deliver.
+            run_git_command(str(gitdir), ['config', '--unset', 'remote.origin.partialclonefilter'])
 
-    def get_manifest_epochs(self) -> List[Tuple[int, str, str]]:
-        """Parse manifest to extract sorted list of (epoch, path, fingerprint) tuples."""
+    def get_manifest_epochs(self) -> List[EpochInfo]:
+        """Parse manifest to extract the list of epochs, sorted by epoch number."""
         manifest = self.get_manifest()
         # The keys are epoch paths, so we extract epoch numbers and paths
-        epochs: List[Tuple[int, str, str]] = []
-        # The key ends in #.git, so grab the final path component and remove .git
-        for epoch_path in manifest.keys():
-            epoch_str = epoch_path.split('/')[-1].replace('.git', '')
-            try:
-                epoch_num = int(epoch_str)
-                fpr = str(manifest[epoch_path]['fingerprint'])
-                epochs.append((epoch_num, epoch_path, fpr))
-            except ValueError:
-                logger.warning(f"Invalid epoch string: {epoch_str} in {self.feed_url}")
+        epochs: List[EpochInfo] = []
+        for epoch_path, epoch_data in manifest.items():
+            match = _EPOCH_RE.search(epoch_path)
+            if match is None:
+                logger.warning(f"Invalid epoch path: {epoch_path} in {self.feed_url}")
+                continue
+            epochs.append(EpochInfo(int(match.group(1)), epoch_path, str(epoch_data['fingerprint'])))
         # Sort epochs by their numeric value
-        epochs.sort(key=lambda x: x[0])
+        epochs.sort(key=lambda x: x.epoch)
         self.store_epochs_info(epochs)
         return epochs
 
-    def store_epochs_info(self, epochs: List[Tuple[int, str, str]]) -> None:
+    def store_epochs_info(self, epochs: List[EpochInfo]) -> None:
         """Save epoch information to local JSON file."""
         epochs_file = self.feed_dir / 'epochs.json'
         epochs_info = []
-        for enum, epath, fpr in epochs:
+        for info in epochs:
             epochs_info.append({
-                'epoch': enum,
-                'path': epath,
-                'fpr': fpr
+                'epoch': info.epoch,
+                'path': info.path,
+                'fpr': info.fpr
             })
         with open(epochs_file, 'w') as ef:
-            json.dump(epochs_info, ef, indent=2)
+            ef.write(json_dumps(epochs_info, indent=True))
 
-    def load_epochs_info(self) -> List[Tuple[int, str, str]]:
+    def load_epochs_info(self) -> List[EpochInfo]:
         """Load epoch information from local JSON file."""
         epochs_file = self.feed_dir / 'epochs.json'
         if not epochs_file.exists():
             raise StateError(f"Epochs file {epochs_file} does not exist.")
-        with open(epochs_file, 'r') as ef:
-            epochs_data = json.load(ef)
-        epochs: List[Tuple[int, str, str]] = []
+        with open(epochs_file, 'rb') as ef:
+            epochs_data = json_loads(ef.read())
+        epochs: List[EpochInfo] = []
         for entry in epochs_data:
-            epochs.append((entry['epoch'], entry['path'], entry['fpr']))
+            epochs.append(EpochInfo(entry['epoch'], entry['path'], entry['fpr']))
         return epochs
 
     def init_feed(self) -> None:
@@ -206,7 +228,7 @@ class LoreFeed(PIFeed):
         if not self.feed_dir.exists():
             self.feed_dir.mkdir(parents=True, exist_ok=True)
         epochs = self.get_manifest_epochs()
-        epoch, _, _ = epochs[-1]
+        epoch = epochs[-1].epoch
         self.clone_epoch(epoch)
         self.save_feed_state(epoch=epoch, success=True)
 
@@ -246,7 +268,7 @@ class LoreFeed(PIFeed):
         )
 
         # Now see if we have any new epochs on the remote
-        highest_remote_epoch = max(e[0] for e in remote_epoch_info)
+        highest_remote_epoch = max(e.epoch for e in remote_epoch_info)
         logger.debug('Highest remote epoch: %d', highest_remote_epoch)
         if highest_local_epoch == highest_remote_epoch:
             logger.debug('No new epochs detected for feed %s', self.feed_dir)
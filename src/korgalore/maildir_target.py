@@ -1,14 +1,29 @@
 """Service for delivering messages to local maildir."""
 
+import itertools
 import logging
 import mailbox
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import os
+import socket
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
 from korgalore import ConfigurationError
 from korgalore.message import RawMessage
 
 logger = logging.getLogger('korgalore')
 
+# Sequence number for unique maildir file names within this process
+_delivery_counter = itertools.count()
+
+
+def _unique_name() -> str:
+    """Return a unique maildir file name in the format mailbox.Maildir uses."""
+    now = time.time()
+    hostname = socket.gethostname().replace('/', r'\057').replace(':', r'\072')
+    return '%s.M%sP%sQ%s.%s' % (int(now), int(now % 1 * 1e6), os.getpid(),
+                                next(_delivery_counter), hostname)
+
 
 class MaildirTarget:
     """Service for delivering messages to a local maildir."""
@@ -28,8 +43,10 @@ class MaildirTarget:
         self.identifier = identifier
         self.maildir_path = Path(maildir_path).expanduser()
 
-        # Cache for subfolder maildirs
+        # Cache for subfolder maildirs, keyed by normalized subfolder path
         self._subfolder_maildirs: Dict[str, mailbox.Maildir] = {}
+        # Parent directories already created for subfolder maildirs
+        self._known_parents: Set[Path] = set()
 
         try:
             # Ensure parent directories exist (mailbox.Maildir only creates
@@ -54,17 +71,20 @@ class MaildirTarget:
         if subfolder is None:
             return self.maildir
 
-        # Check cache first
-        if subfolder in self._subfolder_maildirs:
-            return self._subfolder_maildirs[subfolder]
+        # Check cache first; 'foo/bar' and 'foo//bar/' are the same folder
+        key = str(PurePosixPath(subfolder))
+        if key in self._subfolder_maildirs:
+            return self._subfolder_maildirs[key]
 
         # Compute path and create maildir
-        subfolder_path = self.maildir_path / subfolder
+        subfolder_path = self.maildir_path / key
         try:
             # Ensure parent directories exist
-            subfolder_path.parent.mkdir(parents=True, exist_ok=True)
+            if subfolder_path.parent not in self._known_parents:
+                subfolder_path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_parents.add(subfolder_path.parent)
             subfolder_maildir = mailbox.Maildir(str(subfolder_path), create=True)
-            self._subfolder_maildirs[subfolder] = subfolder_maildir
+            self._subfolder_maildirs[key] = subfolder_maildir
             logger.debug('Created subfolder maildir at %s', subfolder_path)
             return subfolder_maildir
         except Exception as e:
@@ -109,3 +129,104 @@ class MaildirTarget:
             return key
         except Exception as e:
             raise ConfigurationError(f"Failed to deliver to maildir: {e}") from e
+
+    def import_messages(
+        self,
+        raw_messages: List[bytes],
+        labels: List[str],
+        feed_name: Optional[str] = None,
+        delivery_name: Optional[str] = None,
+        subfolder: Optional[str] = None
+    ) -> List[Optional[Exception]]:
+        """Import several messages to maildir, syncing them as one batch.
+
+        Every message is first written to tmp/, and only then is each file
+        fsynced, so the data of the whole batch is already being written
+        out by the time the first fsync waits on it. mailbox.Maildir.add()
+        instead writes and fsyncs one file at a time. The files are then
+        moved into new/ the same way add() does it, and new/ is fsynced
+        once at the end.
+
+        Args:
+            raw_messages: Raw email bytes (RFC 2822/5322 format)
+            labels: Ignored for maildir (Gmail-specific)
+            feed_name: Optional feed name for trace header
+            delivery_name: Optional delivery name for trace header
+            subfolder: Optional subfolder path relative to base maildir
+
+        Returns:
+            One entry per message: None if it was delivered, or the
+            ConfigurationError describing why it was not.
+
+        Raises:
+            ConfigurationError: If the target maildir cannot be created
+        """
+        self._get_maildir(subfolder)
+        folder = self.maildir_path
+        if subfolder is not None:
+            folder = folder / str(PurePosixPath(subfolder))
+        tmp_dir = folder / 'tmp'
+        new_dir = folder / 'new'
+
+        errors: List[Optional[Exception]] = [None] * len(raw_messages)
+        written: List[Tuple[int, str, BinaryIO]] = []
+        try:
+            for idx, raw_message in enumerate(raw_messages):
+                name = _unique_name()
+                try:
+                    data = RawMessage(raw_message).as_bytes(feed_name, delivery_name)
+                    f = open(tmp_dir / name, 'xb')
+                except Exception as e:
+                    errors[idx] = ConfigurationError(f"Failed to deliver to maildir: {e}")
+                    continue
+                written.append((idx, name, f))
+                try:
+                    f.write(data)
+                    f.flush()
+                except Exception as e:
+                    errors[idx] = ConfigurationError(f"Failed to deliver to maildir: {e}")
+
+            # Flush the message data before any of it becomes visible in new/
+            for idx, name, tmp_file in written:
+                if errors[idx] is None:
+                    try:
+                        os.fsync(tmp_file.fileno())
+                    except OSError as e:
+                        errors[idx] = ConfigurationError(f"Failed to deliver to maildir: {e}")
+        finally:
+            for idx, name, tmp_file in written:
+                tmp_file.close()
+                if errors[idx] is not None:
+                    (tmp_dir / name).unlink(missing_ok=True)
+
+        written = [entry for entry in written if errors[entry[0]] is None]
+        if not written:
+            return errors
+
+        for idx, name, _ in written:
+            tmp_path = tmp_dir / name
+            try:
+                try:
+                    os.link(tmp_path, new_dir / name)
+                except (AttributeError, PermissionError):
+                    # No hard links on this filesystem
+                    os.rename(tmp_path, new_dir / name)
+                else:
+                    os.unlink(tmp_path)
+                logger.debug('Delivered message to maildir with key: %s', name)
+            except Exception as e:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                errors[idx] = ConfigurationError(f"Failed to deliver to maildir: {e}")
+
+        try:
+            dir_fd = os.open(new_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as e:
+            # The messages are already in new/; failing them now would
+            # only get them delivered twice
+            logger.warning('Failed to sync maildir %s: %s', new_dir, e)
+        return errors
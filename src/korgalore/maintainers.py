@@ -1,12 +1,14 @@
 """Parser for Linux kernel MAINTAINERS file and lei query builders."""
 
+import functools
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from email.utils import parseaddr
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 logger = logging.getLogger('korgalore')
 
@@ -20,6 +22,11 @@ DEFAULT_CATCHALL_LISTS: List[str] = [
 
 # Regex metacharacters that indicate a pattern is not a simple word
 REGEX_METACHARACTERS = r'\[](){}|^$?+*'
+_REGEX_METACHARACTER_RE = re.compile('[' + re.escape(REGEX_METACHARACTERS) + ']')
+
+# Patterns used to turn subsystem names into config keys
+_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
 
 
 @dataclass
@@ -36,6 +43,7 @@ class SubsystemEntry:
     status: Optional[str] = None                          # S: value
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_subsystem_name(name: str) -> str:
     """Convert 'SUBSYSTEM NAME' to 'subsystem_name' for use as key.
 
@@ -47,9 +55,9 @@ def normalize_subsystem_name(name: str) -> str:
     # Convert to lowercase
     key = name.lower()
     # Remove parenthetical content
-    key = re.sub(r'\s*\([^)]*\)', '', key)
+    key = _PARENTHETICAL_RE.sub('', key)
     # Replace non-alphanumeric with underscore
-    key = re.sub(r'[^a-z0-9]+', '_', key)
+    key = _NON_ALNUM_RE.sub('_', key)
     # Remove leading/trailing underscores
     key = key.strip('_')
     return key
@@ -109,73 +117,88 @@ def has_fields(entry: SubsystemEntry) -> bool:
     )
 
 
-def parse_maintainers(path: Path) -> Dict[str, SubsystemEntry]:
-    """Parse entire MAINTAINERS file into dict of entries.
+def parse_maintainers(path: Path) -> Mapping[str, SubsystemEntry]:
+    """Parse entire MAINTAINERS file into a mapping of entries.
+
+    Results are cached per file and reused until its mtime or size
+    changes, so callers must treat the returned entries as read-only.
 
     Args:
         path: Path to MAINTAINERS file
 
     Returns:
-        Dict mapping subsystem names to SubsystemEntry objects.
+        Read-only mapping of subsystem names to SubsystemEntry objects.
         Entries without any fields are skipped.
     """
+    path = Path(path).resolve()
+    st = path.stat()
+    return _parse_maintainers_impl(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_maintainers_impl(path: str, mtime_ns: int,
+                            size: int) -> Mapping[str, SubsystemEntry]:
+    """Parse a MAINTAINERS file; mtime_ns and size only key the cache."""
     entries: Dict[str, SubsystemEntry] = {}
     current_entry: Optional[SubsystemEntry] = None
     prev_line_empty = True  # Start as true to catch first entry
 
-    with open(path, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            line = line.rstrip('\n')
-
-            # Track empty lines for subsystem title detection
-            if not line.strip():
-                prev_line_empty = True
-                continue
-
-            # Check for field lines first (M:, L:, F:, etc.)
-            if is_field_line(line):
-                if current_entry:
-                    prefix = line[0]
-                    value = line[3:].strip()
-
-                    if prefix == 'M':
-                        email = extract_email(value)
-                        if email:
-                            current_entry.maintainers.append(email)
-                    elif prefix == 'R':
-                        email = extract_email(value)
-                        if email:
-                            current_entry.reviewers.append(email)
-                    elif prefix == 'L':
-                        current_entry.mailing_lists.append(value)
-                    elif prefix == 'F':
-                        current_entry.files.append(value)
-                    elif prefix == 'X':
-                        current_entry.excluded.append(value)
-                    elif prefix == 'N':
-                        current_entry.file_regex.append(value)
-                    elif prefix == 'K':
-                        current_entry.content_regex.append(value)
-                    elif prefix == 'S':
-                        current_entry.status = value
-                prev_line_empty = False
-                continue
-
-            # Check for new subsystem title
-            if is_subsystem_title(line, prev_line_empty):
-                # Save previous entry if it has fields
-                if current_entry and has_fields(current_entry):
-                    entries[current_entry.name] = current_entry
-                # Start new entry
-                current_entry = SubsystemEntry(name=line.strip())
-
+    # Read and decode the whole file at once rather than line by line;
+    # line endings are normalized the same way text mode would
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8', errors='replace')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    for line in text.split('\n'):
+        # Track empty lines for subsystem title detection
+        if not line.strip():
+            prev_line_empty = True
+            continue
+
+        # Check for field lines first (M:, L:, F:, etc.)
+        if is_field_line(line):
+            if current_entry:
+                prefix = line[0]
+                value = line[3:].strip()
+
+                if prefix == 'M':
+                    email = extract_email(value)
+                    if email:
+                        current_entry.maintainers.append(email)
+                elif prefix == 'R':
+                    email = extract_email(value)
+                    if email:
+                        current_entry.reviewers.append(email)
+                elif prefix == 'L':
+                    current_entry.mailing_lists.append(value)
+                elif prefix == 'F':
+                    current_entry.files.append(value)
+                elif prefix == 'X':
+                    current_entry.excluded.append(value)
+                elif prefix == 'N':
+                    current_entry.file_regex.append(value)
+                elif prefix == 'K':
+                    current_entry.content_regex.append(value)
+                elif prefix == 'S':
+                    current_entry.status = value
             prev_line_empty = False
+            continue
+
+        # Check for new subsystem title
+        if is_subsystem_title(line, prev_line_empty):
+            # Save previous entry if it has fields
+            if current_entry and has_fields(current_entry):
+                entries[current_entry.name] = current_entry
+            # Start new entry
+            current_entry = SubsystemEntry(name=line.strip())
+
+        prev_line_empty = False
 
-        # Don't forget the last entry
-        if current_entry and has_fields(current_entry):
-            entries[current_entry.name] = current_entry
+    # Don't forget the last entry
+    if current_entry and has_fields(current_entry):
+        entries[current_entry.name] = current_entry
 
-    return entries
+    return MappingProxyType(entries)
 
 
 def get_subsystem(path: Path, name: str) -> SubsystemEntry:
@@ -228,7 +251,7 @@ def is_simple_pattern(pattern: str) -> bool:
 
     Xapian does not support regex, so we can only use simple patterns.
     """
-    return not any(c in pattern for c in REGEX_METACHARACTERS)
+    return _REGEX_METACHARACTER_RE.search(pattern) is None
 
 
 def email_to_list_id(email: str) -> str:
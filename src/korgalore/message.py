@@ -1,12 +1,22 @@
 """Raw email message wrapper with lazy parsing and common operations."""
 
+import re
 from email.message import EmailMessage
+from email.parser import BytesParser
 from email.utils import formatdate
 from typing import Optional
 
 from korgalore import __version__
 from liblore import emlpolicy
-from liblore.utils import parse_message
+
+# Blank line separating the header block from the body
+_HEADER_END_RE = re.compile(rb'\r?\n\r?\n')
+# Message-ID header whose value may sit on a folded continuation line;
+# unusual values fall back to parsing
+_MSGID_RE = re.compile(rb'^Message-ID:[ \t]*(?:\r?\n[ \t]+)?(<[^<>\s]+>)[ \t]*\r?$',
+                       re.MULTILINE | re.IGNORECASE)
+# How far into a message to look for the Message-ID before parsing instead
+MSGID_SCAN_LIMIT = 64 * 1024
 
 
 class RawMessage:
@@ -23,6 +33,8 @@ class RawMessage:
     """
 
     _policy = emlpolicy
+    # Parsers keep no state between calls, so one instance serves every message
+    _parser = BytesParser(policy=emlpolicy)
 
     def __init__(self, raw_message: bytes) -> None:
         """Initialize with raw email bytes.
@@ -34,6 +46,7 @@ class RawMessage:
         self._parsed: Optional[EmailMessage] = None
         self._message_id: Optional[str] = None
         self._message_id_extracted: bool = False
+        self._delivery_bytes: Optional[bytes] = None
 
     @property
     def raw(self) -> bytes:
@@ -47,7 +60,7 @@ class RawMessage:
         The parsed message is cached after first access.
         """
         if self._parsed is None:
-            self._parsed = parse_message(self._raw)
+            self._parsed = self._parser.parsebytes(self._raw)
         assert self._parsed is not None
         return self._parsed
 
@@ -61,6 +74,15 @@ class RawMessage:
         """
         if not self._message_id_extracted:
             self._message_id_extracted = True
+            # Scan the header block first so we don't parse the whole
+            # message (attachments and all) just to read one header.
+            msgid_bytes = self._scan_message_id()
+            if msgid_bytes is not None:
+                try:
+                    self._message_id = msgid_bytes.decode('ascii')
+                    return self._message_id
+                except UnicodeDecodeError:
+                    pass
             try:
                 msgid = self.parsed.get('Message-ID')
                 if msgid and isinstance(msgid, str):
@@ -70,6 +92,24 @@ class RawMessage:
                 pass
         return self._message_id
 
+    def _scan_message_id(self) -> Optional[bytes]:
+        """Find the Message-ID header in the raw header block.
+
+        Only the first MSGID_SCAN_LIMIT bytes are searched, and the
+        header block is scanned in place without slicing it out.
+
+        Returns:
+            The bracketed Message-ID bytes, or None if it wasn't found.
+        """
+        end = min(len(self._raw), MSGID_SCAN_LIMIT)
+        boundary = _HEADER_END_RE.search(self._raw, 0, end)
+        if boundary is not None:
+            end = boundary.start()
+        match = _MSGID_RE.search(self._raw, 0, end)
+        if match is None:
+            return None
+        return match.group(1)
+
     def as_bytes(
         self,
         feed_name: Optional[str] = None,
@@ -82,6 +122,9 @@ class RawMessage:
         - Injects X-Korgalore-Trace header if feed_name and delivery_name provided
 
         Git stores messages with Unix LF endings, but mail protocols require CRLF.
+        Messages that already use CRLF throughout are not rewritten: the raw
+        bytes are returned as-is, or with the trace header spliced in. The
+        CRLF form is cached, so repeated calls only redo the trace header.
 
         Args:
             feed_name: Optional feed name for trace header
@@ -90,15 +133,20 @@ class RawMessage:
         Returns:
             Message bytes ready for delivery to a target.
         """
-        # First normalize to LF, then we'll convert to CRLF at the end
-        normalized = self._raw.replace(b'\r\n', b'\n')
-
-        # Inject trace header if context is provided
-        if feed_name is not None and delivery_name is not None:
-            normalized = self._inject_trace_header(normalized, feed_name, delivery_name)
+        if self._delivery_bytes is None:
+            crlf_count = self._raw.count(b'\r\n')
+            if self._raw.count(b'\n') == crlf_count:
+                # Every line already ends in CRLF, so there's nothing to normalize
+                self._delivery_bytes = self._raw
+            else:
+                # Messages from git are usually pure LF and need no first pass
+                normalized = self._raw.replace(b'\r\n', b'\n') if crlf_count else self._raw
+                self._delivery_bytes = normalized.replace(b'\n', b'\r\n')
 
-        # Convert to CRLF
-        return normalized.replace(b'\n', b'\r\n')
+        if feed_name is None or delivery_name is None:
+            return self._delivery_bytes
+        return self._inject_trace_header(self._delivery_bytes, feed_name, delivery_name,
+                                         eol=b'\r\n')
 
     def _wrap_header(self, name: str, value: str, max_line: int = 75) -> str:
         """Wrap a header value with proper email header continuation.
@@ -111,50 +159,41 @@ class RawMessage:
         Returns:
             Wrapped header string with continuation lines
         """
-        first_line_max = max_line - len(name) - 2  # account for ": "
-        if len(value) <= first_line_max:
+        if len(name) + 2 + len(value) <= max_line:
             return f"{name}: {value}"
 
-        # Split value into words for wrapping
-        words = value.split(' ')
+        # Greedily fill lines word by word, tracking only the length
         lines = []
-        current_line = f"{name}:"
-
-        for word in words:
-            # Check if adding this word exceeds max length
-            test_line = current_line + ' ' + word if current_line.endswith(':') is False else current_line + ' ' + word
-            if current_line == f"{name}:":
-                test_line = current_line + ' ' + word
-            else:
-                test_line = current_line + ' ' + word
-
-            if len(test_line) <= max_line:
-                if current_line.endswith(':'):
-                    current_line = current_line + ' ' + word
-                else:
-                    current_line = current_line + ' ' + word
-            else:
-                lines.append(current_line)
+        current = [f"{name}:"]
+        current_len = len(name) + 1
+        for word in value.split(' '):
+            if current_len + 1 + len(word) > max_line:
+                lines.append(' '.join(current))
                 # Continuation line starts with space
-                current_line = ' ' + word
+                current = ['']
+                current_len = 0
+            current.append(word)
+            current_len += 1 + len(word)
 
-        lines.append(current_line)
+        lines.append(' '.join(current))
         return '\n'.join(lines)
 
     def _inject_trace_header(
         self,
         message: bytes,
         feed_name: str,
-        delivery_name: str
+        delivery_name: str,
+        eol: bytes = b'\n'
     ) -> bytes:
         """Inject X-Korgalore-Trace header at the end of headers.
 
         Operates directly on bytes without using the parsed EmailMessage.
 
         Args:
-            message: Message bytes with LF line endings
+            message: Message bytes with uniform line endings
             feed_name: Feed name for trace header
             delivery_name: Delivery name for trace header
+            eol: Line ending used by message
 
         Returns:
             Message bytes with trace header injected
@@ -168,13 +207,15 @@ class RawMessage:
         )
         trace_header = self._wrap_header('X-Korgalore-Trace', trace_value) + '\n'
         trace_bytes = trace_header.encode('utf-8')
+        if eol != b'\n':
+            trace_bytes = trace_bytes.replace(b'\n', eol)
 
         # Find the header/body boundary (empty line)
-        # Headers end with \n\n (after LF normalization)
-        boundary = message.find(b'\n\n')
+        boundary = message.find(eol + eol)
         if boundary == -1:
             # No body, append header at the end
             return message + trace_bytes
         else:
             # Insert header before the blank line
-            return message[:boundary + 1] + trace_bytes + message[boundary + 1:]
+            split = boundary + len(eol)
+            return message[:split] + trace_bytes + message[split:]
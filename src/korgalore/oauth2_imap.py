@@ -13,11 +13,11 @@ import webbrowser
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
 
-from korgalore import AuthenticationError, ConfigurationError
+from korgalore import AuthenticationError, ConfigurationError, atomic_write_text
 
 logger = logging.getLogger('korgalore')
 
@@ -33,6 +33,19 @@ IMAP_SCOPE = "https://outlook.office.com/IMAP.AccessAsUser.All offline_access"
 # blocks third-party applications.
 DEFAULT_CLIENT_ID = "96202974-99c3-4d7d-b2a5-1f57fe7f114c"
 
+# Access tokens are treated as expired this many seconds early
+TOKEN_EXPIRY_BUFFER = 300
+
+# Access tokens handed out in this process, shared by every authenticator
+# for the same account: hashed key -> (access token, usable until)
+_token_cache: Dict[str, Tuple[str, float]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(identifier: str, username: str, client_id: str) -> str:
+    """Return the token cache key for an account, without the raw values."""
+    return hashlib.sha256('\0'.join((identifier, username, client_id)).encode()).hexdigest()
+
 
 @dataclass
 class OAuth2Token:
@@ -44,7 +57,7 @@ class OAuth2Token:
     token_type: str = "Bearer"
     scope: str = ""
 
-    def is_expired(self, buffer_seconds: int = 300) -> bool:
+    def is_expired(self, buffer_seconds: int = TOKEN_EXPIRY_BUFFER) -> bool:
         """Check if token is expired or will expire within buffer_seconds."""
         return datetime.now(timezone.utc).timestamp() >= (self.expires_at - buffer_seconds)
 
@@ -115,11 +128,9 @@ class ImapOAuth2Authenticator:
         token_path = Path(self.token_file)
         token_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.token_file, 'w') as f:
-            json.dump(self._token.to_dict(), f, indent=2)
-
-        # Set restrictive permissions
-        os.chmod(self.token_file, 0o600)
+        # Restrict permissions before the token is moved into place
+        atomic_write_text(token_path, json.dumps(self._token.to_dict(), indent=2),
+                          mode=0o600)
         logger.debug("Saved OAuth2 token to %s", self.token_file)
 
     @property
@@ -130,9 +141,23 @@ class ImapOAuth2Authenticator:
         # Also mark as needing auth if refresh fails
         return self._needs_auth
 
+    @property
+    def _cache_key(self) -> str:
+        return _token_cache_key(self.identifier, self.username, self.client_id)
+
+    def _forget_cached_token(self) -> None:
+        """Drop this account's access token from the process-wide cache."""
+        with _token_cache_lock:
+            _token_cache.pop(self._cache_key, None)
+
     def get_access_token(self) -> str:
         """Get a valid access token, refreshing if needed.
 
+        Tokens are cached for the whole process until TOKEN_EXPIRY_BUFFER
+        seconds before they expire, so authenticators recreated for every
+        sync (or several targets on one account) don't check or refresh
+        the token again.
+
         Returns:
             Valid access token string.
 
@@ -140,6 +165,12 @@ class ImapOAuth2Authenticator:
             AuthenticationError: If no valid token and interactive mode is disabled,
                 or if authentication flow fails.
         """
+        key = self._cache_key
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        if cached is not None and datetime.now(timezone.utc).timestamp() < cached[1]:
+            return cached[0]
+
         if self._token is None:
             if not self.interactive:
                 self._needs_auth = True
@@ -173,6 +204,9 @@ class ImapOAuth2Authenticator:
                 target_type='imap'
             )
 
+        with _token_cache_lock:
+            _token_cache[key] = (self._token.access_token,
+                                 self._token.expires_at - TOKEN_EXPIRY_BUFFER)
         return self._token.access_token
 
     def _refresh_token(self) -> None:
@@ -212,6 +246,7 @@ class ImapOAuth2Authenticator:
                 os.rename(self.token_file, invalid_file)
             self._token = None
             self._needs_auth = True
+            self._forget_cached_token()
             raise AuthenticationError(
                 f"Token refresh failed for IMAP target '{self.identifier}'. "
                 "Please re-authenticate.",
@@ -417,6 +452,7 @@ class ImapOAuth2Authenticator:
 
         # Clear existing token to force full re-auth
         self._token = None
+        self._forget_cached_token()
 
         # Run the auth flow (temporarily enable interactive mode)
         old_interactive = self.interactive
@@ -1,18 +1,28 @@
 import json
 import logging
-import os
-import tempfile
+import subprocess
+import threading
 
 from email.message import EmailMessage
+from email.parser import BytesHeaderParser
 from pathlib import Path
-from korgalore import run_git_command, PublicInboxError, GitError, StateError
+from korgalore import (run_git_command, open_git_cat_file, json_dumps, json_loads,
+                       atomic_write_text, PublicInboxError, GitError, StateError)
 from fcntl import lockf, LOCK_EX, LOCK_UN, LOCK_NB
 
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from datetime import datetime, timezone
 
-from liblore.utils import parse_message
+from liblore import emlpolicy
+
+# Messages are read once per delivered commit; with libgit2 bindings that
+# happens in-process instead of spawning git for every commit
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
 
 logger = logging.getLogger('korgalore')
 
@@ -22,6 +32,8 @@ COMMIT_SUBJECT_CACHE: Dict[str, str] = dict()
 LOCKED_FEEDS: Dict[str, Any] = dict()
 # We retry failed deliveries for 5 days and then give up
 RETRY_FAILED_INTERVAL = 5 * 24 * 60 * 60  # 5 days in seconds
+# Parsers keep no state between calls, so one instance serves every message
+_HEADER_PARSER = BytesHeaderParser(policy=emlpolicy)
 
 class PIFeed:
     """Base class for public-inbox feed implementations.
@@ -39,11 +51,38 @@ class PIFeed:
     def __init__(self, feed_key: str, feed_dir: Path) -> None:
         self._branch_cache: Dict[str, str] = dict()
         self._empty_repo_cache: Dict[int, bool] = dict()
+        # pygit2 repositories opened during this run, per epoch. Delivery
+        # threads share the feed, and libgit2 objects are not safe to use
+        # from several threads at once, so all pygit2 access holds the lock
+        self._repo_cache: Dict[int, Any] = dict()
+        self._repo_lock = threading.Lock()
+        # git cat-file --batch processes started during this run, per epoch,
+        # and the last message blob read while checking for no-op commits
+        self._cat_file_procs: Dict[int, 'subprocess.Popen[bytes]'] = dict()
+        self._cat_file_lock = threading.Lock()
+        self._last_blob: Optional[Tuple[int, str, bytes]] = None
+        # Paths under feed_dir are looked up for every commit, so build them once
+        self._gitdir_cache: Dict[int, Path] = dict()
+        self._state_path_cache: Dict[Tuple[Optional[str], str], Path] = dict()
         self.feed_key: str = feed_key
         self.feed_dir: Path = feed_dir
         self.feed_type: str = 'unknown'
         self.feed_url: str = ''
 
+    @staticmethod
+    def parse_headers_only(raw_message: bytes) -> EmailMessage:
+        """Parse only the header block of a raw message.
+
+        Parsing stops at the header/body boundary, which avoids walking
+        the body of large patch messages when only headers are needed.
+        """
+        return cast(EmailMessage, _HEADER_PARSER.parsebytes(raw_message))
+
+    @staticmethod
+    def parse_subject(raw_message: bytes) -> str:
+        """Return the Subject of a raw message, parsing only its headers."""
+        return str(PIFeed.parse_headers_only(raw_message).get('Subject', '(no subject)'))
+
     def _read_jsonl_file(self, filepath: Path) -> List[Tuple[Union[int, str], ...]]:
         """Read a JSONL state file and return a list of tuples."""
         results: List[Tuple[Union[int, str], ...]] = list()
@@ -54,7 +93,7 @@ class PIFeed:
                 line = line.strip()
                 if not line:
                     continue
-                obj = json.loads(line)
+                obj = json_loads(line)
                 results.append(tuple(obj))
         return results
 
@@ -65,33 +104,26 @@ class PIFeed:
             if filepath.exists():
                 filepath.unlink()
             return
-        content = ''.join(json.dumps(obj) + '\n' for obj in data)
+        content = ''.join(json_dumps(obj) + '\n' for obj in data)
         self._atomic_write(filepath, content)
 
     def _atomic_write(self, filepath: Path, content: str) -> None:
         """Write content to file atomically using temp file and rename."""
-        dirpath = filepath.parent
-        fd, tmp_path = tempfile.mkstemp(dir=dirpath, prefix='.tmp_')
-        try:
-            with os.fdopen(fd, 'w') as f:
-                f.write(content)
-            os.replace(tmp_path, filepath)
-        except Exception:
-            # Clean up temp file on error
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            raise
+        # State is rewritten after every delivery, so skip the fsync
+        atomic_write_text(filepath, content, fsync=False)
 
     def get_gitdir(self, epoch: int) -> Path:
         """Return the path to the git directory for a specific epoch."""
-        return self.feed_dir / 'git' / f'{epoch}.git'
+        gitdir = self._gitdir_cache.get(epoch)
+        if gitdir is None:
+            gitdir = self.feed_dir / 'git' / f'{epoch}.git'
+            self._gitdir_cache[epoch] = gitdir
+        return gitdir
 
     def _append_to_jsonl_file(self, filepath: Path, obj: Tuple[Union[int, str], ...]) -> None:
         """Append a tuple as a JSONL entry to a state file."""
         with open(filepath, 'a') as f:
-            line = json.dumps(obj)
+            line = json_dumps(obj)
             f.write(line + '\n' )
 
     def _perform_legacy_migration(self) -> None:
@@ -171,9 +203,15 @@ class PIFeed:
 
 
     def _get_state_file_path(self, delivery_name: Optional[str] = None, suffix: str = 'info') -> Path:
-        if not delivery_name:
-            return self.feed_dir / f'korgalore.{suffix}'
-        return self.feed_dir / f'korgalore.{delivery_name}.{suffix}'
+        key = (delivery_name or None, suffix)
+        path = self._state_path_cache.get(key)
+        if path is None:
+            if not delivery_name:
+                path = self.feed_dir / f'korgalore.{suffix}'
+            else:
+                path = self.feed_dir / f'korgalore.{delivery_name}.{suffix}'
+            self._state_path_cache[key] = path
+        return path
 
     def _get_default_branch(self, gitdir: Path) -> str:
         """Detect the default branch name in the repository."""
@@ -236,7 +274,7 @@ class PIFeed:
         gitdir = self.get_gitdir(epoch)
         branch = self._get_default_branch(gitdir)
         gitargs = ['rev-list', '--reverse', branch]
-        retcode, output, error = run_git_command(str(gitdir), gitargs)
+        retcode, output, error = run_git_command(str(gitdir), gitargs, strip=False)
         if retcode != 0:
             raise GitError(f"Git rev-list failed (exit {retcode}): {error.decode()}")
         if len(output):
@@ -265,7 +303,7 @@ class PIFeed:
         # message-id.
         gitdir = self.get_gitdir(epoch)
         gitargs = ['rev-list', '--reverse', '--since-as-filter', commit_date_str, 'HEAD']
-        retcode, output, _err = run_git_command(str(gitdir), gitargs)
+        retcode, output, _err = run_git_command(str(gitdir), gitargs, strip=False)
         if retcode != 0:
             # Not sure what happened here, just give up and return the latest commit
             logger.warning("Could not run rev-list to recover after rebase, returning latest commit.")
@@ -283,7 +321,7 @@ class PIFeed:
         first_commit = possible_commits[0]
         for commit in possible_commits:
             raw_message = self.get_message_at_commit(epoch, commit)
-            msg = parse_message(raw_message)
+            msg = self.parse_headers_only(raw_message)
             subject = msg.get('Subject', '(no subject)')
             msgid = msg.get('Message-ID', '(no message-id)')
             if subject == info.get('subject') and msgid == info.get('msgid'):
@@ -295,7 +333,7 @@ class PIFeed:
             logger.error("Returning first possible commit after date: %s", first_commit)
             last_commit = first_commit
             raw_message = self.get_message_at_commit(epoch, last_commit)
-            msg = parse_message(raw_message)
+            msg = self.parse_headers_only(raw_message)
         else:
             logger.debug("Recovered exact matching commit after rebase: %s", last_commit)
 
@@ -329,7 +367,7 @@ class PIFeed:
             logger.debug(f"Since commit {since_commit} not found, trying to recover after rebase.")
             since_commit = self.recover_after_rebase(delivery_name, highest_known_epoch)
         gitargs = ['rev-list', '--reverse', f'{since_commit}..HEAD']
-        retcode, output, error = run_git_command(str(gitdir), gitargs)
+        retcode, output, error = run_git_command(str(gitdir), gitargs, strip=False)
         if retcode != 0:
             raise GitError(f"Git rev-list failed (exit {retcode}): {error.decode()}")
         if len(output):
@@ -348,6 +386,98 @@ class PIFeed:
 
         return new_commits
 
+    def _get_repo(self, epoch: int) -> Optional[Any]:
+        """Return the pygit2 repository for an epoch, or None without pygit2.
+
+        The caller holds _repo_lock.
+        """
+        if not HAS_PYGIT2:
+            return None
+        repo = self._repo_cache.get(epoch)
+        if repo is None:
+            try:
+                repo = pygit2.Repository(str(self.get_gitdir(epoch)))
+            except pygit2.GitError:
+                return None
+            self._repo_cache[epoch] = repo
+        return repo
+
+    def _get_commit_tree(self, epoch: int, commitish: str) -> Optional[Any]:
+        """Look up a commit's tree with pygit2.
+
+        Returns None when pygit2 is unavailable or the commit cannot be
+        resolved, so callers fall back to the git command and its errors.
+        The caller holds _repo_lock for as long as it uses the tree.
+        """
+        repo = self._get_repo(epoch)
+        if repo is None:
+            return None
+        try:
+            return repo.revparse_single(commitish).peel(pygit2.Commit).tree
+        except (KeyError, ValueError, pygit2.GitError):
+            return None
+
+    def _cat_file(self, epoch: int, names: List[str]) -> Optional[List[Optional[bytes]]]:
+        """Read objects through the epoch's long-lived git cat-file --batch.
+
+        Args:
+            epoch: Epoch whose repository to read from.
+            names: Object names (e.g. 'commit' or 'commit:m').
+
+        Returns:
+            The contents of each object, or None for objects that do not
+            exist; None instead of a list if the batch process failed, in
+            which case callers fall back to one git command per object.
+        """
+        with self._cat_file_lock:
+            proc = self._cat_file_procs.get(epoch)
+            if proc is None:
+                proc = open_git_cat_file(str(self.get_gitdir(epoch)))
+                self._cat_file_procs[epoch] = proc
+            assert proc.stdin is not None and proc.stdout is not None
+            results: List[Optional[bytes]] = list()
+            try:
+                proc.stdin.write(''.join(f'{name}\n' for name in names).encode())
+                proc.stdin.flush()
+                for _ in names:
+                    header = proc.stdout.readline().split()
+                    if len(header) == 2:
+                        # "<name> missing" or "<name> ambiguous"
+                        results.append(None)
+                        continue
+                    if len(header) != 3:
+                        raise OSError(f'unexpected cat-file output: {header!r}')
+                    size = int(header[2])
+                    data = proc.stdout.read(size + 1)
+                    if len(data) != size + 1:
+                        raise OSError('short read from cat-file')
+                    results.append(data[:size])
+            except (OSError, ValueError) as e:
+                logger.debug('git cat-file --batch failed for epoch %d: %s', epoch, e)
+                self._close_cat_file(epoch)
+                return None
+            return results
+
+    def _close_cat_file(self, epoch: Optional[int] = None) -> None:
+        """Stop the cat-file process for an epoch, or all of them."""
+        epochs = [epoch] if epoch is not None else list(self._cat_file_procs)
+        for e in epochs:
+            proc = self._cat_file_procs.pop(e, None)
+            if proc is None:
+                continue
+            if proc.stdin is not None:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
     def is_noop_commit(self, epoch: int, commitish: str) -> bool:
         """Check if a commit has no 'm' file and should be skipped.
 
@@ -368,6 +498,20 @@ class PIFeed:
         object), since treating a missing commit as a no-op would cause
         save_delivery_info to crash downstream.
         """
+        with self._repo_lock:
+            tree = self._get_commit_tree(epoch, commitish)
+            if tree is not None:
+                return 'm' not in tree
+        objects = self._cat_file(epoch, [commitish, f'{commitish}:m'])
+        if objects is not None:
+            commit_obj, message = objects
+            if commit_obj is None:
+                raise GitError(f"Bad object {commitish} in epoch {epoch}")
+            if message is None:
+                return True
+            # The message is usually wanted right after this check
+            self._last_blob = (epoch, commitish, message)
+            return False
         gitdir = self.get_gitdir(epoch)
         # First verify the commit object exists locally.
         retcode, _output, _err = run_git_command(str(gitdir), ['cat-file', '-e', commitish])
@@ -380,6 +524,25 @@ class PIFeed:
 
     def get_message_at_commit(self, epoch: int, commitish: str) -> bytes:
         """Retrieve raw email message bytes from a specific git commit."""
+        with self._repo_lock:
+            tree = self._get_commit_tree(epoch, commitish)
+            if tree is not None:
+                if 'm' not in tree:
+                    raise StateError(f"Commit {commitish} does not have a message file.")
+                try:
+                    # Same bytes as the stripped output of git show
+                    return cast(bytes, tree['m'].data).strip()
+                except (KeyError, pygit2.GitError):
+                    # Blobless clones only have the blob once git fetches it
+                    # on demand, which the git paths below do
+                    logger.debug('Blob for %s not available locally in epoch %d', commitish, epoch)
+        last_blob = self._last_blob
+        if last_blob is not None and last_blob[:2] == (epoch, commitish):
+            self._last_blob = None
+            return last_blob[2].strip()
+        objects = self._cat_file(epoch, [f'{commitish}:m'])
+        if objects is not None and objects[0] is not None:
+            return objects[0].strip()
         gitdir = self.get_gitdir(epoch)
         gitargs = ['show', f'{commitish}:m']
         retcode, output, error = run_git_command(str(gitdir), gitargs)
@@ -396,8 +559,7 @@ class PIFeed:
             return COMMIT_SUBJECT_CACHE[commitish]
         except KeyError:
             raw_msg = self.get_message_at_commit(epoch, commitish)
-            msg = parse_message(raw_msg)
-            subject = msg.get('Subject', '(no subject)')
+            subject = self.parse_subject(raw_msg)
             COMMIT_SUBJECT_CACHE[commitish] = subject
             return subject
 
@@ -477,6 +639,11 @@ class PIFeed:
             lockfh.close()
             del LOCKED_FEEDS[key]
             self._empty_repo_cache.clear()
+            # Feed updates may repack or replace the repositories
+            with self._repo_lock:
+                self._repo_cache.clear()
+            self._close_cat_file()
+            self._last_blob = None
             logger.debug("Released lock for feed '%s'.", key)
         except KeyError:
             raise PublicInboxError(f"Feed '{key}' is not locked.")
@@ -590,7 +757,7 @@ class PIFeed:
 
         if message:
             if isinstance(message, bytes):
-                msg = parse_message(message)
+                msg = self.parse_headers_only(message)
             else:
                 msg = message
             subject = msg.get('Subject', '(no subject)')
@@ -610,7 +777,7 @@ class PIFeed:
             'commit_date': commit_date,
         }
 
-        self._atomic_write(state_file, json.dumps(state_info, indent=2))
+        self._atomic_write(state_file, json_dumps(state_info, indent=True))
 
     def get_delivery_info_for_epoch(self, delivery_name: str, epoch: Optional[int] = None) -> Dict[str, Any]:
         """Retrieve saved delivery state for a specific epoch."""
@@ -636,8 +803,8 @@ class PIFeed:
             logger.debug('Initializing new state file for delivery: %s', delivery_name)
             self.save_delivery_info(delivery_name)
 
-        with open(state_file, 'r') as gf:
-            info = json.load(gf)  # type: Dict[str, Any]
+        with open(state_file, 'rb') as gf:
+            info = json_loads(gf.read())  # type: Dict[str, Any]
 
         return info
 
@@ -683,8 +850,8 @@ class PIFeed:
             if not state_file.exists():
                 raise StateError(f"Feed state not found: {state_file}")
 
-        with open(state_file, 'r') as f:
-            result = json.load(f)
+        with open(state_file, 'rb') as f:
+            result = json_loads(f.read())
             assert isinstance(result, dict)
             return result
 
@@ -700,8 +867,8 @@ class PIFeed:
             latest_commit = self.get_top_commit(epoch)
 
         if state_file.exists():
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            with open(state_file, 'rb') as f:
+                state = json_loads(f.read())
         else:
             state = {
                 'epochs': {},
@@ -717,5 +884,5 @@ class PIFeed:
             'latest_commit': latest_commit,
         }
 
-        self._atomic_write(state_file, json.dumps(state, indent=2))
+        self._atomic_write(state_file, json_dumps(state, indent=True))
 
@@ -93,6 +93,8 @@ class TrackingManifest:
         self.manifest_path = data_dir / 'tracking.json'
         self.lei_base_dir = data_dir / 'lei'
         self._threads: Dict[str, TrackedThread] = {}
+        # Set by bulk updates that defer writing; see flush_if_dirty()
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
@@ -140,9 +142,24 @@ class TrackingManifest:
         with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
         tmp_path.rename(self.manifest_path)
+        self._dirty = False
 
         logger.debug('Saved tracking manifest with %d threads', len(self._threads))
 
+    def mark_dirty(self) -> None:
+        """Flag in-memory changes that have not been written to disk yet."""
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes waiting for flush_if_dirty()."""
+        return self._dirty
+
+    def flush_if_dirty(self) -> None:
+        """Write the manifest to disk if there are unsaved changes."""
+        if self._dirty:
+            self._save()
+
     def add_thread(self, track_id: str, msgid: str, subject: str, target: str,
                    labels: List[str], lei_path: Path) -> TrackedThread:
         """Add a new thread to track.
@@ -299,6 +316,7 @@ class TrackingManifest:
         """Check for threads that should be auto-expired.
 
         Threads with no new messages for EXPIRE_DAYS are marked inactive.
+        Changes are kept in memory; call flush_if_dirty() to persist them.
 
         Returns:
             List of track_ids that were expired.
@@ -314,13 +332,16 @@ class TrackingManifest:
                            track_id, thread.last_new_message.date())
 
         if expired:
-            self._save()
+            self.mark_dirty()
 
         return expired
 
     def update_activity(self, track_id: str, new_messages: int) -> None:
         """Update activity timestamps after processing a thread.
 
+        Changes are kept in memory so that a pull touching many threads
+        writes the manifest once; call flush_if_dirty() to persist them.
+
         Args:
             track_id: The tracking ID.
             new_messages: Number of new messages delivered.
@@ -339,7 +360,7 @@ class TrackingManifest:
             thread.last_new_message = now
             thread.message_count += new_messages
 
-        self._save()
+        self.mark_dirty()
 
 
 def create_lei_thread_search(msgid: str, output_path: Path) -> Tuple[int, bytes]:
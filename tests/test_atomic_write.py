@@ -0,0 +1,68 @@
+"""Tests for the atomic_write_text helper."""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from korgalore import atomic_write_text
+
+
+def test_replaces_contents(tmp_path: Path) -> None:
+    """Existing content is replaced and no temp file is left behind."""
+    target = tmp_path / 'config.toml'
+    target.write_text('old\n')
+    atomic_write_text(target, 'new\n')
+    assert target.read_text() == 'new\n'
+    assert os.listdir(tmp_path) == ['config.toml']
+
+
+def test_sets_mode(tmp_path: Path) -> None:
+    """Requested permissions are applied to the written file."""
+    target = tmp_path / 'token.json'
+    atomic_write_text(target, '{}', mode=0o600)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o600
+
+
+def test_failed_write_keeps_original(tmp_path: Path) -> None:
+    """If the rename fails, the original file and directory are untouched."""
+    target = tmp_path / 'config.toml'
+    target.write_text('old\n')
+    with patch('korgalore.os.replace', side_effect=OSError('disk full')):
+        with pytest.raises(OSError):
+            atomic_write_text(target, 'new\n')
+    assert target.read_text() == 'old\n'
+    assert os.listdir(tmp_path) == ['config.toml']
+
+
+def test_default_mode_follows_umask(tmp_path: Path) -> None:
+    """Without an explicit mode, the file is created as open() would create it."""
+    target = tmp_path / 'config.toml'
+    umask = os.umask(0o022)
+    try:
+        atomic_write_text(target, 'new\n')
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+
+def test_no_chmod_without_mode(tmp_path: Path) -> None:
+    """Frequently rewritten files pay no extra syscalls for permissions."""
+    target = tmp_path / 'state.json'
+    target.write_text('old\n')
+    with patch('korgalore.os.chmod') as chmod:
+        atomic_write_text(target, 'new\n', fsync=False)
+    chmod.assert_not_called()
+    assert target.read_text() == 'new\n'
+
+
+def test_temp_file_is_unique(tmp_path: Path) -> None:
+    """A leftover or concurrent temp file next to the target is not reused."""
+    target = tmp_path / 'token.json'
+    stray = tmp_path / 'token.json.tmp'
+    stray.write_text('other writer\n')
+    atomic_write_text(target, '{}')
+    assert target.read_text() == '{}'
+    assert stray.read_text() == 'other writer\n'
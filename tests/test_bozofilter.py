@@ -32,6 +32,12 @@ class TestLoadBozofilter:
         result = load_bozofilter(tmp_path)
         assert result == {'spam@example.com', 'troll@example.org'}
 
+    def test_returns_frozenset(self, tmp_path: Path) -> None:
+        """The loaded filter is immutable, whether or not the file exists."""
+        assert isinstance(load_bozofilter(tmp_path), frozenset)
+        (tmp_path / 'bozofilter.txt').write_text("spam@example.com\n")
+        assert isinstance(load_bozofilter(tmp_path), frozenset)
+
     def test_skips_comment_lines(self, tmp_path: Path) -> None:
         """Skips lines that start with #."""
         content = "# This is a comment\nspam@example.com\n# Another comment\n"
@@ -82,6 +88,20 @@ bot2@example.net
         }
 
 
+    def test_reuses_parsed_filter_until_file_changes(self, tmp_path: Path) -> None:
+        """An unchanged file is served from the cache; edits are picked up."""
+        path = tmp_path / 'bozofilter.txt'
+        path.write_text("spam@example.com\n")
+        first = load_bozofilter(tmp_path)
+        assert load_bozofilter(tmp_path) is first
+
+        path.write_text("spam@example.com\ntroll@example.org\n")
+        assert load_bozofilter(tmp_path) == {'spam@example.com', 'troll@example.org'}
+
+        path.unlink()
+        assert load_bozofilter(tmp_path) == set()
+
+
 class TestAddToBozofilter:
     """Tests for add_to_bozofilter function."""
 
@@ -139,6 +159,21 @@ class TestAddToBozofilter:
         assert result == {'valid@example.com'}
 
 
+    def test_skips_duplicates_within_call(self, tmp_path: Path) -> None:
+        """An address given twice in one call is only written once."""
+        added = add_to_bozofilter(tmp_path, ['spam@example.com', 'SPAM@example.com'])
+        assert added == 1
+        content = (tmp_path / 'bozofilter.txt').read_text()
+        assert content.count('spam@example.com') == 1
+
+    def test_added_addresses_visible_to_next_load(self, tmp_path: Path) -> None:
+        """Adding invalidates a previously cached filter."""
+        (tmp_path / 'bozofilter.txt').write_text('old@example.com\n')
+        load_bozofilter(tmp_path)
+        add_to_bozofilter(tmp_path, ['new@example.com'])
+        assert load_bozofilter(tmp_path) == {'old@example.com', 'new@example.com'}
+
+
 class TestExtractEmailAddress:
     """Tests for extract_email_address function."""
 
@@ -215,3 +250,38 @@ class TestGetBozofilterPath:
         """Returns correct path in config directory."""
         result = get_bozofilter_path(tmp_path)
         assert result == tmp_path / 'bozofilter.txt'
+
+
+class TestRetryBozofilter:
+    """Tests for bozofilter handling when retrying failed deliveries."""
+
+    RAW = (b"From: Spammer <spam@example.com>\n"
+           b"Subject: junk\n"
+           b"Message-ID: <junk@example.com>\n"
+           b"\n"
+           b"body\n")
+
+    def test_retry_skips_bozofied_senders(self) -> None:
+        """Retried messages from bozofied senders are skipped, not delivered."""
+        from unittest.mock import MagicMock
+        import click
+        from korgalore.cli import retry_all_failed_deliveries
+        from korgalore.pi_feed import PIFeed
+
+        feed = MagicMock()
+        feed.get_failed_commits_for_delivery.return_value = [(0, 'a' * 40), (0, 'b' * 40)]
+        feed.is_noop_commit.return_value = False
+        feed.get_message_at_commit.return_value = self.RAW
+        feed.parse_headers_only.side_effect = PIFeed.parse_headers_only
+        target = MagicMock()
+
+        ctx = click.Context(click.Command('test'))
+        ctx.obj = {
+            'deliveries': {'d': (feed, target, ['INBOX'], None)},
+            'bozofilter': {'spam@example.com'},
+            'hide_bar': True,
+        }
+        retry_all_failed_deliveries(ctx)
+
+        target.import_message.assert_not_called()
+        assert feed.mark_successful_delivery.call_count == 2
@@ -261,6 +261,14 @@ class TestLoadConfigWithConfD:
         assert 'legacy' in config['deliveries']
         assert 'sources' not in config
 
+    def test_legacy_sources_markers_rewritten(self) -> None:
+        """Both legacy markers are rewritten in one pass, nothing else is."""
+        from korgalore.cli import LEGACY_SOURCES_MAP, LEGACY_SOURCES_RE
+        content = "### Sources ###\n[sources.a]\nfeed = 'sources.b'\n"
+        new_content, count = LEGACY_SOURCES_RE.subn(lambda m: LEGACY_SOURCES_MAP[m.group(0)], content)
+        assert count == 2
+        assert new_content == "### Deliveries ###\n[deliveries.a]\nfeed = 'sources.b'\n"
+
     def test_load_config_conf_d_adds_to_main_deliveries(self, tmp_path: Path) -> None:
         """conf.d deliveries are added to main config deliveries."""
         config_file = tmp_path / "korgalore.toml"
@@ -392,3 +400,171 @@ class TestTrackSubsystemList:
         if not display_name:
             display_name = 'amd_gpu'.replace('_', ' ').upper()
         assert display_name == 'AMD GPU'
+
+
+class TestCreateSubsystemQuery:
+    """Tests for creating a single track-subsystem lei search."""
+
+    def test_success_initialises_feed(self, tmp_path: Path) -> None:
+        """A created search initialises its own feed and delivery state."""
+        from unittest.mock import patch
+        from korgalore.cli import create_subsystem_query
+
+        with patch('korgalore.tracking.create_lei_query_search',
+                   return_value=(0, b'')) as mock_create, \
+                patch('korgalore.lei_feed.LeiFeed') as mock_feed_cls:
+            feed = mock_feed_cls.return_value
+            feed.get_highest_epoch.return_value = 0
+            feed.get_first_commit.return_value = 'abc123'
+            assert create_subsystem_query('patches', 'dfn:foo/*', 'foo',
+                                          tmp_path, True) is True
+
+        mock_create.assert_called_once_with('dfn:foo/*', tmp_path / 'foo-patches',
+                                            threads=True)
+        mock_feed_cls.assert_called_once_with('foo-patches',
+                                              f'lei:{tmp_path / "foo-patches"}')
+        feed.init_feed.assert_called_once_with(from_start=True)
+        feed.save_delivery_info.assert_called_once_with('foo-patches', epoch=0,
+                                                        latest_commit='abc123')
+
+    def test_lei_failure_returns_false(self, tmp_path: Path) -> None:
+        """A failed lei query reports failure without touching the feed."""
+        from unittest.mock import patch
+        from korgalore.cli import create_subsystem_query
+
+        with patch('korgalore.tracking.create_lei_query_search',
+                   return_value=(1, b'boom')), \
+                patch('korgalore.lei_feed.LeiFeed') as mock_feed_cls:
+            assert create_subsystem_query('mailinglist', 'l:foo', 'foo',
+                                          tmp_path, False) is False
+        mock_feed_cls.assert_not_called()
+
+
+class TestXdgDirs:
+    """Tests for XDG directory helpers."""
+
+    def test_data_dir_created_once(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """The data directory is created on first use and then cached."""
+        from korgalore.cli import get_xdg_data_dir
+        monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path / 'data'))
+        first = get_xdg_data_dir()
+        assert first == tmp_path / 'data' / 'korgalore'
+        assert first.is_dir()
+        # Removing the directory is not noticed on subsequent calls
+        first.rmdir()
+        assert get_xdg_data_dir() == first
+        assert not first.exists()
+
+    def test_config_dir_follows_env(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Changing XDG_CONFIG_HOME yields (and creates) a new directory."""
+        from korgalore.cli import get_xdg_config_dir
+        monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'a'))
+        assert get_xdg_config_dir() == tmp_path / 'a' / 'korgalore'
+        monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'b'))
+        second = get_xdg_config_dir()
+        assert second == tmp_path / 'b' / 'korgalore'
+        assert second.is_dir()
+
+
+class TestLazyTargetImports:
+    """Target backends must not be imported just by loading the CLI."""
+
+    def test_cli_import_skips_target_modules(self) -> None:
+        """Importing korgalore.cli does not pull in any target module."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, korgalore.cli\n"
+            "mods = [m for m in ('korgalore.gmail_target', 'korgalore.imap_target',\n"
+            "                    'korgalore.jmap_target', 'korgalore.pipe_target')\n"
+            "        if m in sys.modules]\n"
+            "print(','.join(mods))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ''
+
+    def test_cli_import_skips_feed_and_tracking_modules(self) -> None:
+        """Importing korgalore.cli does not pull in feed or tracking modules."""
+        import subprocess
+        import sys
+        code = (
+            "import sys, korgalore.cli\n"
+            "mods = [m for m in ('korgalore.lore_feed', 'korgalore.lei_feed',\n"
+            "                    'korgalore.tracking', 'korgalore.maintainers')\n"
+            "        if m in sys.modules]\n"
+            "print(','.join(mods))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code],
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ''
+
+
+class TestGetMaintainersFile:
+    """Tests for MAINTAINERS caching in get_maintainers_file."""
+
+    def test_fresh_cache_skips_fetch(self, tmp_path: Path) -> None:
+        """A fresh cached copy is returned without touching the network."""
+        from unittest.mock import MagicMock
+        from korgalore.cli import get_maintainers_file
+        cached = tmp_path / 'MAINTAINERS'
+        cached.write_text('cached\n')
+        session = MagicMock()
+        assert get_maintainers_file(tmp_path, session) == cached
+        session.get.assert_not_called()
+
+    def test_stale_cache_used_when_fetch_fails(self, tmp_path: Path) -> None:
+        """A stale cached copy is used if the download fails."""
+        import os
+        from unittest.mock import MagicMock
+        from korgalore.cli import get_maintainers_file
+        cached = tmp_path / 'MAINTAINERS'
+        cached.write_text('stale\n')
+        os.utime(cached, (0, 0))
+        session = MagicMock()
+        session.get.side_effect = OSError('network down')
+        assert get_maintainers_file(tmp_path, session) == cached
+        assert cached.read_text() == 'stale\n'
+
+    def test_missing_cache_and_fetch_failure_raises(self, tmp_path: Path) -> None:
+        """Without any cached copy a failed download is an error."""
+        import click
+        import pytest
+        from unittest.mock import MagicMock
+        from korgalore.cli import get_maintainers_file
+        session = MagicMock()
+        session.get.side_effect = OSError('network down')
+        with pytest.raises(click.ClickException):
+            get_maintainers_file(tmp_path, session)
+
+
+class TestValidateConfig:
+    """Tests for validate_config_text and validate_config_file."""
+
+    def test_valid_text(self) -> None:
+        """Well-formed TOML validates cleanly."""
+        from korgalore.cli import validate_config_text
+        assert validate_config_text("[targets.personal]\ntype = 'gmail'\n") == (True, "")
+
+    def test_invalid_text(self) -> None:
+        """Syntax errors are reported without raising."""
+        from korgalore.cli import validate_config_text
+        is_valid, error = validate_config_text("[targets.personal\n")
+        assert not is_valid
+        assert error.startswith("TOML syntax error")
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """A missing file is reported as not found."""
+        from korgalore.cli import validate_config_file
+        is_valid, error = validate_config_file(tmp_path / 'nope.toml')
+        assert not is_valid
+        assert "not found" in error
+
+    def test_file_delegates_to_text(self, tmp_path: Path) -> None:
+        """File validation gives the same verdict as text validation."""
+        from korgalore.cli import validate_config_file
+        cfg = tmp_path / 'korgalore.toml'
+        cfg.write_text("[gui]\nsync_interval = 300\n")
+        assert validate_config_file(cfg) == (True, "")
+        cfg.write_text("[gui\n")
+        assert validate_config_file(cfg)[0] is False
@@ -336,3 +336,422 @@ class TestSubfolderValidation:
 
         _, _, _, subfolder = ctx.obj['deliveries']['test-delivery']
         assert subfolder is None
+
+
+class TestPerformPullTargets:
+    """Tests for delivering to one or more targets in perform_pull."""
+
+    @staticmethod
+    def _make_feed(feed_key: str, commits: Dict[str, bytes]) -> MagicMock:
+        from korgalore.pi_feed import PIFeed
+        feed = MagicMock()
+        feed.feed_key = feed_key
+        feed.get_latest_commits_for_delivery.return_value = [(0, c) for c in commits]
+        feed.is_noop_commit.return_value = False
+        feed.get_message_at_commit.side_effect = lambda epoch, commit: commits[commit]
+        feed.parse_headers_only.side_effect = PIFeed.parse_headers_only
+        return feed
+
+    @staticmethod
+    def _make_target(identifier: str) -> MagicMock:
+        target = MagicMock()
+        target.identifier = identifier
+        target.import_messages.side_effect = lambda raws, **kwargs: [None] * len(raws)
+        return target
+
+    @patch('korgalore.cli.map_deliveries')
+    @patch('korgalore.cli.map_tracked_threads')
+    @patch('korgalore.cli.lock_all_feeds')
+    @patch('korgalore.cli.unlock_all_feeds')
+    @patch('korgalore.cli.retry_all_failed_deliveries')
+    @patch('korgalore.cli.update_all_feeds')
+    @patch('korgalore.cli.update_tracked_thread_activity')
+    def test_results_merged_across_targets(self, *mocks: MagicMock) -> None:
+        """Deliveries to several targets are all counted and disconnected."""
+        from korgalore.cli import perform_pull
+
+        mock_update = mocks[1]
+        feed_a = self._make_feed('feed-a', {'a1': b'Message-ID: <a1@x>\n\nbody\n',
+                                            'a2': b'Message-ID: <a2@x>\n\nbody\n'})
+        feed_b = self._make_feed('feed-b', {'b1': b'Message-ID: <b1@x>\n\nbody\n'})
+        target_one = self._make_target('one')
+        target_two = self._make_target('two')
+        mock_update.return_value = (['feed-a', 'feed-b'], [])
+        mocks[5].return_value = ['db']
+
+        ctx = click.Context(click.Command('test'))
+        ctx.ensure_object(dict)
+        ctx.obj['config'] = {'deliveries': {'da': {}, 'db': {}}}
+        ctx.obj['deliveries'] = {
+            'da': (feed_a, target_one, ['INBOX'], None),
+            'db': (feed_b, target_two, ['INBOX'], None),
+        }
+        ctx.obj['feeds'] = {'feed-a': feed_a, 'feed-b': feed_b}
+        ctx.obj['targets'] = {'one': target_one, 'two': target_two}
+        ctx.obj['bozofilter'] = set()
+        ctx.obj['hide_bar'] = True
+
+        changes, msgids = perform_pull(ctx, no_update=False, force=False, delivery_name=None)
+
+        assert changes == {'da': 2, 'db': 1}
+        assert msgids == {'<a1@x>', '<a2@x>', '<b1@x>'}
+        assert ctx.obj['tracked_ids'] == {'db'}
+        target_one.disconnect.assert_called_once()
+        target_two.disconnect.assert_called_once()
+        assert ctx.obj['targets'] == {}
+
+    @patch('korgalore.cli.map_deliveries')
+    @patch('korgalore.cli.map_tracked_threads')
+    @patch('korgalore.cli.lock_all_feeds')
+    @patch('korgalore.cli.unlock_all_feeds')
+    @patch('korgalore.cli.retry_all_failed_deliveries')
+    @patch('korgalore.cli.update_all_feeds')
+    @patch('korgalore.cli.update_tracked_thread_activity')
+    def test_no_new_commits_skips_targets(self, *mocks: MagicMock) -> None:
+        """Updated feeds with nothing new for a delivery never touch the target."""
+        from korgalore.cli import perform_pull
+
+        mock_update, mock_unlock = mocks[1], mocks[3]
+        feed_a = self._make_feed('feed-a', {})
+        target_one = self._make_target('one')
+        mock_update.return_value = (['feed-a'], [])
+
+        ctx = click.Context(click.Command('test'))
+        ctx.ensure_object(dict)
+        ctx.obj['config'] = {'deliveries': {'da': {}}}
+        ctx.obj['deliveries'] = {'da': (feed_a, target_one, ['INBOX'], None)}
+        ctx.obj['feeds'] = {'feed-a': feed_a}
+        ctx.obj['targets'] = {'one': target_one}
+        ctx.obj['bozofilter'] = frozenset()
+        ctx.obj['hide_bar'] = True
+
+        assert perform_pull(ctx, no_update=False, force=False, delivery_name=None) == ({}, set())
+        target_one.connect.assert_not_called()
+        target_one.disconnect.assert_not_called()
+        mock_unlock.assert_called_once()
+
+    def test_target_connected_once_per_run(self) -> None:
+        """A per-message target is connected once, not for every message."""
+        from korgalore.cli import _deliver_target
+
+        feed = self._make_feed('feed-a', {'a1': b'Message-ID: <a1@x>\n\nbody\n',
+                                          'a2': b'Message-ID: <a2@x>\n\nbody\n',
+                                          'a3': b'Message-ID: <a3@x>\n\nbody\n'})
+        target = MagicMock(spec=['connect', 'import_message', 'disconnect'])
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'da': (feed, target, ['INBOX'], None)}
+        ctx.obj['targets'] = {'one': target}
+
+        work = [('da', feed.get_latest_commits_for_delivery('da'))]
+        changes, msgids = _deliver_target(ctx, 'one', work, set(), None, True)
+
+        assert changes == {'da': 3}
+        assert target.import_message.call_count == 3
+        target.connect.assert_called_once()
+        target.disconnect.assert_called_once()
+
+    def test_skipped_only_batch_not_counted(self) -> None:
+        """Deliveries whose messages were all skipped report no changes."""
+        from korgalore.cli import _deliver_target
+
+        feed = self._make_feed('feed-a', {'a1': b'', 'a2': b''})
+        feed.is_noop_commit.return_value = True
+        target = self._make_target('one')
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'da': (feed, target, ['INBOX'], None)}
+        ctx.obj['targets'] = {'one': target}
+
+        work = [('da', feed.get_latest_commits_for_delivery('da'))]
+        assert _deliver_target(ctx, 'one', work, set(), None, True) == ({}, set())
+
+    def test_cancelled_target_delivers_nothing(self) -> None:
+        """A set cancel token stops deliveries before the next batch."""
+        import threading
+        from korgalore.cli import _deliver_target
+
+        feed = self._make_feed('feed-a', {'a1': b'Message-ID: <a1@x>\n\nbody\n'})
+        target = self._make_target('one')
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'da': (feed, target, ['INBOX'], None)}
+        ctx.obj['targets'] = {'one': target}
+        cancel = threading.Event()
+        cancel.set()
+
+        work = [('da', feed.get_latest_commits_for_delivery('da'))]
+        assert _deliver_target(ctx, 'one', work, set(), None, True,
+                               cancel_token=cancel) == ({}, set())
+        target.import_messages.assert_not_called()
+        target.disconnect.assert_called_once()
+
+    def test_cancelled_feed_updates_stop_early(self) -> None:
+        """Feeds after cancellation are not updated."""
+        import threading
+        from korgalore.cli import update_all_feeds
+
+        cancel = threading.Event()
+        feed_a = MagicMock(feed_url='https://a', STATUS_UPDATED=1, STATUS_INITIALIZED=2)
+        feed_b = MagicMock(feed_url='https://b', STATUS_UPDATED=1, STATUS_INITIALIZED=2)
+        feed_a.update_feed.side_effect = lambda: cancel.set() or 1
+        ctx = create_mock_context({})
+        ctx.obj['feeds'] = {'feed-a': feed_a, 'feed-b': feed_b}
+        ctx.obj['hide_bar'] = True
+
+        # One worker, so feed-b can only start after feed-a has finished
+        with patch('korgalore.cli.MAX_FEED_UPDATE_WORKERS', 1):
+            updated, _ = update_all_feeds(ctx, cancel_token=cancel)
+
+        assert updated == ['feed-a']
+        feed_b.update_feed.assert_not_called()
+
+    def test_feed_updates_run_concurrently(self) -> None:
+        """Feeds are updated in parallel, and results keep the configured order."""
+        import threading
+        from korgalore.cli import update_all_feeds
+
+        # Every feed waits for all the others to start, which only works
+        # if they are updated at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def make_update(status: int) -> Any:
+            def update() -> int:
+                barrier.wait()
+                return status
+            return update
+
+        feeds = {}
+        for key, status in (('feed-a', 1), ('feed-b', 0), ('feed-c', 3)):
+            feed = MagicMock(feed_url=f'https://{key}', STATUS_UPDATED=1, STATUS_INITIALIZED=2)
+            feed.update_feed.side_effect = make_update(status)
+            feeds[key] = feed
+        ctx = create_mock_context({})
+        ctx.obj['feeds'] = feeds
+        ctx.obj['hide_bar'] = True
+
+        assert update_all_feeds(ctx) == (['feed-a', 'feed-c'], ['feed-c'])
+
+    def test_connect_failure_skips_target(self) -> None:
+        """If the target cannot connect, nothing is marked as failed."""
+        from korgalore.cli import _deliver_target
+
+        feed = self._make_feed('feed-a', {'a1': b'Message-ID: <a1@x>\n\nbody\n'})
+        target = self._make_target('one')
+        target.connect.side_effect = RuntimeError('boom')
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'da': (feed, target, ['INBOX'], None)}
+        ctx.obj['targets'] = {'one': target}
+
+        work = [('da', feed.get_latest_commits_for_delivery('da'))]
+        changes, msgids = _deliver_target(ctx, 'one', work, set(), None, True)
+
+        assert changes == {}
+        assert msgids == set()
+        target.import_messages.assert_not_called()
+        feed.mark_failed_delivery.assert_not_called()
+
+
+class TestUploadMessages:
+    """Tests for upload_messages, used when yanking threads."""
+
+    RAWS = [f'Message-ID: <{n}@x>\nSubject: {n}\n\nbody\n'.encode() for n in range(3)]
+
+    def test_batched_target(self) -> None:
+        """Targets with import_messages get one call for the whole thread."""
+        from korgalore import RemoteError
+        from korgalore.cli import upload_messages
+
+        target = MagicMock(spec=['import_messages'])
+        target.import_messages.return_value = [None, RemoteError('nope'), None]
+        progress = MagicMock()
+
+        assert upload_messages(target, self.RAWS, ['INBOX'], progress=progress) == (2, 1)
+        target.import_messages.assert_called_once_with(self.RAWS, labels=['INBOX'])
+        progress.assert_called_once_with(3)
+
+    def test_per_message_target(self) -> None:
+        """Other targets get one import_message call per message."""
+        from korgalore import RemoteError
+        from korgalore.cli import upload_messages
+
+        target = MagicMock(spec=['import_message'])
+        target.import_message.side_effect = [None, RemoteError('nope'), None]
+
+        assert upload_messages(target, self.RAWS, ['INBOX']) == (2, 1)
+        assert target.import_message.call_count == 3
+
+
+class TestDeliverTargetBailOut:
+    """Tests for giving up on a target after repeated failures."""
+
+    @staticmethod
+    def _run(target: MagicMock, count: int) -> Dict[str, int]:
+        from korgalore.cli import _deliver_target
+
+        commits = {f'c{i}': f'Message-ID: <{i}@x>\n\nbody\n'.encode() for i in range(count)}
+        feed = TestPerformPullTargets._make_feed('feed-a', commits)
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'d1': (feed, target, ['INBOX'], None)}
+        changes, _ = _deliver_target(ctx, 'one', [('d1', [(0, c) for c in commits])],
+                                     frozenset(), None, True)
+        return changes
+
+    def test_dead_target_abandoned_early(self) -> None:
+        """A target that fails everything gets no more than the failure limit."""
+        from korgalore import RemoteError
+        from korgalore.cli import MAX_CONSECUTIVE_FAILURES
+
+        target = TestPerformPullTargets._make_target('one')
+        target.import_messages.side_effect = lambda raws, **kwargs: [RemoteError('down')] * len(raws)
+
+        assert self._run(target, 100) == {}
+        attempted = sum(len(c.args[0]) for c in target.import_messages.call_args_list)
+        assert attempted == MAX_CONSECUTIVE_FAILURES
+
+    def test_healthy_target_gets_full_batches(self) -> None:
+        """Once a target has taken a message, batches grow to full size."""
+        from korgalore.cli import DELIVERY_BATCH_SIZE, MAX_CONSECUTIVE_FAILURES
+
+        target = TestPerformPullTargets._make_target('one')
+
+        assert self._run(target, 100) == {'d1': 100}
+        sizes = [len(c.args[0]) for c in target.import_messages.call_args_list]
+        assert sizes[:2] == [MAX_CONSECUTIVE_FAILURES, DELIVERY_BATCH_SIZE]
+        assert sum(sizes) == 100
+
+
+class TestSharedMessageCache:
+    """Tests for reading commits shared by several deliveries once."""
+
+    def test_shared_message_read_once_and_released(self) -> None:
+        """A shared commit is read once and dropped after its last consumer."""
+        from korgalore.cli import SharedMessageCache
+
+        feed = MagicMock(feed_key='feed-a')
+        feed.get_message_at_commit.return_value = b'raw'
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}})
+
+        assert cache.get(feed, 0, 'c1', 'one') == b'raw'
+        assert cache.get(feed, 0, 'c1', 'two') == b'raw'
+        assert feed.get_message_at_commit.call_count == 1
+        assert cache._messages == {}
+
+        # Unshared commits go straight to the feed
+        cache.get(feed, 0, 'c2', 'one')
+        assert feed.get_message_at_commit.call_count == 2
+
+    def test_same_target_does_not_pin_message(self) -> None:
+        """A second delivery to the same target reads again instead of caching."""
+        from korgalore.cli import SharedMessageCache
+
+        feed = MagicMock(feed_key='feed-a')
+        feed.get_message_at_commit.return_value = b'raw'
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}})
+
+        # Target 'one' takes its share; the message stays for 'two' only
+        assert cache.get(feed, 0, 'c1', 'one') == b'raw'
+        assert cache.get(feed, 0, 'c1', 'one') == b'raw'
+        assert cache._remaining == {('feed-a', 0, 'c1'): {'two'}}
+        assert feed.get_message_at_commit.call_count == 1
+
+        # Once 'two' has it nothing is held, and 'one' reads from git again
+        cache.get(feed, 0, 'c1', 'two')
+        assert cache._messages == {}
+        cache.get(feed, 0, 'c1', 'one')
+        assert feed.get_message_at_commit.call_count == 2
+
+    def test_reads_happen_outside_the_lock(self) -> None:
+        """Different shared commits are read concurrently; one commit is read once."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from korgalore.cli import SharedMessageCache
+
+        barrier = threading.Barrier(2, timeout=5)
+        feed = MagicMock(feed_key='feed-a')
+
+        def read(epoch: int, commit: str) -> bytes:
+            # Both distinct commits must be in flight at once to get past this
+            barrier.wait()
+            return commit.encode()
+        feed.get_message_at_commit.side_effect = read
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}, ('feed-a', 0, 'c2'): {'one', 'two'}})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(lambda c: cache.get(feed, 0, c, 'one'), ['c1', 'c2'])) == [b'c1', b'c2']
+        assert cache.get(feed, 0, 'c1', 'two') == b'c1'
+        assert cache.get(feed, 0, 'c2', 'two') == b'c2'
+        assert feed.get_message_at_commit.call_count == 2
+        assert cache._messages == {}
+
+    def test_release_drops_abandoned_messages(self) -> None:
+        """Commits a delivery gives up no longer pin their shared message."""
+        from korgalore.cli import SharedMessageCache
+
+        feed = MagicMock(feed_key='feed-a')
+        feed.get_message_at_commit.return_value = b'raw'
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}, ('feed-a', 0, 'c2'): {'one', 'two'}})
+
+        cache.get(feed, 0, 'c1', 'one')
+        assert ('feed-a', 0, 'c1') in cache._messages
+        cache.release('two', 'feed-a', [(0, 'c1'), (0, 'c2')])
+        assert cache._messages == {}
+        assert cache._remaining == {('feed-a', 0, 'c2'): {'one'}}
+
+    def test_unreachable_target_releases_its_reads(self) -> None:
+        """A target that cannot connect gives up its share of cached messages."""
+        from korgalore.cli import SharedMessageCache, _deliver_target
+
+        feed = MagicMock(feed_key='feed-a')
+        target = MagicMock()
+        target.connect.side_effect = OSError('down')
+        ctx = create_mock_context({})
+        ctx.obj['deliveries'] = {'d1': (feed, target, ['INBOX'], None)}
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}})
+
+        _deliver_target(ctx, 'one', [('d1', [(0, 'c1')])], frozenset(), None, True, cache)
+
+        assert cache._remaining == {('feed-a', 0, 'c1'): {'two'}}
+
+    def test_failed_read_retried_by_next_consumer(self) -> None:
+        """A failed read is not cached; the next consumer reads again."""
+        from korgalore import GitError
+        from korgalore.cli import SharedMessageCache
+
+        feed = MagicMock(feed_key='feed-a')
+        feed.get_message_at_commit.side_effect = [GitError('boom'), b'raw']
+        cache = SharedMessageCache({('feed-a', 0, 'c1'): {'one', 'two'}})
+
+        with pytest.raises(GitError):
+            cache.get(feed, 0, 'c1', 'one')
+        assert cache.get(feed, 0, 'c1', 'two') == b'raw'
+        assert cache._messages == {}
+
+    @patch('korgalore.cli.map_deliveries')
+    @patch('korgalore.cli.map_tracked_threads')
+    @patch('korgalore.cli.lock_all_feeds')
+    @patch('korgalore.cli.unlock_all_feeds')
+    @patch('korgalore.cli.retry_all_failed_deliveries')
+    @patch('korgalore.cli.update_all_feeds')
+    @patch('korgalore.cli.update_tracked_thread_activity')
+    def test_pull_reads_shared_feed_once(self, *mocks: MagicMock) -> None:
+        """Two deliveries of one feed to two targets read each commit once."""
+        from korgalore.cli import perform_pull
+
+        feed = TestPerformPullTargets._make_feed('feed-a', {'a1': b'Message-ID: <a1@x>\n\nbody\n'})
+        target_one = TestPerformPullTargets._make_target('one')
+        target_two = TestPerformPullTargets._make_target('two')
+        mocks[1].return_value = (['feed-a'], [])
+
+        ctx = create_mock_context({})
+        ctx.obj['config']['deliveries'] = {'d1': {}, 'd2': {}}
+        ctx.obj['deliveries'] = {
+            'd1': (feed, target_one, ['INBOX'], None),
+            'd2': (feed, target_two, ['lists'], None),
+        }
+        ctx.obj['feeds'] = {'feed-a': feed}
+        ctx.obj['targets'] = {'one': target_one, 'two': target_two}
+        ctx.obj['bozofilter'] = frozenset()
+        ctx.obj['hide_bar'] = True
+
+        changes, _ = perform_pull(ctx, no_update=False, force=False, delivery_name=None)
+
+        assert changes == {'d1': 1, 'd2': 1}
+        feed.get_message_at_commit.assert_called_once_with(0, 'a1')
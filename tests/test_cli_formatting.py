@@ -1,4 +1,5 @@
 from korgalore import format_key_for_display
+from korgalore.cli import parse_labels
 
 
 def test_format_key_for_display_lei() -> None:
@@ -27,3 +28,12 @@ def test_format_key_for_display_other() -> None:
 def test_format_key_for_display_none() -> None:
     # None should return empty string
     assert format_key_for_display(None) == ""
+
+def test_parse_labels() -> None:
+    # Separate and comma-delimited values are flattened
+    assert parse_labels(('INBOX', 'UNREAD,CATEGORY_FORUMS')) == ['INBOX', 'UNREAD', 'CATEGORY_FORUMS']
+    # Whitespace around labels is stripped and empty entries are dropped
+    assert parse_labels((' INBOX , UNREAD ,,custom ', ' other')) == ['INBOX', 'UNREAD', 'custom', 'other']
+    # Nothing in, nothing out
+    assert parse_labels(()) == []
+    assert parse_labels(('  ',)) == []
@@ -450,3 +450,15 @@ class TestGetGitdir:
         """High epoch numbers work correctly."""
         feed = create_feed_with_epochs(tmp_path, [999])
         assert feed.get_gitdir(999) == feed.feed_dir / "git" / "999.git"
+
+    def test_paths_built_once(self, tmp_path: Path) -> None:
+        """Repeated lookups return the same Path objects."""
+        feed = create_feed_with_epochs(tmp_path, [0, 1])
+        assert feed.get_gitdir(1) is feed.get_gitdir(1)
+        assert feed.get_gitdir(0) is not feed.get_gitdir(1)
+        info = feed._get_state_file_path('my-delivery', 'info')
+        assert info == feed.feed_dir / "korgalore.my-delivery.info"
+        assert feed._get_state_file_path('my-delivery', 'info') is info
+        assert feed._get_state_file_path('my-delivery', 'failed') != info
+        assert feed._get_state_file_path(None, 'feed') == feed.feed_dir / "korgalore.feed"
+        assert feed._get_state_file_path('', 'feed') is feed._get_state_file_path(None, 'feed')
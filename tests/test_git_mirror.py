@@ -8,7 +8,7 @@ import pytest
 
 from korgalore import run_git_command
 from korgalore.cli import get_lore_node
-from korgalore.lore_feed import LoreFeed
+from korgalore.lore_feed import EpochInfo, LoreFeed
 
 
 class TestRunGitCommandConfig:
@@ -79,6 +79,29 @@ class TestRunGitCommandConfig:
             assert '-c' not in cmd
 
 
+class TestRunGitCommandStrip:
+    """Tests for the strip parameter in run_git_command."""
+
+    def test_output_stripped_by_default(self) -> None:
+        """stdout and stderr are stripped unless asked otherwise."""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=b'abc\ndef\n', stderr=b'warning\n'
+            )
+            assert run_git_command(None, ['rev-list', 'HEAD']) == (0, b'abc\ndef', b'warning')
+
+    def test_strip_false_returns_stdout_as_is(self) -> None:
+        """strip=False hands back the very stdout buffer git produced."""
+        stdout = b'abc\ndef\n'
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0, stdout=stdout, stderr=b'warning\n'
+            )
+            retcode, output, error = run_git_command(None, ['rev-list', 'HEAD'], strip=False)
+            assert output is stdout
+            assert error == b'warning'
+
+
 class TestGitMirrorConfig:
     """Tests for LoreFeed._git_mirror_config()."""
 
@@ -142,8 +165,7 @@ class TestCloneEpochMirror:
 
         with patch('korgalore.lore_feed.run_git_command', return_value=(0, b'', b'')) as mock_git:
             feed.clone_epoch(0)
-            mock_git.assert_called_once()
-            _, kwargs = mock_git.call_args
+            _, kwargs = mock_git.call_args_list[0]
             assert kwargs['git_config'] == {
                 'url.https://tor.lore.kernel.org/.insteadOf': 'https://lore.kernel.org/',
             }
@@ -164,11 +186,12 @@ class TestCloneEpochMirror:
 
         with patch('korgalore.lore_feed.run_git_command') as mock_git:
             # First call (shallow) fails, second call (--depth=1) succeeds
-            mock_git.side_effect = [(128, b'', b'shallow error'), (0, b'', b'')]
+            mock_git.side_effect = [(128, b'', b'shallow error'), (0, b'', b''), (0, b'', b'')]
             feed.clone_epoch(0, shallow=True)
-            assert mock_git.call_count == 2
+            clone_calls = [c for c in mock_git.call_args_list if c[0][1][0] == 'clone']
+            assert len(clone_calls) == 2
             # Both calls should have the mirror config
-            for c in mock_git.call_args_list:
+            for c in clone_calls:
                 assert c[1]['git_config'] == expected_config
 
     def test_clone_no_mirror_when_canonical_is_fastest(self, tmp_path: Path) -> None:
@@ -183,9 +206,41 @@ class TestCloneEpochMirror:
 
         with patch('korgalore.lore_feed.run_git_command', return_value=(0, b'', b'')) as mock_git:
             feed.clone_epoch(0)
-            _, kwargs = mock_git.call_args
+            _, kwargs = mock_git.call_args_list[0]
             assert kwargs['git_config'] == {}
 
+    def test_shallow_clone_is_blobless(self, tmp_path: Path) -> None:
+        """Shallow clones skip blobs, then drop the filter for later fetches."""
+        mock_node = MagicMock()
+        mock_node.origins = ['https://lore.kernel.org']
+        mock_node.canonical_origin = 'https://lore.kernel.org'
+
+        feed_dir = tmp_path / 'test-feed'
+        feed_dir.mkdir()
+        feed = LoreFeed('test', feed_dir, 'https://lore.kernel.org/lkml', lore_node=mock_node)
+
+        with patch('korgalore.lore_feed.run_git_command', return_value=(0, b'', b'')) as mock_git:
+            feed.clone_epoch(0)
+            clone_args = mock_git.call_args_list[0][0][1]
+            assert '--filter=blob:none' in clone_args
+            assert mock_git.call_args_list[1] == call(
+                str(feed.get_gitdir(0)), ['config', '--unset', 'remote.origin.partialclonefilter'])
+
+    def test_full_clone_fetches_blobs(self, tmp_path: Path) -> None:
+        """Full clones of new epochs keep every blob, since all of it is delivered."""
+        mock_node = MagicMock()
+        mock_node.origins = ['https://lore.kernel.org']
+        mock_node.canonical_origin = 'https://lore.kernel.org'
+
+        feed_dir = tmp_path / 'test-feed'
+        feed_dir.mkdir()
+        feed = LoreFeed('test', feed_dir, 'https://lore.kernel.org/lkml', lore_node=mock_node)
+
+        with patch('korgalore.lore_feed.run_git_command', return_value=(0, b'', b'')) as mock_git:
+            feed.clone_epoch(0, shallow=False)
+            mock_git.assert_called_once()
+            assert not any(a.startswith('--filter') for a in mock_git.call_args[0][1])
+
 
 class TestUpdateFeedMirror:
     """Tests for mirror config being passed to update_feed git fetch."""
@@ -223,7 +278,7 @@ class TestUpdateFeedMirror:
         manifest = {'/lkml/git/0.git': {'fingerprint': 'changed'}}
         manifest_bytes = gzip.compress(json.dumps(manifest).encode())
         mock_response = MagicMock()
-        mock_response.content = manifest_bytes
+        mock_response.raw = io.BytesIO(manifest_bytes)
         mock_response.raise_for_status = MagicMock()
         mock_node.request.return_value = mock_response
 
@@ -244,6 +299,65 @@ class TestUpdateFeedMirror:
             assert kwargs['git_config'] == expected_config
 
 
+class TestGetManifest:
+    """Tests for streaming the gzipped manifest."""
+
+    def test_manifest_streamed_through_gzip(self, tmp_path: Path) -> None:
+        """The manifest is decoded from the raw stream, and the response closed."""
+        import gzip
+        import io
+        import json
+        manifest = {'/lkml/git/0.git': {'fingerprint': 'abc'},
+                    '/lkml/git/1.git': {'fingerprint': 'def'}}
+        response = MagicMock()
+        response.raw = io.BytesIO(gzip.compress(json.dumps(manifest).encode()))
+        mock_node = MagicMock()
+        mock_node.request.return_value = response
+
+        feed = LoreFeed('test', tmp_path, 'https://lore.kernel.org/lkml', lore_node=mock_node)
+
+        assert feed.get_manifest() == manifest
+        mock_node.request.assert_called_once_with(
+            'GET', 'https://lore.kernel.org/lkml/manifest.js.gz', stream=True)
+        assert response.raw.decode_content is True
+        response.close.assert_called_once()
+
+    def test_corrupt_manifest_still_closes_response(self, tmp_path: Path) -> None:
+        """A manifest that fails to decode does not leak the connection."""
+        import io
+        response = MagicMock()
+        response.raw = io.BytesIO(b'not gzip')
+        mock_node = MagicMock()
+        mock_node.request.return_value = response
+
+        feed = LoreFeed('test', tmp_path, 'https://lore.kernel.org/lkml', lore_node=mock_node)
+
+        with pytest.raises(OSError):
+            feed.get_manifest()
+        response.close.assert_called_once()
+
+
+class TestGetManifestEpochs:
+    """Tests for extracting epochs from the manifest."""
+
+    def test_epochs_sorted_numerically(self, tmp_path: Path) -> None:
+        """Epochs come back in numeric order; unrecognised keys are skipped."""
+        manifest = {'/lkml/git/10.git': {'fingerprint': 'ten'},
+                    '/lkml/git/2.git': {'fingerprint': 'two'},
+                    '/lkml/git/all.git': {'fingerprint': 'bogus'},
+                    '/lkml/git/3.git.bak': {'fingerprint': 'bogus'}}
+        feed = LoreFeed('test', tmp_path, 'https://lore.kernel.org/lkml', lore_node=MagicMock())
+
+        with patch.object(feed, 'get_manifest', return_value=manifest):
+            epochs = feed.get_manifest_epochs()
+
+        assert epochs == [EpochInfo(2, '/lkml/git/2.git', 'two'),
+                          EpochInfo(10, '/lkml/git/10.git', 'ten')]
+        assert feed.load_epochs_info() == epochs
+        # Slotted, so a long epoch list carries no per-entry __dict__
+        assert not hasattr(epochs[0], '__dict__')
+
+
 class TestGetLoreNode:
     """Tests for get_lore_node() origin-based caching."""
 
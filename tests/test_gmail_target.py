@@ -1,12 +1,34 @@
 """Tests for GmailTarget message delivery."""
 
 import base64
+import json
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch, MagicMock
 
 from korgalore import ConfigurationError, RemoteError
+from korgalore import gmail_target
 from korgalore.gmail_target import GmailTarget, SCOPES
 
+# Unpatched helper; the autouse fixture below replaces the module attribute
+_REAL_TOKEN_MTIME_NS = gmail_target._token_mtime_ns
+
+
+@pytest.fixture(autouse=True)
+def token_stat_follows_exists() -> Any:
+    """Make token file lookups follow the os.path.exists mocks used below.
+
+    Also clears the parsed-token cache so tests never see each other's
+    credentials.
+    """
+    import os
+    gmail_target._load_token_cached.cache_clear()
+    with patch('korgalore.gmail_target._token_mtime_ns',
+               side_effect=lambda path: 1 if os.path.exists(path) else None):
+        yield
+    gmail_target._load_token_cached.cache_clear()
+
 
 class TestGmailTargetInit:
     """Tests for GmailTarget initialization."""
@@ -33,9 +55,9 @@ class TestGmailTargetInit:
     @patch('korgalore.gmail_target.Credentials')
     @patch('korgalore.gmail_target.Request')
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
+    @patch('korgalore.gmail_target.atomic_write_text')
     def test_refreshes_expired_token(
-        self, mock_file: MagicMock, mock_exists: MagicMock,
+        self, mock_write: MagicMock, mock_exists: MagicMock,
         mock_request: MagicMock, mock_credentials: MagicMock
     ) -> None:
         """Refreshes expired credentials with refresh token."""
@@ -50,14 +72,14 @@ class TestGmailTargetInit:
         GmailTarget("test", "/path/to/creds.json", "/path/to/token.json")
 
         mock_creds.refresh.assert_called_once()
-        mock_file.assert_called_with("/path/to/token.json", 'w')
+        mock_write.assert_called_once_with(Path("/path/to/token.json"), '{"token": "refreshed"}')
 
     @patch('korgalore.gmail_target.Credentials')
     @patch('korgalore.gmail_target.InstalledAppFlow')
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
+    @patch('korgalore.gmail_target.atomic_write_text')
     def test_runs_oauth_flow_when_no_token(
-        self, mock_file: MagicMock, mock_exists: MagicMock,
+        self, mock_write: MagicMock, mock_exists: MagicMock,
         mock_flow_class: MagicMock, mock_credentials: MagicMock
     ) -> None:
         """Runs OAuth flow when no token exists."""
@@ -89,6 +111,34 @@ class TestGmailTargetInit:
         assert "not found" in str(exc_info.value)
         assert "creds.json" in str(exc_info.value)
 
+    @patch('os.path.exists')
+    def test_missing_credentials_file_raises_non_interactive(self, mock_exists: MagicMock) -> None:
+        """Missing credentials file is a config error in GUI mode too."""
+        mock_exists.return_value = False
+
+        with pytest.raises(ConfigurationError):
+            GmailTarget("test", "/nonexistent/creds.json", "/path/to/token.json", interactive=False)
+
+    @patch('korgalore.gmail_target.Credentials')
+    @patch('korgalore.gmail_target.Request')
+    def test_revoked_token_replaces_old_invalid_file(
+        self, mock_request: MagicMock, mock_credentials: MagicMock, tmp_path: Any
+    ) -> None:
+        """A revoked token is moved over any older .invalid copy."""
+        from google.auth.exceptions import RefreshError
+        token = tmp_path / 'token.json'
+        token.write_text('new')
+        (tmp_path / 'token.json.invalid').write_text('old')
+        mock_creds = MagicMock(valid=False, expired=True, refresh_token='r')
+        mock_creds.refresh.side_effect = RefreshError('revoked')
+        mock_credentials.from_authorized_user_file.return_value = mock_creds
+
+        target = GmailTarget("test", str(tmp_path / 'creds.json'), str(token), interactive=False)
+
+        assert target.needs_auth
+        assert not token.exists()
+        assert (tmp_path / 'token.json.invalid').read_text() == 'new'
+
     @patch('korgalore.gmail_target.Credentials')
     @patch('os.path.exists')
     def test_expands_user_paths(
@@ -130,7 +180,7 @@ class TestGmailTargetInit:
 class TestGmailTargetConnect:
     """Tests for GmailTarget connect method."""
 
-    @patch('korgalore.gmail_target.build')
+    @patch('korgalore.gmail_target.build_from_document')
     @patch('korgalore.gmail_target.Credentials')
     @patch('os.path.exists')
     def test_connect_builds_service(
@@ -149,10 +199,11 @@ class TestGmailTargetConnect:
         target = GmailTarget("test", "/path/to/creds.json", "/path/to/token.json")
         target.connect()
 
-        mock_build.assert_called_once_with('gmail', 'v1', credentials=mock_creds, cache_discovery=False)
+        mock_build.assert_called_once_with(json.loads(gmail_target._gmail_discovery_document()),
+                                           credentials=mock_creds)
         assert target.service is mock_service
 
-    @patch('korgalore.gmail_target.build')
+    @patch('korgalore.gmail_target.build_from_document')
     @patch('korgalore.gmail_target.Credentials')
     @patch('os.path.exists')
     def test_connect_idempotent(
@@ -176,6 +227,40 @@ class TestGmailTargetConnect:
         assert mock_build.call_count == 1
 
 
+class TestGmailCredentialCache:
+    """Tests for the token and discovery document caches."""
+
+    @patch('korgalore.gmail_target.Credentials')
+    def test_token_parsed_once_per_file_version(self, mock_credentials: MagicMock) -> None:
+        """The same token file version is only parsed once."""
+        first = gmail_target._load_token_cached('/path/to/token.json', 1)
+        second = gmail_target._load_token_cached('/path/to/token.json', 1)
+        gmail_target._load_token_cached('/path/to/token.json', 2)
+
+        assert first is second
+        assert mock_credentials.from_authorized_user_file.call_count == 2
+
+    def test_token_mtime(self, tmp_path: Any) -> None:
+        """Token mtime is read with one stat, None when the file is missing."""
+        token = tmp_path / 'token.json'
+        assert _REAL_TOKEN_MTIME_NS(str(token)) is None
+        token.write_text('{}')
+        assert _REAL_TOKEN_MTIME_NS(str(token)) == token.stat().st_mtime_ns
+
+    def test_discovery_document_is_gmail(self) -> None:
+        """The bundled discovery document describes the Gmail API."""
+        doc = json.loads(gmail_target._gmail_discovery_document())
+        assert doc['name'] == 'gmail'
+        assert 'users' in doc['resources']
+
+    def test_service_description_is_fresh_copy(self) -> None:
+        """Each parsed description is independent, since building mutates it."""
+        first = gmail_target._gmail_service_description()
+        second = gmail_target._gmail_service_description()
+        assert first == second
+        assert first is not second
+
+
 class TestGmailTargetListLabels:
     """Tests for GmailTarget list_labels method."""
 
@@ -315,6 +400,27 @@ class TestGmailTargetTranslateLabels:
         # list() should only be called once
         assert target.service.users().labels().list().execute.call_count == 1
 
+    def test_translate_reuses_result_per_label_list(self) -> None:
+        """The same label list is only translated once."""
+        target = self._create_target_with_service()
+        target._label_map = {"INBOX": "INBOX", "MyLabel": "Label_123"}
+
+        first = target.translate_labels(["INBOX", "MyLabel"])
+        assert target.translate_labels(("INBOX", "MyLabel")) is first
+        assert target.translate_labels(["MyLabel"]) == ["Label_123"]
+
+    def test_connect_preloads_label_map(self) -> None:
+        """connect() loads the label map before any import."""
+        target = self._create_target_with_service()
+        assert target.service is not None
+        target.service.users().labels().list().execute.return_value = {
+            "labels": [{"id": "Label_123", "name": "MyLabel"}]
+        }
+
+        target.connect()
+
+        assert target._label_map == {"MyLabel": "Label_123"}
+
 
 class TestGmailTargetImportMessage:
     """Tests for GmailTarget import_message method."""
@@ -430,6 +536,74 @@ class TestGmailTargetImportMessage:
         assert "not found" in str(exc_info.value)
 
 
+class _FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback: Any, failures: Dict[int, Exception]) -> None:
+        self.callback = callback
+        self.failures = failures
+        self.request_ids: List[str] = []
+
+    def add(self, request: Any, request_id: str) -> None:
+        self.request_ids.append(request_id)
+
+    def execute(self) -> None:
+        for request_id in self.request_ids:
+            exc = self.failures.get(int(request_id))
+            self.callback(request_id, None if exc else {"id": request_id}, exc)
+
+
+class TestGmailTargetImportMessages:
+    """Tests for GmailTarget batched import_messages method."""
+
+    def _create_target_with_service(self, failures: Optional[Dict[int, Exception]] = None) -> GmailTarget:
+        """Create a target whose service hands out fake batches."""
+        with patch('korgalore.gmail_target.Credentials') as mock_creds_class, \
+             patch('os.path.exists', return_value=True):
+            mock_creds = MagicMock()
+            mock_creds.valid = True
+            mock_creds_class.from_authorized_user_file.return_value = mock_creds
+            target = GmailTarget("test", "/creds.json", "/token.json")
+
+        target.service = MagicMock()
+        target._label_map = {"INBOX": "INBOX", "MyLabel": "Label_123"}
+        self.batches: List[_FakeBatch] = []
+
+        def _new_batch(callback: Any) -> _FakeBatch:
+            batch = _FakeBatch(callback, failures or {})
+            self.batches.append(batch)
+            return batch
+
+        target.service.new_batch_http_request.side_effect = _new_batch
+        return target
+
+    def test_all_messages_imported(self) -> None:
+        """Successful batch returns no errors and uses one batch request."""
+        target = self._create_target_with_service()
+        errors = target.import_messages([b"One", b"Two", b"Three"], ["MyLabel"])
+        assert errors == [None, None, None]
+        assert len(self.batches) == 1
+        assert self.batches[0].request_ids == ["0", "1", "2"]
+        import_call = target.service.users().messages().import_  # type: ignore
+        assert import_call.call_args[1]['body']['labelIds'] == ["Label_123"]
+
+    def test_per_message_failures_reported(self) -> None:
+        """A failing call only marks its own message as failed."""
+        target = self._create_target_with_service(failures={1: Exception("boom")})
+        errors = target.import_messages([b"One", b"Two", b"Three"], ["INBOX"])
+        assert errors[0] is None
+        assert isinstance(errors[1], RemoteError)
+        assert errors[2] is None
+
+    def test_splits_into_api_sized_batches(self) -> None:
+        """More than GMAIL_BATCH_LIMIT messages are split across batches."""
+        from korgalore.gmail_target import GMAIL_BATCH_LIMIT
+        target = self._create_target_with_service()
+        errors = target.import_messages([b"msg"] * (GMAIL_BATCH_LIMIT + 1), [])
+        assert errors == [None] * (GMAIL_BATCH_LIMIT + 1)
+        assert [len(b.request_ids) for b in self.batches] == [GMAIL_BATCH_LIMIT, 1]
+
+
 class TestGmailTargetEdgeCases:
     """Edge case tests."""
 
@@ -503,9 +677,9 @@ class TestGmailTargetEdgeCases:
     @patch('korgalore.gmail_target.Credentials')
     @patch('korgalore.gmail_target.InstalledAppFlow')
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
+    @patch('korgalore.gmail_target.atomic_write_text')
     def test_token_saved_after_oauth_flow(
-        self, mock_file: MagicMock, mock_exists: MagicMock,
+        self, mock_write: MagicMock, mock_exists: MagicMock,
         mock_flow_class: MagicMock, mock_credentials: MagicMock
     ) -> None:
         """Token is saved after OAuth flow completes."""
@@ -520,9 +694,32 @@ class TestGmailTargetEdgeCases:
         GmailTarget("test", "/path/to/creds.json", "/path/to/token.json")
 
         # Verify token was written
-        mock_file.assert_called_with("/path/to/token.json", 'w')
-        handle = mock_file()
-        handle.write.assert_called_once_with('{"access_token": "new_token"}')
+        mock_write.assert_called_once_with(Path("/path/to/token.json"),
+                                           '{"access_token": "new_token"}')
+
+    @patch('korgalore.gmail_target.build_from_document')
+    @patch('korgalore.gmail_target.InstalledAppFlow')
+    def test_reauthenticate_rebuilds_service_from_memory(
+        self, mock_flow_class: MagicMock, mock_build: MagicMock, tmp_path: Any
+    ) -> None:
+        """Re-authentication saves the token atomically and reuses the new creds."""
+        target = GmailTarget.__new__(GmailTarget)
+        target.identifier = "test"
+        target._credentials_file = str(tmp_path / 'creds.json')
+        target._token_file = str(tmp_path / 'token.json')
+        target._needs_auth = True
+        target.service = None
+        new_creds = MagicMock()
+        new_creds.to_json.return_value = '{"token": "fresh"}'
+        mock_flow_class.from_client_secrets_file.return_value.run_local_server.return_value = new_creds
+
+        target.reauthenticate()
+
+        assert not target.needs_auth
+        assert (tmp_path / 'token.json').read_text() == '{"token": "fresh"}'
+        assert not (tmp_path / 'token.json.tmp').exists()
+        assert mock_build.call_args.kwargs['credentials'] is new_creds
+        assert target.service is mock_build.return_value
 
     def test_label_names_are_case_sensitive(self) -> None:
         """Label name matching is case-sensitive."""
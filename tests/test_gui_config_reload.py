@@ -1,7 +1,8 @@
 """Tests for GUI config change detection and reload logic.
 
 These tests exercise _get_config_mtime, _check_reload_config, and the
-mtime update in _run_edit_config without requiring GTK or AppIndicator3.
+mtime update after the config editor exits without requiring GTK or
+AppIndicator3.
 """
 
 import os
@@ -41,6 +42,7 @@ def _make_app(ctx: click.Context) -> 'KorgaloreApp':
     gui_config = config.get('gui', {})
     app.sync_interval = gui_config.get('sync_interval', 300)
     app._config_mtime = app._get_config_mtime()
+    app._targets_version = 0
     return app
 
 
@@ -274,35 +276,51 @@ class TestCheckReloadConfig:
 
 
 class TestEditConfigMtimeUpdate:
-    """Test that _run_edit_config updates _config_mtime after reload."""
+    """Test that the config editor exit handler updates _config_mtime."""
 
     @patch('korgalore.gui.load_config')
     @patch('korgalore.gui.validate_config_file', return_value=(True, ''))
-    @patch('subprocess.Popen')
     def test_edit_config_updates_mtime(
-        self, mock_popen: MagicMock, mock_validate: MagicMock,
-        mock_load: MagicMock, tmp_path: Path
+        self, mock_validate: MagicMock, mock_load: MagicMock, tmp_path: Path
     ) -> None:
         cfgpath = tmp_path / 'korgalore.toml'
         cfgpath.write_text('[main]\n')
         mock_load.return_value = {'gui': {'sync_interval': 300}}
-        mock_proc = MagicMock()
-        mock_popen.return_value = mock_proc
 
         ctx = _make_ctx({'gui': {}}, cfgpath)
         app = _make_app(ctx)
 
-        # Patch get_xdg_config_dir so _run_edit_config uses our temp path
-        with patch('korgalore.gui.get_xdg_config_dir', return_value=tmp_path):
-            old_mtime = app._config_mtime
-            # Bump file mtime so there is something newer to record
-            future = time.time() + 100
-            os.utime(cfgpath, (future, future))
+        old_mtime = app._config_mtime
+        # Bump file mtime so there is something newer to record
+        future = time.time() + 100
+        os.utime(cfgpath, (future, future))
 
-            app._run_edit_config()
+        app._on_config_edited(cfgpath)
 
         assert app._config_mtime > old_mtime
         # Subsequent _check_reload_config should not trigger a reload
         with patch('korgalore.gui.validate_config_file') as v:
             app._check_reload_config()
             v.assert_not_called()
+
+    def test_editor_watched_from_main_loop(self, tmp_path: Path) -> None:
+        """The editor is spawned async and its exit runs the reload handler."""
+        cfgpath = tmp_path / 'korgalore.toml'
+        ctx = _make_ctx({'gui': {}}, cfgpath)
+        app = _make_app(ctx)
+        on_exit = MagicMock()
+
+        with patch('korgalore.gui.GLib') as glib:
+            glib.spawn_async.return_value = (1234, None, None, None)
+            app._spawn_editor(cfgpath, on_exit)
+
+            assert glib.spawn_async.call_args.args[0] == ['xdg-open', str(cfgpath)]
+            watch_args = glib.child_watch_add.call_args.args
+            assert watch_args[1] == 1234
+            on_exit.assert_not_called()
+
+            # Simulate the child watch firing when the editor exits
+            callback, *data = watch_args[2:]
+            callback(1234, 0, *data)
+            glib.spawn_close_pid.assert_called_once_with(1234)
+            on_exit.assert_called_once_with(cfgpath)
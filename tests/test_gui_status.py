@@ -0,0 +1,350 @@
+"""Tests for GUI status and timer handling.
+
+These tests exercise KorgaloreApp methods without requiring GTK or
+AppIndicator3; GLib and the widgets are replaced with mocks.
+"""
+
+import threading
+from typing import Any, Dict, Iterator, TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+if TYPE_CHECKING:
+    from korgalore.gui import KorgaloreApp
+
+
+@pytest.fixture
+def glib() -> Iterator[MagicMock]:
+    """Replace the GLib module used by the GUI."""
+    with patch('korgalore.gui.GLib') as mock_glib:
+        yield mock_glib
+
+
+def _make_app() -> 'KorgaloreApp':
+    """Construct a KorgaloreApp with mocked widgets and no GTK."""
+    from korgalore.gui import KorgaloreApp
+
+    app = object.__new__(KorgaloreApp)
+    app.ind = MagicMock()
+    app.item_status = MagicMock()
+    app._status_lock = threading.Lock()
+    app._status_pending = None
+    app._status_scheduled = False
+    app._current_label = None
+    app._current_icon = None
+    app._last_status_drain = 0.0
+    return app
+
+
+class TestUpdateStatus:
+    """Tests for coalesced status updates."""
+
+    def test_burst_schedules_one_idle_callback(self, glib: MagicMock) -> None:
+        """Many updates before the main loop runs schedule a single callback."""
+        app = _make_app()
+        for i in range(50):
+            app.update_status(f'Syncing {i}', 'system-run-symbolic')
+        glib.idle_add.assert_called_once_with(app._drain_status,
+                                              priority=glib.PRIORITY_LOW)
+
+    def test_drain_applies_latest_status(self, glib: MagicMock) -> None:
+        """Only the most recent status reaches the widgets."""
+        app = _make_app()
+        app.update_status('first', 'system-run-symbolic')
+        app.update_status('last', 'mail-read-symbolic')
+
+        assert app._drain_status() is False
+        app.item_status.set_label.assert_called_once_with('last')
+        app.ind.set_icon.assert_called_once_with('mail-read-symbolic')
+
+    def test_update_after_drain_schedules_again(self, glib: MagicMock) -> None:
+        """Once drained, the next update schedules a new callback."""
+        app = _make_app()
+        app.update_status('one')
+        app._drain_status()
+        app.update_status('two')
+        assert glib.idle_add.call_count == 2
+        app._drain_status()
+        app.item_status.set_label.assert_called_with('two')
+        app.ind.set_icon.assert_not_called()
+
+    def test_pull_progress_rate_limited(self, glib: MagicMock) -> None:
+        """Pull progress refreshes at most every interval and keeps the latest update."""
+        from korgalore.gui import PULL_STATUS_INTERVAL
+
+        app = _make_app()
+        with patch('korgalore.gui.time.monotonic', side_effect=[100.0, 100.0, 100.05]):
+            app._pull_status('Delivering A...')
+            app._drain_status()
+            # Within the interval: deferred rather than dropped
+            app._pull_status('Delivering B...')
+            app._pull_status('Delivering C...')
+        glib.idle_add.assert_called_once()
+        glib.timeout_add.assert_called_once()
+        assert 0 < glib.timeout_add.call_args.args[0] <= PULL_STATUS_INTERVAL * 1000
+
+        with patch('korgalore.gui.time.monotonic', return_value=100.1):
+            app._drain_status()
+        app.item_status.set_label.assert_called_with('Delivering C...')
+
+    def test_unchanged_label_and_icon_not_resent(self, glib: MagicMock) -> None:
+        """Repeating the current status does not touch the widgets again."""
+        app = _make_app()
+        app.update_status('Syncing...', 'system-run-symbolic')
+        app._drain_status()
+        app.update_status('Syncing...', 'system-run-symbolic')
+        app._drain_status()
+        app.update_status('Fetching lkml', 'system-run-symbolic')
+        app._drain_status()
+
+        assert app.item_status.set_label.call_count == 2
+        app.ind.set_icon.assert_called_once_with('system-run-symbolic')
+
+
+class TestTimerSchedule:
+    """Tests for the event-driven "Next sync" label refresh."""
+
+    def _timer_app(self, seconds_left: float) -> 'KorgaloreApp':
+        import time
+        app = _make_app()
+        app.item_next_sync = MagicMock()
+        app.is_syncing = False
+        app.network_available = True
+        app.next_sync_time = time.time() + seconds_left
+        app._timer_source = None
+        app._menu_visible = True
+        app._last_next_sync_label = None
+        return app
+
+    @pytest.mark.parametrize('seconds_left, interval', [
+        (600, 60), (125, 60), (90, 10), (25, 10), (15, 1), (-5, 1),
+    ])
+    def test_interval_follows_label_granularity(self, seconds_left: float,
+                                                interval: int) -> None:
+        """Ticks are spaced by how often the label text can change."""
+        app = self._timer_app(seconds_left)
+        assert app._next_timer_interval() == interval
+
+    def test_static_states_tick_slowly(self) -> None:
+        """While syncing or offline the label does not count down."""
+        app = self._timer_app(5)
+        app.is_syncing = True
+        assert app._next_timer_interval() == 60
+        app.is_syncing = False
+        app.network_available = False
+        assert app._next_timer_interval() == 60
+
+    def test_tick_is_one_shot(self, glib: MagicMock) -> None:
+        """Each tick updates the label and schedules exactly one successor."""
+        app = self._timer_app(600)
+        glib.timeout_add_seconds.return_value = 42
+        assert app._on_timer_tick() is False
+        app.item_next_sync.set_label.assert_called_once_with('Next sync: ~10 min')
+        glib.timeout_add_seconds.assert_called_once_with(60, app._on_timer_tick)
+        assert app._timer_source == 42
+
+    def test_reschedule_replaces_pending_tick(self, glib: MagicMock) -> None:
+        """Rescheduling removes the pending source before adding a new one."""
+        app = self._timer_app(5)
+        app._timer_source = 7
+        glib.timeout_add_seconds.return_value = 8
+        app._reschedule_timers()
+        glib.source_remove.assert_called_once_with(7)
+        glib.timeout_add_seconds.assert_called_once_with(1, app._on_timer_tick)
+        assert app._timer_source == 8
+
+    @pytest.mark.parametrize('seconds_left, label', [
+        (7200.5, 'Next sync: ~120 min'), (3600.5, 'Next sync: ~60 min'), (150.5, 'Next sync: ~3 min'),
+        (89.5, 'Next sync: ~1 min'), (55.5, 'Next sync: ~60 sec'),
+        (41.5, 'Next sync: ~50 sec'), (5.5, 'Next sync: in 5s'),
+        (-1, 'Next sync: Soon...'),
+    ])
+    def test_label_text(self, seconds_left: float, label: str) -> None:
+        """Countdown labels round to minutes, then up to tens of seconds."""
+        app = self._timer_app(seconds_left)
+        app.update_timers()
+        app.item_next_sync.set_label.assert_called_once_with(label)
+
+    def test_unchanged_label_not_resent(self) -> None:
+        """The label is only set again when its text changes."""
+        app = self._timer_app(600)
+        app.update_timers()
+        app.update_timers()
+        app.item_next_sync.set_label.assert_called_once()
+
+    def test_hidden_menu_makes_no_gtk_calls(self, glib: MagicMock) -> None:
+        """Hiding the menu cancels the tick; nothing runs until it is shown."""
+        app = self._timer_app(50)
+        app._timer_source = 7
+        app._on_menu_hide(None)
+        glib.source_remove.assert_called_once_with(7)
+
+        app._reschedule_timers()
+        assert app._on_timer_tick() is False
+        app.item_next_sync.set_label.assert_not_called()
+        glib.timeout_add_seconds.assert_not_called()
+
+        app._on_menu_show(None)
+        app.item_next_sync.set_label.assert_called_once_with('Next sync: ~50 sec')
+        glib.timeout_add_seconds.assert_called_once_with(10, app._on_timer_tick)
+
+
+class TestBackgroundWorker:
+    """Tests for the event-driven background sync loop."""
+
+    def _worker_app(self) -> 'KorgaloreApp':
+        app = _make_app()
+        app.is_syncing = False
+        app.next_sync_time = 0.0
+        app.stop_event = threading.Event()
+        app._sync_wake = threading.Event()
+        return app
+
+    def test_wake_triggers_due_sync_and_stop_exits(self) -> None:
+        """A wake with a due deadline syncs; stopping ends the loop at once."""
+        import time
+        app = self._worker_app()
+        synced = threading.Event()
+
+        def _fake_sync() -> None:
+            app.next_sync_time = time.time() + 3600
+            synced.set()
+
+        app.run_sync = _fake_sync  # type: ignore[method-assign]
+        worker = threading.Thread(target=app.background_worker, daemon=True)
+        worker.start()
+
+        # The initial sync is two seconds out; pull it in and wake the worker
+        app.next_sync_time = 0.0
+        app._sync_wake.set()
+        assert synced.wait(timeout=5)
+
+        # The next sync is an hour away, yet stopping returns immediately
+        app.stop_event.set()
+        app._sync_wake.set()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+    def test_sync_now_wakes_worker_instead_of_new_thread(self) -> None:
+        """Sync Now hands the sync to the existing worker thread."""
+        app = self._worker_app()
+        app.next_sync_time = 1e12
+        with patch('korgalore.gui.threading.Thread') as mock_thread:
+            app.on_sync_now(None)
+        mock_thread.assert_not_called()
+        assert app.next_sync_time == 0
+        assert app._sync_wake.is_set()
+
+    def test_sync_now_ignored_while_syncing(self) -> None:
+        """A click during a running sync does not queue another one."""
+        app = self._worker_app()
+        app.is_syncing = True
+        app.on_sync_now(None)
+        assert not app._sync_wake.is_set()
+
+
+class TestYankDialog:
+    """Tests for reusing the yank dialog between openings."""
+
+    def _yank_app(self, targets: Dict[str, Any]) -> 'KorgaloreApp':
+        import click
+        app = _make_app()
+        app.ctx = click.Context(click.Command('test'))
+        app.ctx.obj = {'config': {'targets': targets}}
+        app._yank_dialog = None
+        app._yank_targets = ()
+        app._no_targets_dialog = None
+        app._targets_version = 0
+        app._refresh_config_snapshot()
+        return app
+
+    def test_dialog_built_once_and_hidden(self) -> None:
+        """Opening twice reuses the widgets and only hides them."""
+        with patch('korgalore.gui.Gtk') as gtk:
+            app = self._yank_app({'work': {}, 'personal': {}})
+            gtk.Dialog.return_value.run.return_value = gtk.ResponseType.CANCEL
+            app._show_yank_dialog()
+            app._show_yank_dialog()
+
+            gtk.Dialog.assert_called_once()
+            dialog = gtk.Dialog.return_value
+            assert dialog.run.call_count == 2
+            assert dialog.hide.call_count == 2
+            dialog.destroy.assert_not_called()
+
+    def test_combo_repopulated_only_when_targets_change(self) -> None:
+        """The target combo is rebuilt only for a different target list."""
+        with patch('korgalore.gui.Gtk') as gtk:
+            app = self._yank_app({'work': {}, 'personal': {}})
+            gtk.Dialog.return_value.run.return_value = gtk.ResponseType.CANCEL
+            combo = gtk.ComboBoxText.return_value
+            app._show_yank_dialog()
+            app._show_yank_dialog()
+            combo.remove_all.assert_called_once()
+            assert combo.append_text.call_count == 2
+
+            # Target changes are picked up after a config reload
+            app.ctx.obj['config']['targets'] = {'work': {}}
+            app._show_yank_dialog()
+            assert combo.remove_all.call_count == 1
+            app._refresh_config_snapshot()
+            app._show_yank_dialog()
+            assert combo.remove_all.call_count == 2
+            combo.set_visible.assert_called_with(False)
+
+    def test_no_targets_dialog_reused(self) -> None:
+        """The "no targets" error dialog is built once and only hidden."""
+        with patch('korgalore.gui.Gtk') as gtk:
+            app = self._yank_app({})
+            assert app._show_yank_dialog() is False
+            assert app._show_yank_dialog() is False
+
+            gtk.MessageDialog.assert_called_once()
+            dialog = gtk.MessageDialog.return_value
+            assert dialog.run.call_count == 2
+            assert dialog.hide.call_count == 2
+            dialog.destroy.assert_not_called()
+            gtk.Dialog.assert_not_called()
+
+
+class TestRunAuthenticate:
+    """Tests for re-authentication dispatch."""
+
+    def _auth_app(self, target: Any) -> 'KorgaloreApp':
+        import click
+        app = _make_app()
+        app.ctx = click.Context(click.Command('test'))
+        app.ctx.obj = {'targets': {'personal': target}}
+        app.auth_needed_target = 'personal'
+        app.next_sync_time = 1e12
+        app._sync_wake = threading.Event()
+        return app
+
+    def test_reauth_capable_target(self, glib: MagicMock) -> None:
+        """Targets advertising supports_reauth are re-authenticated and synced."""
+        target = MagicMock(supports_reauth=True)
+        app = self._auth_app(target)
+        app._run_authenticate()
+        target.reauthenticate.assert_called_once_with()
+        assert app.auth_needed_target is None
+        assert app._sync_wake.is_set()
+
+    def test_target_without_reauth(self, glib: MagicMock) -> None:
+        """Targets without the capability are reported, not called."""
+        target = MagicMock(supports_reauth=False)
+        app = self._auth_app(target)
+        app._run_authenticate()
+        target.reauthenticate.assert_not_called()
+        assert app.auth_needed_target == 'personal'
+
+
+def test_import_does_not_load_gi() -> None:
+    """Importing the GUI module defers the GTK bindings until first use."""
+    import subprocess
+    import sys
+    code = ('import sys, korgalore.gui as g; '
+            'assert g.HAS_GTK is None; '
+            'assert "gi" not in sys.modules; '
+            'assert "korgalore.gmail_target" not in sys.modules')
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -1,12 +1,22 @@
 """Tests for ImapTarget message delivery."""
 
 import imaplib
+import ssl
 import pytest
 from pathlib import Path
+from typing import Any, List, Tuple
 from unittest.mock import patch, MagicMock
 
 from korgalore import ConfigurationError, RemoteError
-from korgalore.imap_target import ImapTarget
+from korgalore.imap_target import DeliveredCache, ImapTarget, ResumingIMAP4SSL, close_all
+
+
+@pytest.fixture(autouse=True)
+def empty_connection_pool() -> Any:
+    """Keep pooled connections from leaking between tests."""
+    close_all()
+    yield
+    close_all()
 
 
 class TestImapTargetInit:
@@ -142,11 +152,21 @@ class TestImapTargetInit:
         )
         assert target.imap is None
 
+    def test_password_target_does_not_support_reauth(self) -> None:
+        """Only OAuth2 targets advertise re-authentication."""
+        target = ImapTarget(
+            identifier="test",
+            server="imap.example.com",
+            username="user@example.com",
+            password="secret"
+        )
+        assert target.supports_reauth is False
+
 
 class TestImapTargetConnect:
     """Tests for ImapTarget connect method."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_success(self, mock_imap_class: MagicMock) -> None:
         """Successful connection and authentication."""
         mock_imap = MagicMock()
@@ -167,7 +187,7 @@ class TestImapTargetConnect:
         mock_imap.select.assert_called_once_with("INBOX", readonly=True)
         assert target.imap is mock_imap
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_custom_folder(self, mock_imap_class: MagicMock) -> None:
         """Connection verifies custom folder."""
         mock_imap = MagicMock()
@@ -186,7 +206,7 @@ class TestImapTargetConnect:
 
         mock_imap.select.assert_called_once_with("Archive/Important", readonly=True)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_custom_timeout(self, mock_imap_class: MagicMock) -> None:
         """Connection uses custom timeout."""
         mock_imap = MagicMock()
@@ -205,7 +225,7 @@ class TestImapTargetConnect:
 
         mock_imap_class.assert_called_once_with("imap.example.com", timeout=300)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_auth_failure(self, mock_imap_class: MagicMock) -> None:
         """Authentication failure raises RemoteError."""
         mock_imap = MagicMock()
@@ -224,7 +244,7 @@ class TestImapTargetConnect:
         assert "authentication failed" in str(exc_info.value)
         assert "imap.example.com" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_folder_not_found_status(self, mock_imap_class: MagicMock) -> None:
         """Folder not found (bad status) raises ConfigurationError."""
         mock_imap = MagicMock()
@@ -245,7 +265,7 @@ class TestImapTargetConnect:
         assert "does not exist" in str(exc_info.value)
         assert "NonExistent" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_folder_not_found_exception(self, mock_imap_class: MagicMock) -> None:
         """Folder not found (exception) raises ConfigurationError."""
         mock_imap = MagicMock()
@@ -265,7 +285,7 @@ class TestImapTargetConnect:
             target.connect()
         assert "does not exist" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_connect_idempotent(self, mock_imap_class: MagicMock) -> None:
         """Multiple connect() calls don't reconnect."""
         mock_imap = MagicMock()
@@ -290,7 +310,7 @@ class TestImapTargetConnect:
 class TestImapTargetImportMessage:
     """Tests for ImapTarget import_message method."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_success(self, mock_imap_class: MagicMock) -> None:
         """Successful message import."""
         mock_imap = MagicMock()
@@ -312,7 +332,7 @@ class TestImapTargetImportMessage:
         assert result == [b'[APPENDUID 1234 5678]']
         mock_imap.append.assert_called_once()
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_to_correct_folder(self, mock_imap_class: MagicMock) -> None:
         """Message is appended to correct folder."""
         mock_imap = MagicMock()
@@ -334,7 +354,7 @@ class TestImapTargetImportMessage:
         call_args = mock_imap.append.call_args[0]
         assert call_args[0] == "Archive"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_crlf_normalization_unix(self, mock_imap_class: MagicMock) -> None:
         """Unix line endings (LF) are converted to CRLF."""
         mock_imap = MagicMock()
@@ -358,7 +378,7 @@ class TestImapTargetImportMessage:
         normalized = call_args[3]
         assert normalized == b"From: a@b.com\r\nTo: c@d.com\r\n\r\nBody\r\nLine2"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_crlf_normalization_mixed(self, mock_imap_class: MagicMock) -> None:
         """Mixed line endings are normalized to CRLF."""
         mock_imap = MagicMock()
@@ -382,7 +402,7 @@ class TestImapTargetImportMessage:
         normalized = call_args[3]
         assert normalized == b"Line1\r\nLine2\r\nLine3\r\nLine4\r\n"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_crlf_already_normalized(self, mock_imap_class: MagicMock) -> None:
         """Already-normalized CRLF messages are not double-converted."""
         mock_imap = MagicMock()
@@ -407,7 +427,7 @@ class TestImapTargetImportMessage:
         # Should remain the same, not become \r\r\n
         assert normalized == b"From: a@b.com\r\nTo: c@d.com\r\n\r\nBody"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_labels_ignored(self, mock_imap_class: MagicMock) -> None:
         """Labels parameter is accepted but ignored."""
         mock_imap = MagicMock()
@@ -428,7 +448,7 @@ class TestImapTargetImportMessage:
         result = target.import_message(b"Test", ["INBOX", "Important", "Custom"])
         assert result is not None
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_auto_connects(self, mock_imap_class: MagicMock) -> None:
         """import_message auto-connects if not connected."""
         mock_imap = MagicMock()
@@ -451,7 +471,7 @@ class TestImapTargetImportMessage:
         mock_imap.login.assert_called_once()
         mock_imap.append.assert_called_once()
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_append_failure_status(self, mock_imap_class: MagicMock) -> None:
         """APPEND returning non-OK status raises RemoteError."""
         mock_imap = MagicMock()
@@ -472,7 +492,7 @@ class TestImapTargetImportMessage:
             target.import_message(b"Test", [])
         assert "APPEND failed" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_append_exception(self, mock_imap_class: MagicMock) -> None:
         """APPEND raising exception raises RemoteError."""
         mock_imap = MagicMock()
@@ -493,7 +513,7 @@ class TestImapTargetImportMessage:
             target.import_message(b"Test", [])
         assert "Failed to append" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_connection_error(self, mock_imap_class: MagicMock) -> None:
         """Connection error during import raises RemoteError."""
         mock_imap = MagicMock()
@@ -514,7 +534,7 @@ class TestImapTargetImportMessage:
             target.import_message(b"Test", [])
         assert "delivery failed" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_multiple_messages(self, mock_imap_class: MagicMock) -> None:
         """Multiple messages can be imported."""
         mock_imap = MagicMock()
@@ -537,10 +557,312 @@ class TestImapTargetImportMessage:
         assert mock_imap.append.call_count == 5
 
 
+class TestImapTargetImportMessages:
+    """Tests for ImapTarget.import_messages method."""
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_reports_per_message_errors(self, mock_imap_class: MagicMock) -> None:
+        """A failed APPEND is reported without stopping the batch."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.append.side_effect = [
+            ('OK', [b'Done']),
+            ('NO', [b'Quota exceeded']),
+            ('OK', [b'Done']),
+        ]
+
+        target = ImapTarget(
+            identifier="test",
+            server="imap.example.com",
+            username="user@example.com",
+            password="secret"
+        )
+        target.connect()
+
+        errors = target.import_messages([b"One", b"Two", b"Three"], [])
+        assert errors[0] is None
+        assert isinstance(errors[1], RemoteError)
+        assert errors[2] is None
+        assert mock_imap.append.call_count == 3
+        mock_imap_class.assert_called_once()
+
+
+class TestImapTargetPreload:
+    """Tests for looking up existing Message-IDs in bulk."""
+
+    @staticmethod
+    def _connected_target(mock_imap_class: MagicMock) -> Tuple[ImapTarget, MagicMock]:
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.append.return_value = ('OK', [b'Done'])
+        target = ImapTarget(
+            identifier="test",
+            server="imap.example.com",
+            username="user@example.com",
+            password="secret"
+        )
+        target.connect()
+        return target, mock_imap
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_preload_builds_single_or_search(self, mock_imap_class: MagicMock) -> None:
+        """Several Message-IDs are looked up with one UID SEARCH and one FETCH."""
+        target, mock_imap = self._connected_target(mock_imap_class)
+
+        def uid(command: str, *args: str) -> Tuple[str, List[Any]]:
+            if command == 'SEARCH':
+                return ('OK', [b'7'])
+            return ('OK', [(b'1 (UID 7 BODY[HEADER.FIELDS (MESSAGE-ID)] {20}',
+                            b'Message-ID: <b@x>\r\n\r\n'), b')'])
+        mock_imap.uid.side_effect = uid
+
+        existing = target.preload_existing_message_ids(['<a@x>', '<b@x>', '<c@x>'])
+
+        assert existing == {'<b@x>'}
+        assert mock_imap.uid.call_count == 2
+        search_args = mock_imap.uid.call_args_list[0][0]
+        assert search_args == ('SEARCH', 'OR', 'OR',
+                               'HEADER', 'Message-ID', '<a@x>',
+                               'HEADER', 'Message-ID', '<b@x>',
+                               'HEADER', 'Message-ID', '<c@x>')
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_preload_batches_searches(self, mock_imap_class: MagicMock) -> None:
+        """Lookups are split into batches of PRELOAD_BATCH_SIZE."""
+        from korgalore.imap_target import PRELOAD_BATCH_SIZE
+        target, mock_imap = self._connected_target(mock_imap_class)
+        mock_imap.uid.return_value = ('OK', [b''])
+
+        msgids = [f'<{i}@x>' for i in range(PRELOAD_BATCH_SIZE + 1)]
+        assert target.preload_existing_message_ids(msgids) == set()
+        assert mock_imap.uid.call_count == 2
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_import_messages_skips_preloaded_duplicates(self, mock_imap_class: MagicMock) -> None:
+        """import_messages uses the bulk lookup instead of per-message searches."""
+        target, mock_imap = self._connected_target(mock_imap_class)
+
+        def uid(command: str, *args: str) -> Tuple[str, List[Any]]:
+            if command == 'SEARCH':
+                return ('OK', [b'3'])
+            return ('OK', [(b'1 (UID 3 BODY[HEADER.FIELDS (MESSAGE-ID)] {20}',
+                            b'message-id: <one@x>\r\n\r\n'), b')'])
+        mock_imap.uid.side_effect = uid
+
+        raws = [b'Message-ID: <one@x>\r\n\r\nBody', b'Message-ID: <two@x>\r\n\r\nBody',
+                b'Message-ID: <two@x>\r\n\r\nBody']
+        assert target.import_messages(raws, []) == [None, None, None]
+
+        # Only <two@x> is appended, and only once
+        assert mock_imap.append.call_count == 1
+        mock_imap.search.assert_not_called()
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_failed_preload_falls_back_to_search(self, mock_imap_class: MagicMock) -> None:
+        """Message-IDs that could not be looked up are checked individually."""
+        target, mock_imap = self._connected_target(mock_imap_class)
+        mock_imap.uid.side_effect = imaplib.IMAP4.error('too complex')
+        mock_imap.search.return_value = ('OK', [b''])
+
+        raws = [b'Message-ID: <one@x>\r\n\r\nBody', b'Message-ID: <two@x>\r\n\r\nBody']
+        assert target.import_messages(raws, []) == [None, None]
+        assert mock_imap.search.call_count == 2
+        assert mock_imap.append.call_count == 2
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_disconnect_forgets_lookups(self, mock_imap_class: MagicMock) -> None:
+        """Preloaded results only apply to the connection they came from."""
+        target, mock_imap = self._connected_target(mock_imap_class)
+        mock_imap.uid.return_value = ('OK', [b''])
+        target.preload_existing_message_ids(['<a@x>'])
+        target.disconnect()
+        assert target._known_msgids == {}
+
+
+class TestImapTargetPipelinedAppend:
+    """Tests for pipelining APPEND commands on LITERAL+ servers."""
+
+    @staticmethod
+    def _literal_plus_target(mock_imap_class: MagicMock) -> Tuple[ImapTarget, MagicMock]:
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.uid.return_value = ('OK', [b''])
+        mock_imap.capabilities = ('IMAP4REV1', 'LITERAL+')
+        mock_imap.utf8_enabled = False
+        mock_imap._encoding = 'ascii'
+        mock_imap.tagged_commands = {}
+        tags = iter(f'T{i}'.encode() for i in range(1, 1000))
+        mock_imap._new_tag.side_effect = lambda: next(tags)
+        target = ImapTarget(identifier="test", server="imap.example.com",
+                            username="user@example.com", password="secret")
+        target.connect()
+        return target, mock_imap
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_appends_sent_before_responses_read(self, mock_imap_class: MagicMock) -> None:
+        """All APPENDs in a window go out before any response is awaited."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap._command_complete.side_effect = lambda name, tag: (
+            ('NO', [b'Quota exceeded']) if tag == b'T2' else ('OK', [b'[APPENDUID 1 5] Done']))
+
+        raws = [b'Message-ID: <a@x>\n\nOne\n', b'Message-ID: <b@x>\n\nTwo\n',
+                b'Message-ID: <c@x>\n\nThree\n']
+        errors = target.import_messages(raws, [])
+
+        assert errors[0] is None
+        assert isinstance(errors[1], RemoteError)
+        assert errors[2] is None
+        mock_imap.append.assert_not_called()
+        names = [c[0] for c in mock_imap.mock_calls if c[0] in ('send', '_command_complete')]
+        assert names == ['send'] * 3 + ['_command_complete'] * 3
+        first = mock_imap.send.call_args_list[0][0][0]
+        payload = b'Message-ID: <a@x>\r\n\r\nOne\r\n'
+        assert first == b'T1 APPEND INBOX {%d+}\r\n' % len(payload) + payload + b'\r\n'
+        assert target._known_msgids['INBOX'] == {'<a@x>': True, '<b@x>': False, '<c@x>': True}
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_bare_cr_sent_as_crlf(self, mock_imap_class: MagicMock) -> None:
+        """Line endings are mapped the same way imap.append() maps them."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap._command_complete.return_value = ('OK', [b'Done'])
+
+        raws = [b'Message-ID: <a@x>\n\nOne\rTwo\n', b'Message-ID: <b@x>\n\nThree\n']
+        assert target.import_messages(raws, []) == [None, None]
+        payload = b'Message-ID: <a@x>\r\n\r\nOne\r\nTwo\r\n'
+        assert mock_imap.send.call_args_list[0][0][0] == (b'T1 APPEND INBOX {%d+}\r\n' % len(payload)
+                                                          + payload + b'\r\n')
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_pipeline_depth_limits_window(self, mock_imap_class: MagicMock) -> None:
+        """Responses are drained after every APPEND_PIPELINE_DEPTH commands."""
+        from korgalore.imap_target import APPEND_PIPELINE_DEPTH
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap._command_complete.return_value = ('OK', [b'Done'])
+
+        raws = [b'Body %d\n' % i for i in range(APPEND_PIPELINE_DEPTH + 1)]
+        assert target.import_messages(raws, []) == [None] * len(raws)
+        names = [c[0] for c in mock_imap.mock_calls if c[0] in ('send', '_command_complete')]
+        assert names.index('_command_complete') == APPEND_PIPELINE_DEPTH
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_send_failure_fails_remaining(self, mock_imap_class: MagicMock) -> None:
+        """A broken socket fails the messages that could not be sent."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap.send.side_effect = [None, OSError('broken pipe')]
+
+        errors = target.import_messages([b'One\n', b'Two\n', b'Three\n'], [])
+        assert all(isinstance(e, RemoteError) for e in errors)
+        assert mock_imap.tagged_commands == {}
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_read_failure_keeps_acknowledged(self, mock_imap_class: MagicMock) -> None:
+        """A connection lost while reading responses only fails unconfirmed messages."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap._command_complete.side_effect = [('OK', [b'[APPENDUID 1 5] Done']),
+                                                   imaplib.IMAP4.abort('socket error: EOF')]
+
+        raws = [b'Message-ID: <a@x>\n\nOne\n', b'Message-ID: <b@x>\n\nTwo\n',
+                b'Message-ID: <c@x>\n\nThree\n']
+        errors = target.import_messages(raws, [])
+
+        assert errors[0] is None
+        assert isinstance(errors[1], RemoteError) and isinstance(errors[2], RemoteError)
+        assert mock_imap._command_complete.call_count == 2
+        assert mock_imap.tagged_commands == {}
+        assert target._known_msgids['INBOX']['<a@x>'] is True
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_lookup_failure_fails_per_message(self, mock_imap_class: MagicMock) -> None:
+        """A socket error during the duplicate check is reported per message."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap.search.side_effect = TimeoutError('timed out')
+
+        errors = target.import_messages([b'Message-ID: <a@x>\n\nOne\n'], [])
+
+        assert len(errors) == 1 and isinstance(errors[0], RemoteError)
+        mock_imap.send.assert_not_called()
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_no_literal_plus_uses_append(self, mock_imap_class: MagicMock) -> None:
+        """Servers without LITERAL+ get one APPEND at a time."""
+        target, mock_imap = self._literal_plus_target(mock_imap_class)
+        mock_imap.capabilities = ('IMAP4REV1',)
+        mock_imap.append.return_value = ('OK', [b'Done'])
+
+        assert target.import_messages([b'One\n', b'Two\n'], []) == [None, None]
+        assert mock_imap.append.call_count == 2
+        mock_imap.send.assert_not_called()
+
+
+class TestImapTargetSelection:
+    """Tests for reusing the selected folder between commands."""
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_folder_selected_once(self, mock_imap_class: MagicMock) -> None:
+        """Duplicate checks reuse the selection made by connect()."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.search.return_value = ('OK', [b''])
+        mock_imap.append.return_value = ('OK', [b'[APPENDUID 1 2] Done'])
+
+        target = ImapTarget(identifier="test", server="imap.example.com",
+                            username="user@example.com", password="secret")
+        target.connect()
+        for i in range(3):
+            target.import_message(f'Message-ID: <{i}@x>\r\n\r\nBody'.encode(), [])
+
+        mock_imap.select.assert_called_once_with('INBOX', readonly=True)
+        assert mock_imap.search.call_count == 3
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_uidvalidity_change_reselects(self, mock_imap_class: MagicMock) -> None:
+        """A new UIDVALIDITY in APPENDUID drops the cached selection."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.search.return_value = ('OK', [b''])
+        mock_imap.append.side_effect = [('OK', [b'[APPENDUID 1 2] Done']),
+                                        ('OK', [b'[APPENDUID 9 1] Done'])]
+
+        target = ImapTarget(identifier="test", server="imap.example.com",
+                            username="user@example.com", password="secret")
+        target.connect()
+        target.import_message(b'Message-ID: <a@x>\r\n\r\nBody', [])
+        target.import_message(b'Message-ID: <b@x>\r\n\r\nBody', [])
+        assert target._selected_folder is None
+        assert target._known_msgids['INBOX'] == {'<b@x>': True}
+
+        mock_imap.append.side_effect = None
+        mock_imap.append.return_value = ('OK', [b'[APPENDUID 9 2] Done'])
+        target.import_message(b'Message-ID: <c@x>\r\n\r\nBody', [])
+        assert mock_imap.select.call_count == 2
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_disconnect_forgets_selection(self, mock_imap_class: MagicMock) -> None:
+        """A reused connection selects the folder again."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.noop.return_value = ('OK', [b''])
+
+        target = ImapTarget(identifier="test", server="imap.example.com",
+                            username="user@example.com", password="secret")
+        target.connect()
+        target.disconnect()
+        target.connect()
+        assert mock_imap.select.call_count == 2
+
+
 class TestImapTargetEdgeCases:
     """Edge case and integration-style tests."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_binary_message_content(self, mock_imap_class: MagicMock) -> None:
         """Binary content in message is preserved."""
         mock_imap = MagicMock()
@@ -565,7 +887,7 @@ class TestImapTargetEdgeCases:
         # Binary content should pass through (with \n -> \r\n conversion)
         assert call_args[3] is not None
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_empty_message(self, mock_imap_class: MagicMock) -> None:
         """Empty message is handled."""
         mock_imap = MagicMock()
@@ -585,7 +907,7 @@ class TestImapTargetEdgeCases:
         result = target.import_message(b"", [])
         assert result is not None
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_large_message(self, mock_imap_class: MagicMock) -> None:
         """Large messages are handled."""
         mock_imap = MagicMock()
@@ -622,7 +944,7 @@ class TestImapTargetEdgeCases:
         )
         assert target.password == "direct_password"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_append_flags_and_datetime(self, mock_imap_class: MagicMock) -> None:
         """APPEND is called with empty flags and datetime."""
         mock_imap = MagicMock()
@@ -761,7 +1083,7 @@ class TestImapTargetOAuth2:
             target.reauthenticate()
         assert "not configured for OAuth2" in str(exc_info.value)
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_oauth2_connect_calls_authenticate(self, mock_imap_class: MagicMock,
                                                 tmp_path: Path) -> None:
         """OAuth2 connection uses AUTHENTICATE instead of LOGIN."""
@@ -799,7 +1121,7 @@ class TestImapTargetOAuth2:
         # Verify login was NOT called
         mock_imap.login.assert_not_called()
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_oauth2_connect_auth_failure(self, mock_imap_class: MagicMock,
                                           tmp_path: Path) -> None:
         """OAuth2 authentication failure raises RemoteError."""
@@ -834,12 +1156,188 @@ class TestImapTargetOAuth2:
         assert "XOAUTH2 authentication failed" in str(exc_info.value)
 
 
+class TestDeliveredCache:
+    """Tests for the on-disk record of delivered Message-IDs."""
+
+    def test_entries_persist_per_account_and_folder(self, tmp_path: Path) -> None:
+        """Committed entries are seen by later instances, scoped to account and folder."""
+        db = str(tmp_path / 'dedup.sqlite')
+        cache = DeliveredCache(db, 'user@imap.example.com')
+        cache.set_uidvalidity('INBOX', '42')
+        cache.add('INBOX', ['<a@x>', '<b@x>'])
+        cache.commit()
+
+        again = DeliveredCache(db, 'user@imap.example.com')
+        assert again.contains('INBOX', ['<a@x>', '<c@x>']) == {'<a@x>'}
+        assert again.contains('Other', ['<a@x>']) == set()
+        assert DeliveredCache(db, 'else@imap.example.com').contains('INBOX', ['<a@x>']) == set()
+
+    def test_new_uidvalidity_clears_folder(self, tmp_path: Path) -> None:
+        """A recreated folder loses its recorded entries."""
+        cache = DeliveredCache(str(tmp_path / 'dedup.sqlite'), 'acct')
+        cache.set_uidvalidity('INBOX', '42')
+        cache.add('INBOX', ['<a@x>'])
+        cache.set_uidvalidity('INBOX', '42')
+        assert cache.contains('INBOX', ['<a@x>']) == {'<a@x>'}
+        cache.set_uidvalidity('INBOX', '43')
+        assert cache.contains('INBOX', ['<a@x>']) == set()
+
+    def test_unusable_database_fails_open(self, tmp_path: Path) -> None:
+        """A broken database disables the cache instead of raising."""
+        db = tmp_path / 'dedup.sqlite'
+        db.write_bytes(b'this is not a database' * 100)
+        cache = DeliveredCache(str(db), 'acct')
+        cache.add('INBOX', ['<a@x>'])
+        assert cache.contains('INBOX', ['<a@x>']) == set()
+        cache.commit()
+
+    @staticmethod
+    def _make_target(db: Path) -> ImapTarget:
+        target = ImapTarget(
+            identifier="test",
+            server="imap.example.com",
+            username="user@example.com",
+            password="secret",
+            dedup_db=str(db),
+        )
+        target.connect()
+        return target
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_redelivery_skipped_without_search(self, mock_imap_class: MagicMock,
+                                               tmp_path: Path) -> None:
+        """A message delivered on an earlier run is skipped without asking the server."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.response.return_value = ('UIDVALIDITY', [b'42'])
+        mock_imap.search.return_value = ('OK', [b''])
+        mock_imap.append.return_value = ('OK', [b'[APPENDUID 42 7] Done'])
+        raw = b"Message-ID: <a@x>\r\n\r\nBody\r\n"
+
+        self._make_target(tmp_path / 'dedup.sqlite').import_message(raw, [])
+        mock_imap.append.assert_called_once()
+
+        mock_imap.reset_mock()
+        result = self._make_target(tmp_path / 'dedup.sqlite').import_message(raw, [])
+        assert result == {'skipped': True}
+        mock_imap.search.assert_not_called()
+        mock_imap.append.assert_not_called()
+        # UIDVALIDITY of the selected folder comes from the SELECT response
+        mock_imap.response.assert_called_with('UIDVALIDITY')
+        mock_imap.status.assert_not_called()
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_recreated_folder_gets_message_again(self, mock_imap_class: MagicMock,
+                                                 tmp_path: Path) -> None:
+        """After a UIDVALIDITY change the server is searched and the message re-appended."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.response.return_value = ('UIDVALIDITY', [b'42'])
+        mock_imap.search.return_value = ('OK', [b''])
+        mock_imap.append.return_value = ('OK', [b'[APPENDUID 42 7] Done'])
+        raw = b"Message-ID: <a@x>\r\n\r\nBody\r\n"
+
+        self._make_target(tmp_path / 'dedup.sqlite').import_message(raw, [])
+
+        mock_imap.reset_mock()
+        mock_imap.response.return_value = ('UIDVALIDITY', [b'99'])
+        self._make_target(tmp_path / 'dedup.sqlite').import_message(raw, [])
+        mock_imap.search.assert_called_once()
+        mock_imap.append.assert_called_once()
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_preload_consults_cache_first(self, mock_imap_class: MagicMock,
+                                          tmp_path: Path) -> None:
+        """Only Message-IDs missing from the cache are searched for on the server."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.response.return_value = ('UIDVALIDITY', [b'42'])
+        mock_imap.uid.return_value = ('OK', [b''])
+        db = tmp_path / 'dedup.sqlite'
+        cache = DeliveredCache(str(db), 'user@example.com@imap.example.com')
+        cache.set_uidvalidity('INBOX', '42')
+        cache.add('INBOX', ['<a@x>'])
+        cache.commit()
+
+        target = self._make_target(db)
+        assert target.preload_existing_message_ids(['<a@x>', '<b@x>']) == {'<a@x>'}
+        search_args = mock_imap.uid.call_args[0]
+        assert search_args == ('SEARCH', 'HEADER', 'Message-ID', '<b@x>')
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_unselected_folder_uses_status(self, mock_imap_class: MagicMock,
+                                           tmp_path: Path) -> None:
+        """UIDVALIDITY of a folder other than the selected one is read with STATUS."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.response.return_value = ('UIDVALIDITY', [b'42'])
+        mock_imap.status.return_value = ('OK', [b'INBOX/lists (UIDVALIDITY 7)'])
+        db = tmp_path / 'dedup.sqlite'
+        cache = DeliveredCache(str(db), 'user@example.com@imap.example.com')
+        cache.set_uidvalidity('INBOX/lists', '7')
+        cache.add('INBOX/lists', ['<a@x>'])
+        cache.commit()
+
+        target = self._make_target(db)
+        assert target.preload_existing_message_ids(['<a@x>'], 'INBOX/lists') == {'<a@x>'}
+        mock_imap.status.assert_called_once_with('INBOX/lists', '(UIDVALIDITY)')
+        mock_imap.uid.assert_not_called()
+
+
+class TestTlsSessionResumption:
+    """Tests for ResumingIMAP4SSL session reuse."""
+
+    @staticmethod
+    def _make_conn(context: Any) -> ResumingIMAP4SSL:
+        conn = ResumingIMAP4SSL.__new__(ResumingIMAP4SSL)
+        conn.host = 'imap.example.com'
+        conn.port = 993
+        conn.ssl_context = context
+        return conn
+
+    def test_saved_session_used_for_next_connection(self) -> None:
+        """A session saved after login is offered on the next handshake."""
+        context = MagicMock()
+        session = MagicMock()
+        conn = self._make_conn(context)
+        conn.sock = MagicMock(spec=ssl.SSLSocket)
+        conn.sock.session = session
+        conn.sock.session_reused = False
+        with patch('korgalore.imap_target._TLS_CONTEXT', context), \
+                patch.dict('korgalore.imap_target._TLS_SESSIONS', clear=True), \
+                patch('imaplib.IMAP4._create_socket', return_value='raw-sock'):
+            conn._create_socket(60)
+            assert context.wrap_socket.call_args.kwargs['session'] is None
+            conn.save_tls_session()
+            self._make_conn(context)._create_socket(60)
+            context.wrap_socket.assert_called_with(
+                'raw-sock', server_hostname='imap.example.com', session=session)
+
+    def test_foreign_context_gets_no_session(self) -> None:
+        """Sessions are never offered to a caller-supplied SSL context."""
+        context = MagicMock()
+        conn = self._make_conn(context)
+        with patch.dict('korgalore.imap_target._TLS_SESSIONS',
+                        {('imap.example.com', 993): MagicMock()}), \
+                patch('imaplib.IMAP4._create_socket', return_value='raw-sock'):
+            conn._create_socket(60)
+        assert context.wrap_socket.call_args.kwargs['session'] is None
+
+
 class TestImapTargetDisconnect:
     """Tests for ImapTarget disconnect method."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
-    def test_disconnect_closes_connection(self, mock_imap_class: MagicMock) -> None:
-        """disconnect() calls logout on the IMAP connection."""
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_disconnect_pools_connection(self, mock_imap_class: MagicMock) -> None:
+        """disconnect() keeps the connection for reuse until close_all()."""
         mock_imap = MagicMock()
         mock_imap_class.return_value = mock_imap
         mock_imap.login.return_value = ('OK', [])
@@ -856,10 +1354,13 @@ class TestImapTargetDisconnect:
 
         target.disconnect()
 
-        mock_imap.logout.assert_called_once()
+        mock_imap.logout.assert_not_called()
         assert target.imap is None
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+        close_all()
+        mock_imap.logout.assert_called_once()
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_disconnect_handles_logout_error(self, mock_imap_class: MagicMock) -> None:
         """disconnect() handles errors during logout gracefully."""
         mock_imap = MagicMock()
@@ -879,6 +1380,7 @@ class TestImapTargetDisconnect:
         # Should not raise
         target.disconnect()
         assert target.imap is None
+        close_all()
 
     def test_disconnect_when_not_connected(self) -> None:
         """disconnect() is safe when not connected."""
@@ -894,13 +1396,14 @@ class TestImapTargetDisconnect:
         target.disconnect()
         assert target.imap is None
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_disconnect_allows_reconnect(self, mock_imap_class: MagicMock) -> None:
-        """After disconnect(), connect() establishes a new connection."""
+        """After disconnect(), a dead pooled connection is replaced."""
         mock_imap = MagicMock()
         mock_imap_class.return_value = mock_imap
         mock_imap.login.return_value = ('OK', [])
         mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.noop.side_effect = imaplib.IMAP4.abort('socket closed')
 
         target = ImapTarget(
             identifier="test",
@@ -917,11 +1420,53 @@ class TestImapTargetDisconnect:
         assert target.imap is not None
         assert mock_imap_class.call_count == 2
 
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_reconnect_reuses_pooled_connection(self, mock_imap_class: MagicMock) -> None:
+        """A live pooled connection is reused without logging in again."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.login.return_value = ('OK', [])
+        mock_imap.select.return_value = ('OK', [b'1'])
+        mock_imap.noop.return_value = ('OK', [b''])
+
+        first = ImapTarget(identifier="one", server="imap.example.com",
+                           username="user@example.com", password="secret")
+        second = ImapTarget(identifier="two", server="imap.example.com",
+                            username="user@example.com", password="secret",
+                            folder="Lists")
+        first.connect()
+        first.disconnect()
+        second.connect()
+
+        mock_imap_class.assert_called_once()
+        mock_imap.login.assert_called_once()
+        mock_imap.noop.assert_called_once()
+        assert second.imap is mock_imap
+        mock_imap.select.assert_called_with('Lists', readonly=True)
+
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
+    def test_idle_pooled_connection_not_reused(self, mock_imap_class: MagicMock) -> None:
+        """Connections idle for too long are logged out instead of reused."""
+        mock_imap = MagicMock()
+        mock_imap_class.return_value = mock_imap
+        mock_imap.select.return_value = ('OK', [b'1'])
+
+        target = ImapTarget(identifier="test", server="imap.example.com",
+                            username="user@example.com", password="secret")
+        target.connect()
+        target.disconnect()
+        with patch('korgalore.imap_target.IMAP_POOL_MAX_IDLE', -1):
+            target.connect()
+
+        mock_imap.noop.assert_not_called()
+        mock_imap.logout.assert_called_once()
+        assert mock_imap_class.call_count == 2
+
 
 class TestImapTargetSubfolder:
     """Tests for IMAP subfolder support."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_with_subfolder(self, mock_imap_class: MagicMock) -> None:
         """Import with subfolder appends to correct path."""
         mock_imap = MagicMock()
@@ -947,7 +1492,7 @@ class TestImapTargetSubfolder:
         call_args = mock_imap.append.call_args[0]
         assert call_args[0] == "INBOX/Lists/LKML"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_without_subfolder(self, mock_imap_class: MagicMock) -> None:
         """Import without subfolder uses base folder."""
         mock_imap = MagicMock()
@@ -972,7 +1517,7 @@ class TestImapTargetSubfolder:
         call_args = mock_imap.append.call_args[0]
         assert call_args[0] == "Archive"
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_subfolder_dedup_check_uses_effective_folder(self, mock_imap_class: MagicMock) -> None:
         """Deduplication check uses effective folder (base + subfolder)."""
         mock_imap = MagicMock()
@@ -1001,7 +1546,7 @@ class TestImapTargetSubfolder:
         select_calls = [call[0][0] for call in mock_imap.select.call_args_list]
         assert "INBOX/Lists/LKML" in select_calls
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_nested_subfolder_path(self, mock_imap_class: MagicMock) -> None:
         """Nested subfolder path is constructed correctly."""
         mock_imap = MagicMock()
@@ -1030,7 +1575,7 @@ class TestImapTargetSubfolder:
 class TestImapTargetDeduplication:
     """Tests for IMAP message deduplication by Message-ID."""
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_check_message_exists_found(self, mock_imap_class: MagicMock) -> None:
         """Returns True when message exists in folder."""
         mock_imap = MagicMock()
@@ -1055,7 +1600,7 @@ class TestImapTargetDeduplication:
             None, 'HEADER', 'Message-ID', '<test@example.com>'
         )
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_check_message_exists_not_found(self, mock_imap_class: MagicMock) -> None:
         """Returns False when message does not exist."""
         mock_imap = MagicMock()
@@ -1075,7 +1620,7 @@ class TestImapTargetDeduplication:
         exists = target._check_message_exists("<test@example.com>", "INBOX")
         assert exists is False
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_check_message_exists_error_returns_false(self, mock_imap_class: MagicMock) -> None:
         """Returns False on IMAP error (fail-open)."""
         mock_imap = MagicMock()
@@ -1107,7 +1652,7 @@ class TestImapTargetDeduplication:
         exists = target._check_message_exists("<test@example.com>", "INBOX")
         assert exists is False
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_skips_duplicate(self, mock_imap_class: MagicMock) -> None:
         """Import is skipped when message already exists in folder."""
         mock_imap = MagicMock()
@@ -1131,7 +1676,7 @@ class TestImapTargetDeduplication:
         assert result.get('skipped') is True
         mock_imap.append.assert_not_called()
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_proceeds_when_not_duplicate(self, mock_imap_class: MagicMock) -> None:
         """Import proceeds normally when message does not exist."""
         mock_imap = MagicMock()
@@ -1156,7 +1701,7 @@ class TestImapTargetDeduplication:
         assert result == [b'Done']
         mock_imap.append.assert_called_once()
 
-    @patch('korgalore.imap_target.imaplib.IMAP4_SSL')
+    @patch('korgalore.imap_target.ResumingIMAP4SSL')
     def test_import_proceeds_without_message_id(self, mock_imap_class: MagicMock) -> None:
         """Import proceeds without dedup check when Message-ID is missing."""
         mock_imap = MagicMock()
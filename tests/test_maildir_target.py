@@ -1,6 +1,8 @@
 """Tests for MaildirTarget message delivery."""
 
 import mailbox
+import os
+import stat
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -218,6 +220,132 @@ class TestMaildirTargetImportMessage:
         assert len(set(keys)) == 10  # All unique
 
 
+class TestMaildirTargetImportMessages:
+    """Tests for batched MaildirTarget delivery."""
+
+    def test_delivers_all_messages(self, tmp_path: Path) -> None:
+        """Every message in the batch lands in new/ with CRLF endings."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+        raw_messages = [f"From: a@example.com\nSubject: Test {i}\n\nBody".encode()
+                        for i in range(3)]
+
+        errors = target.import_messages(raw_messages, [], subfolder="Lists/Test/")
+
+        assert errors == [None, None, None]
+        folder = mailbox.Maildir(str(maildir_path / "Lists" / "Test"), create=False)
+        subjects = sorted(msg["Subject"] for msg in folder)
+        assert subjects == ["Test 0", "Test 1", "Test 2"]
+        for name in (maildir_path / "Lists" / "Test" / "new").iterdir():
+            assert b"\r\n\r\nBody" in name.read_bytes()
+        assert list((maildir_path / "Lists" / "Test" / "tmp").iterdir()) == []
+
+    def test_syncs_batch_before_linking(self, tmp_path: Path) -> None:
+        """Each file is fsynced after the whole batch is written, then new/ once."""
+        target = MaildirTarget("test", str(tmp_path / "mail"))
+        raw_messages = [b"From: a@example.com\n\nBody"] * 5
+        tmp_dir = tmp_path / "mail" / "tmp"
+        new_dir = tmp_path / "mail" / "new"
+        seen_at_fsync = []
+
+        def record(fd: int) -> None:
+            seen_at_fsync.append((len(list(tmp_dir.iterdir())), len(list(new_dir.iterdir()))))
+
+        with patch("korgalore.maildir_target.os.fsync", side_effect=record), \
+                patch("korgalore.maildir_target.os.sync") as mock_sync:
+            target.import_messages(raw_messages, [])
+
+        mock_sync.assert_not_called()
+        # Five file syncs with the batch complete in tmp/, then one for new/
+        assert seen_at_fsync == [(5, 0)] * 5 + [(0, 5)]
+        assert len(list(new_dir.iterdir())) == 5
+
+    def test_failed_fsync_fails_that_message(self, tmp_path: Path) -> None:
+        """A message whose data cannot be synced is failed and removed from tmp/."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+        real_fsync = os.fsync
+        calls = []
+
+        def flaky_fsync(fd: int) -> None:
+            calls.append(fd)
+            if len(calls) == 1:
+                raise OSError("EIO")
+            real_fsync(fd)
+
+        with patch("korgalore.maildir_target.os.fsync", side_effect=flaky_fsync):
+            errors = target.import_messages([b"From: a@example.com\n\nBody"] * 2, [])
+
+        assert isinstance(errors[0], ConfigurationError)
+        assert errors[1] is None
+        assert len(list((maildir_path / "new").iterdir())) == 1
+        assert list((maildir_path / "tmp").iterdir()) == []
+
+    def test_rename_without_hard_links(self, tmp_path: Path) -> None:
+        """Filesystems without hard links fall back to rename."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+
+        with patch("korgalore.maildir_target.os.link", side_effect=PermissionError("no links")):
+            errors = target.import_messages([b"From: a@example.com\n\nBody"] * 2, [])
+
+        assert errors == [None, None]
+        assert len(list((maildir_path / "new").iterdir())) == 2
+        assert list((maildir_path / "tmp").iterdir()) == []
+
+    def test_failed_write_leaves_no_tmp_file(self, tmp_path: Path) -> None:
+        """A message that cannot be written is removed from tmp/."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+
+        with patch("korgalore.maildir_target.RawMessage.as_bytes", return_value="not bytes"):
+            errors = target.import_messages([b"From: a@example.com\n\nBody"], [])
+
+        assert isinstance(errors[0], ConfigurationError)
+        assert list((maildir_path / "tmp").iterdir()) == []
+        assert list((maildir_path / "new").iterdir()) == []
+
+    def test_directory_sync_failure_keeps_results(self, tmp_path: Path) -> None:
+        """Messages already in new/ are not failed if the directory sync fails."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+
+        real_fsync = os.fsync
+
+        def fail_on_directory(fd: int) -> None:
+            if stat.S_ISDIR(os.fstat(fd).st_mode):
+                raise OSError("EIO")
+            real_fsync(fd)
+
+        with patch("korgalore.maildir_target.os.fsync", side_effect=fail_on_directory):
+            errors = target.import_messages([b"From: a@example.com\n\nBody"], [])
+
+        assert errors == [None]
+        assert len(list((maildir_path / "new").iterdir())) == 1
+
+    def test_failure_reported_per_message(self, tmp_path: Path) -> None:
+        """A failed write is reported for that message only."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+        raw_messages = [b"From: a@example.com\n\nBody"] * 3
+        real_link = os.link
+        calls = []
+
+        def flaky_link(src: Path, dst: Path) -> None:
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_link(src, dst)
+
+        with patch("korgalore.maildir_target.os.link", side_effect=flaky_link):
+            errors = target.import_messages(raw_messages, [])
+
+        assert errors[0] is None and errors[2] is None
+        assert isinstance(errors[1], ConfigurationError)
+        assert len(list((maildir_path / "new").iterdir())) == 2
+        assert list((maildir_path / "tmp").iterdir()) == []
+
+
 class TestMaildirTargetSubfolder:
     """Tests for Maildir subfolder support."""
 
@@ -278,6 +406,19 @@ class TestMaildirTargetSubfolder:
         subfolder_new = list((maildir_path / "Lists" / "Test" / "new").iterdir())
         assert len(subfolder_new) == 3
 
+    def test_subfolder_cache_normalizes_path(self, tmp_path: Path) -> None:
+        """Spellings of the same subfolder share one cached maildir."""
+        maildir_path = tmp_path / "mail"
+        target = MaildirTarget("test", str(maildir_path))
+
+        first = target._get_maildir("Lists/Test")
+        assert target._get_maildir("Lists/Test/") is first
+        assert target._get_maildir("Lists//Test") is first
+        assert list(target._subfolder_maildirs) == ["Lists/Test"]
+
+        target._get_maildir("Lists/Other")
+        assert target._known_parents == {maildir_path / "Lists"}
+
     def test_multiple_subfolders(self, tmp_path: Path) -> None:
         """Multiple subfolders can be used independently."""
         maildir_path = tmp_path / "mail"
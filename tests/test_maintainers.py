@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 
 from korgalore.maintainers import (
+    REGEX_METACHARACTERS,
     SubsystemEntry,
     normalize_subsystem_name,
     extract_email,
@@ -221,6 +222,11 @@ class TestIsSimplePattern:
         assert is_simple_pattern(r"\b(?i:clang|llvm)\b") is False
         assert is_simple_pattern(r"[^\s]+\.rs$") is False
 
+    @pytest.mark.parametrize('char', list(REGEX_METACHARACTERS))
+    def test_every_metacharacter(self, char: str) -> None:
+        """Each listed metacharacter makes a pattern non-simple."""
+        assert is_simple_pattern(f"foo{char}bar") is False
+
 
 class TestEmailToListId:
     """Tests for email_to_list_id function."""
@@ -589,6 +595,40 @@ M:\ttest@example.com
         # Preamble lines might be parsed as entries, but the actual subsystem should be there
         assert "ACTUAL SUBSYSTEM" in entries
 
+    def test_parse_crlf_and_invalid_utf8(self, tmp_path: Path) -> None:
+        """CRLF line endings and undecodable bytes are tolerated."""
+        maintainers = tmp_path / "MAINTAINERS"
+        maintainers.write_bytes(
+            b"\r\nCRLF SUBSYSTEM\r\nM:\tJ\xf6rg <crlf@example.com>\r\nF:\tcrlf/\r\n"
+        )
+        entries = parse_maintainers(maintainers)
+        entry = entries["CRLF SUBSYSTEM"]
+        assert entry.maintainers == ["crlf@example.com"]
+        assert entry.files == ["crlf/"]
+
+    def test_parse_cached_until_file_changes(self, tmp_path: Path) -> None:
+        """Unchanged file is parsed once; a rewrite is picked up."""
+        maintainers = tmp_path / "MAINTAINERS"
+        maintainers.write_text("""
+FIRST SUBSYSTEM
+M:\tfirst@example.com
+""")
+        entries = parse_maintainers(maintainers)
+        assert parse_maintainers(maintainers) is entries
+        with pytest.raises(TypeError):
+            entries["OTHER"] = SubsystemEntry(name="OTHER")  # type: ignore[index]
+
+        maintainers.write_text("""
+FIRST SUBSYSTEM
+M:\tfirst@example.com
+
+SECOND SUBSYSTEM
+M:\tsecond@example.com
+""")
+        updated = parse_maintainers(maintainers)
+        assert updated is not entries
+        assert "SECOND SUBSYSTEM" in updated
+
 
 class TestGetSubsystem:
     """Tests for get_subsystem function."""
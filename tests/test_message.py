@@ -1,6 +1,8 @@
 """Tests for RawMessage wrapper class."""
 
-from korgalore.message import RawMessage
+from unittest.mock import patch
+
+from korgalore.message import MSGID_SCAN_LIMIT, RawMessage
 
 
 class TestRawMessage:
@@ -35,6 +37,36 @@ class TestRawMessage:
         msg = RawMessage(raw)
         assert msg.message_id == "<spaced@example.com>"
 
+    def test_message_id_without_parsing(self) -> None:
+        """A plain Message-ID header is read without parsing the message."""
+        raw = b"From: test@example.com\nmessage-id: <lf@example.com>\n\nBody"
+        msg = RawMessage(raw)
+        assert msg.message_id == "<lf@example.com>"
+        assert msg._parsed is None
+
+    def test_message_id_in_body_ignored(self) -> None:
+        """A Message-ID line in the body is not mistaken for the header."""
+        raw = (b"From: test@example.com\r\nSubject: Test\r\n\r\n"
+               b"Message-ID: <quoted@example.com>\r\n")
+        msg = RawMessage(raw)
+        assert msg.message_id is None
+
+    def test_message_id_folded(self) -> None:
+        """A Message-ID folded onto a continuation line is read without parsing."""
+        raw = b"From: test@example.com\r\nMessage-ID:\r\n <folded@example.com>\r\n\r\nBody"
+        msg = RawMessage(raw)
+        assert msg.message_id == "<folded@example.com>"
+        assert msg._parsed is None
+
+    def test_message_id_beyond_scan_limit(self) -> None:
+        """A Message-ID past the scan limit is still found by parsing."""
+        padding = b"".join(b"X-Pad-%d: %s\n" % (i, b"a" * 60)
+                           for i in range(MSGID_SCAN_LIMIT // 60))
+        raw = b"From: test@example.com\n" + padding + b"Message-ID: <late@example.com>\n\nBody"
+        msg = RawMessage(raw)
+        assert msg._scan_message_id() is None
+        assert msg.message_id == "<late@example.com>"
+
     def test_raw_property(self) -> None:
         """Raw property returns original bytes."""
         raw = b"From: test@example.com\r\n\r\nBody"
@@ -80,6 +112,22 @@ class TestRawMessage:
         # All \n should be \r\n now
         assert normalized.replace(b'\r\n', b'').find(b'\n') == -1
 
+    def test_as_bytes_crlf_returns_raw(self) -> None:
+        """CRLF messages are handed back without being copied."""
+        raw = b"From: test@example.com\r\nSubject: Test\r\n\r\nBody\r\n"
+        msg = RawMessage(raw)
+        assert msg.as_bytes() is raw
+
+    def test_as_bytes_normalized_once(self) -> None:
+        """The CRLF form is reused across calls, with or without a trace header."""
+        raw = b"From: test@example.com\nSubject: Test\n\nBody\n"
+        msg = RawMessage(raw)
+        first = msg.as_bytes()
+        assert msg.as_bytes() is first
+        traced = msg.as_bytes(feed_name="lkml", delivery_name="inbox")
+        assert b"X-Korgalore-Trace:" in traced
+        assert msg.as_bytes() is first
+
     def test_invalid_message_message_id(self) -> None:
         """Invalid message content doesn't crash message_id extraction."""
         raw = b"\xff\xfe invalid utf-8 with Message-ID: maybe"
@@ -150,6 +198,15 @@ class TestRawMessageTraceHeader:
         # All line endings should be CRLF
         assert result.replace(b'\r\n', b'').find(b'\n') == -1
 
+    def test_trace_header_crlf_matches_lf(self) -> None:
+        """CRLF and LF sources produce the same bytes once the trace is added."""
+        crlf = RawMessage(b"From: test@example.com\r\nSubject: Test\r\n\r\nBody\r\n")
+        lf = RawMessage(b"From: test@example.com\nSubject: Test\n\nBody\n")
+        with patch('korgalore.message.formatdate', return_value='Tue, 27 Jan 2026 16:56:44 -0500'):
+            result = crlf.as_bytes(feed_name="a-rather-long-feed-name", delivery_name="delivery")
+            assert result == lf.as_bytes(feed_name="a-rather-long-feed-name", delivery_name="delivery")
+        assert result.endswith(b"\r\n\r\nBody\r\n")
+
     def test_trace_header_contains_date(self) -> None:
         """Trace header contains RFC 2822 formatted date."""
         raw = b"From: test@example.com\nSubject: Test\n\nBody"
@@ -236,3 +293,10 @@ class TestRawMessageTraceHeader:
         trace_start = result.find(b"X-Korgalore-Trace:")
         # Find continuation lines (CRLF followed by space)
         assert b"\r\n " in result[trace_start:], "Header should have continuation lines"
+
+    def test_wrap_header_overlong_word(self) -> None:
+        """A word longer than the limit gets a line of its own."""
+        msg = RawMessage(b"")
+        long_word = "x" * 80
+        wrapped = msg._wrap_header("X-Test", f"short {long_word} tail")
+        assert wrapped == f"X-Test: short\n {long_word}\n tail"
@@ -7,13 +7,23 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from korgalore import AuthenticationError, ConfigurationError
+from typing import Iterator
+
+from korgalore import AuthenticationError, ConfigurationError, oauth2_imap
 from korgalore.oauth2_imap import (
     OAuth2Token, ImapOAuth2Authenticator, xoauth2_callback,
     MS_AUTH_URL, MS_TOKEN_URL, IMAP_SCOPE
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_token_cache() -> Iterator[None]:
+    """Keep cached access tokens from leaking between tests."""
+    oauth2_imap._token_cache.clear()
+    yield
+    oauth2_imap._token_cache.clear()
+
+
 class TestOAuth2Token:
     """Tests for OAuth2Token dataclass."""
 
@@ -267,6 +277,52 @@ class TestImapOAuth2Authenticator:
         assert call_args[1]["data"]["client_id"] == "test-client-id"
         assert call_args[1]["data"]["grant_type"] == "refresh_token"
 
+    @patch('korgalore.oauth2_imap.requests.post')
+    def test_refreshed_token_shared_between_authenticators(self, mock_post: MagicMock,
+                                                           tmp_path: Path) -> None:
+        """A token refreshed once is reused by later authenticators for the account."""
+        token_file = tmp_path / "token.json"
+        token_file.write_text(json.dumps({
+            "access_token": "old_token",
+            "refresh_token": "valid_refresh",
+            "expires_at": datetime.now(timezone.utc).timestamp() - 3600,
+        }))
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"access_token": "new_access_token",
+                                           "expires_in": 3600}
+        mock_post.return_value = mock_response
+
+        first = ImapOAuth2Authenticator(identifier="test", username="user@example.com",
+                                        client_id="client-id", token_file=str(token_file))
+        assert first.get_access_token() == "new_access_token"
+
+        # A new authenticator (as built for every sync) skips the token file
+        token_file.unlink()
+        second = ImapOAuth2Authenticator(identifier="test", username="user@example.com",
+                                         client_id="client-id", token_file=str(token_file),
+                                         interactive=False)
+        assert second.get_access_token() == "new_access_token"
+        mock_post.assert_called_once()
+
+        # The cache is keyed by a hash, not by the account details
+        key = next(iter(oauth2_imap._token_cache))
+        assert "user@example.com" not in key
+
+    def test_cached_token_not_used_near_expiry(self, tmp_path: Path) -> None:
+        """Cached tokens within TOKEN_EXPIRY_BUFFER of expiry are not handed out."""
+        token_file = tmp_path / "token.json"
+        token_file.write_text(json.dumps({
+            "access_token": "file_token",
+            "refresh_token": "refresh",
+            "expires_at": datetime.now(timezone.utc).timestamp() + 3600,
+        }))
+        auth = ImapOAuth2Authenticator(identifier="test", username="user@example.com",
+                                       client_id="client-id", token_file=str(token_file))
+        oauth2_imap._token_cache[auth._cache_key] = (
+            "stale_token", datetime.now(timezone.utc).timestamp() - 1)
+
+        assert auth.get_access_token() == "file_token"
+
     @patch('korgalore.oauth2_imap.requests.post')
     def test_refresh_token_failure(self, mock_post: MagicMock, tmp_path: Path) -> None:
         """Token refresh failure in non-interactive mode raises error."""
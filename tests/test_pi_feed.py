@@ -7,9 +7,11 @@ These tests cover the delivery tracking functionality including:
 """
 
 import json
+import sys
 import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import patch
 
 from korgalore.pi_feed import PIFeed, RETRY_FAILED_INTERVAL
@@ -57,6 +59,24 @@ class TestJSONLOperations:
         assert result[0] == (1, "abc123")
         assert result[1] == (2, "def456")
 
+    @pytest.mark.parametrize('has_orjson', [True, False])
+    def test_state_readable_either_way(self, has_orjson: bool, mock_feed: PIFeed,
+                                       temp_feed_dir: Path) -> None:
+        """State written with or without orjson reads back identically."""
+        if has_orjson:
+            pytest.importorskip('orjson')
+        state = {'epochs': {'0': {'last': 'abc', 'subject': 'Résumé'}}, 'count': 3}
+        filepath = temp_feed_dir / "state.json"
+        with patch('korgalore.HAS_ORJSON', has_orjson):
+            from korgalore import json_dumps, json_loads
+            filepath.write_text(json_dumps(state, indent=True))
+            mock_feed._append_to_jsonl_file(temp_feed_dir / "test.jsonl", (1, "abc123"))
+        assert json.loads(filepath.read_text()) == state
+        assert filepath.read_text().startswith('{\n  "epochs"')
+        with patch('korgalore.HAS_ORJSON', not has_orjson and 'orjson' in sys.modules):
+            assert json_loads(filepath.read_bytes()) == state
+            assert mock_feed._read_jsonl_file(temp_feed_dir / "test.jsonl") == [(1, "abc123")]
+
 
 class TestMarkSuccessfulDelivery:
     """Tests for mark_successful_delivery function."""
@@ -823,7 +843,7 @@ class TestRetryNoopDoesNotRewindPointer:
             ["label"], was_failing=True,
         )
 
-        assert result == SKIPPED_NOOP_COMMIT
+        assert result is SKIPPED_NOOP_COMMIT
         feed.mark_successful_delivery.assert_called_once_with(
             "test-delivery", 0, "abc123", was_failing=True,
         )
@@ -848,3 +868,255 @@ class TestRetryNoopDoesNotRewindPointer:
         with patch.object(mock_feed, "save_delivery_info") as mock_save:
             mock_feed.mark_successful_delivery("test-delivery", 0, "abc123", was_failing=False)
             mock_save.assert_called_once()
+
+
+class TestParseHeadersOnly:
+    """Tests for PIFeed.parse_headers_only."""
+
+    RAW = (b"From: Alice <alice@example.com>\n"
+           b"Subject: [PATCH] Fix things\n"
+           b"Message-ID: <test@example.com>\n"
+           b"\n"
+           b"Body text\n"
+           b"From: not-a-header@example.com\n")
+
+    def test_returns_headers(self) -> None:
+        """Header values are available on the parsed message."""
+        msg = PIFeed.parse_headers_only(self.RAW)
+        assert msg.get('Message-ID') == '<test@example.com>'
+        assert msg.get('Subject') == '[PATCH] Fix things'
+        assert msg.get('From') == 'Alice <alice@example.com>'
+
+    def test_body_is_not_parsed(self) -> None:
+        """Body lines are never interpreted as headers."""
+        msg = PIFeed.parse_headers_only(self.RAW)
+        assert msg.get_all('From') == ['Alice <alice@example.com>']
+        assert not msg.is_multipart()
+
+    def test_parse_subject(self) -> None:
+        """parse_subject returns the Subject, or a placeholder if missing."""
+        assert PIFeed.parse_subject(self.RAW) == '[PATCH] Fix things'
+        assert PIFeed.parse_subject(b"From: a@b\n\nbody\n") == '(no subject)'
+
+    def test_save_delivery_info_reads_headers_only(self, mock_feed: PIFeed) -> None:
+        """save_delivery_info records Subject and Message-ID without a full parse."""
+        with patch('korgalore.pi_feed.run_git_command', return_value=(0, b'2024-01-01 00:00:00 +0000', b'')), \
+                patch.object(PIFeed, 'parse_headers_only', wraps=PIFeed.parse_headers_only) as mock_parse:
+            mock_feed.save_delivery_info('d', 0, latest_commit='abc123', message=self.RAW)
+        mock_parse.assert_called_once_with(self.RAW)
+        info = mock_feed.load_delivery_info('d')['epochs']['0']
+        assert info['subject'] == '[PATCH] Fix things'
+        assert info['msgid'] == '<test@example.com>'
+
+    def test_recover_after_rebase_matches_on_headers(self, mock_feed: PIFeed) -> None:
+        """Rebase recovery finds the rewritten commit by Subject and Message-ID."""
+        date = b'2024-01-01 00:00:00 +0000'
+        with patch('korgalore.pi_feed.run_git_command', return_value=(0, date, b'')):
+            mock_feed.save_delivery_info('d', 0, latest_commit='old', message=self.RAW)
+
+        other = b"Subject: Something else\nMessage-ID: <other@example.com>\n\nBody\n"
+        messages = {'c1': other, 'c2': self.RAW, 'c3': other}
+
+        def fake_git(gitdir: str, args: Any, **kwargs: Any) -> Any:
+            if args[0] == 'rev-list':
+                assert kwargs == {'strip': False}
+                return 0, b'c1\nc2\nc3\n', b''
+            return 0, date, b''
+
+        with patch('korgalore.pi_feed.run_git_command', side_effect=fake_git), \
+                patch.object(mock_feed, 'get_message_at_commit', side_effect=lambda e, c: messages[c]), \
+                patch.object(PIFeed, 'parse_headers_only', wraps=PIFeed.parse_headers_only) as mock_parse:
+            assert mock_feed.recover_after_rebase('d', 0) == 'c2'
+        assert mock_parse.call_count == 2
+        assert mock_feed.load_delivery_info('d')['epochs']['0']['last'] == 'c2'
+
+
+class TestDeliverCommitsBatch:
+    """Tests for batched delivery through deliver_commits."""
+
+    @staticmethod
+    def _raw(n: int, sender: str = "dev@example.com") -> bytes:
+        return (f"From: {sender}\nSubject: patch {n}\n"
+                f"Message-ID: <{n}@example.com>\n\nbody\n").encode()
+
+    def _make_feed(self, messages: Dict[str, bytes]) -> Any:
+        from unittest.mock import MagicMock
+        feed = MagicMock()
+        feed.feed_key = "test-feed"
+        feed.is_noop_commit.side_effect = lambda epoch, commit: commit not in messages
+        feed.get_message_at_commit.side_effect = lambda epoch, commit: messages[commit]
+        feed.parse_headers_only.side_effect = PIFeed.parse_headers_only
+        return feed
+
+    def test_single_upload_and_ordered_state(self) -> None:
+        """All messages go up in one call; state is recorded in commit order."""
+        from unittest.mock import MagicMock, call
+        from korgalore.cli import deliver_commits, SKIPPED_NOOP_COMMIT, SKIPPED_BOZOFILTER
+
+        feed = self._make_feed({"c1": self._raw(1), "c3": self._raw(3, "bozo@example.com"),
+                                "c4": self._raw(4)})
+        target = MagicMock()
+        target.import_messages.return_value = [None, None]
+
+        results = deliver_commits("d", target, feed, [(0, "c1"), (0, "c2"), (0, "c3"), (0, "c4")],
+                                  ["INBOX"], bozofilter={"bozo@example.com"})
+
+        assert results == ["<1@example.com>", SKIPPED_NOOP_COMMIT, SKIPPED_BOZOFILTER, "<4@example.com>"]
+        assert results[1] is SKIPPED_NOOP_COMMIT and results[2] is SKIPPED_BOZOFILTER
+        target.import_messages.assert_called_once()
+        assert target.import_messages.call_args[0][0] == [self._raw(1), self._raw(4)]
+        assert [c.args[2] for c in feed.mark_successful_delivery.call_args_list] == ["c1", "c2", "c3", "c4"]
+        assert feed.mark_successful_delivery.call_args_list[1] == call("d", 0, "c2", message=None)
+        feed.mark_failed_delivery.assert_not_called()
+
+    def test_failed_message_marked_failed(self) -> None:
+        """A message the target rejects is recorded as failed."""
+        from unittest.mock import MagicMock
+        from korgalore import RemoteError
+        from korgalore.cli import deliver_commits
+
+        feed = self._make_feed({"c1": self._raw(1), "c2": self._raw(2)})
+        target = MagicMock()
+        target.import_messages.return_value = [RemoteError("nope"), None]
+
+        results = deliver_commits("d", target, feed, [(0, "c1"), (0, "c2")], ["INBOX"])
+
+        assert results == [None, "<2@example.com>"]
+        feed.mark_failed_delivery.assert_called_once_with("d", 0, "c1")
+        feed.save_delivery_info.assert_called_once_with("d", 0, latest_commit="c1", message=self._raw(1))
+        feed.mark_successful_delivery.assert_called_once_with("d", 0, "c2", message=self._raw(2))
+
+    def test_connect_failure_fails_whole_batch(self) -> None:
+        """If the target cannot connect, every pending message fails."""
+        from unittest.mock import MagicMock
+        from korgalore.cli import deliver_commits
+
+        feed = self._make_feed({"c1": self._raw(1), "c2": self._raw(2)})
+        target = MagicMock()
+        target.connect.side_effect = OSError("down")
+
+        results = deliver_commits("d", target, feed, [(0, "c1"), (0, "c2")], ["INBOX"])
+
+        assert results == [None, None]
+        target.import_messages.assert_not_called()
+        assert feed.mark_failed_delivery.call_count == 2
+
+
+class TestMessageAtCommit:
+    """Tests for reading messages out of epoch repositories."""
+
+    @staticmethod
+    def _make_repo(gitdir: Path) -> Dict[str, str]:
+        """Create a bare epoch repo with a message commit and an 'rm' commit."""
+        import subprocess
+        import tempfile
+        subprocess.run(['git', 'init', '-q', '--bare', str(gitdir)], check=True)
+        commits: Dict[str, str] = {}
+        with tempfile.TemporaryDirectory() as work:
+            git = ['git', '-C', work, '-c', 'user.name=Test', '-c', 'user.email=test@test']
+            subprocess.run(['git', 'init', '-q', work], check=True)
+            (Path(work) / 'm').write_bytes(b'Message-ID: <1@x>\n\nbody\n')
+            subprocess.run(git + ['add', 'm'], check=True)
+            subprocess.run(git + ['commit', '-q', '-m', 'message'], check=True)
+            commits['message'] = subprocess.run(git + ['rev-parse', 'HEAD'], check=True,
+                                                capture_output=True, text=True).stdout.strip()
+            subprocess.run(git + ['rm', '-q', 'm'], check=True)
+            (Path(work) / 'd').write_bytes(b'Message-ID: <1@x>\n\nbody\n')
+            subprocess.run(git + ['add', 'd'], check=True)
+            subprocess.run(git + ['commit', '-q', '-m', 'rm'], check=True)
+            commits['rm'] = subprocess.run(git + ['rev-parse', 'HEAD'], check=True,
+                                           capture_output=True, text=True).stdout.strip()
+            subprocess.run(git + ['push', '-q', str(gitdir), 'HEAD:refs/heads/master'], check=True)
+        return commits
+
+    @pytest.fixture(params=['git', 'pygit2'])
+    def backend(self, request: pytest.FixtureRequest) -> Any:
+        """Run each test with the git command and, if installed, with pygit2."""
+        if request.param == 'pygit2':
+            pytest.importorskip('pygit2')
+            yield
+        else:
+            with patch('korgalore.pi_feed.HAS_PYGIT2', False):
+                yield
+
+    def test_message_read(self, backend: Any, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """The message blob of a commit is returned."""
+        commits = self._make_repo(mock_feed.get_gitdir(1))
+        assert mock_feed.get_message_at_commit(1, commits['message']) == b'Message-ID: <1@x>\n\nbody'
+        assert mock_feed.is_noop_commit(1, commits['message']) is False
+
+    def test_rm_commit(self, backend: Any, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """Commits without a message file are no-ops and have no message."""
+        from korgalore import StateError
+        commits = self._make_repo(mock_feed.get_gitdir(1))
+        assert mock_feed.is_noop_commit(1, commits['rm']) is True
+        with pytest.raises(StateError):
+            mock_feed.get_message_at_commit(1, commits['rm'])
+
+    def test_bad_object(self, backend: Any, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """Unknown commits raise GitError."""
+        from korgalore import GitError
+        self._make_repo(mock_feed.get_gitdir(1))
+        with pytest.raises(GitError):
+            mock_feed.is_noop_commit(1, '0' * 40)
+
+    def test_blobless_clone(self, backend: Any, mock_feed: PIFeed, temp_feed_dir: Path,
+                            tmp_path: Path) -> None:
+        """Messages missing from a blobless clone are fetched on demand."""
+        import subprocess
+        origin = tmp_path / 'origin.git'
+        commits = self._make_repo(origin)
+        subprocess.run(['git', '-C', str(origin), 'config', 'uploadpack.allowFilter', 'true'], check=True)
+        gitdir = mock_feed.get_gitdir(1)
+        subprocess.run(['git', 'clone', '-q', '--bare', '--filter=blob:none',
+                        f'file://{origin}', str(gitdir)], check=True)
+
+        assert mock_feed.is_noop_commit(1, commits['message']) is False
+        assert mock_feed.get_message_at_commit(1, commits['message']) == b'Message-ID: <1@x>\n\nbody'
+
+    def test_concurrent_reads_open_repository_once(self, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """Delivery threads reading one feed at once share one repository per epoch."""
+        pygit2 = pytest.importorskip('pygit2')
+        from concurrent.futures import ThreadPoolExecutor
+        commits = self._make_repo(mock_feed.get_gitdir(1))
+
+        def read(_: int) -> bytes:
+            assert mock_feed.is_noop_commit(1, commits['message']) is False
+            return mock_feed.get_message_at_commit(1, commits['message'])
+
+        with patch('korgalore.pi_feed.pygit2.Repository', side_effect=pygit2.Repository) as opener:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(read, range(64)))
+
+        assert results == [b'Message-ID: <1@x>\n\nbody'] * 64
+        opener.assert_called_once()
+
+    def test_cat_file_process_reused(self, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """Without pygit2, every read in a run goes through one cat-file process."""
+        from korgalore.pi_feed import open_git_cat_file
+        commits = self._make_repo(mock_feed.get_gitdir(1))
+        with patch('korgalore.pi_feed.HAS_PYGIT2', False), \
+                patch('korgalore.pi_feed.open_git_cat_file', side_effect=open_git_cat_file) as opener, \
+                patch('korgalore.pi_feed.run_git_command') as run_git:
+            mock_feed.feed_lock()
+            for _ in range(3):
+                assert mock_feed.is_noop_commit(1, commits['message']) is False
+                assert mock_feed.get_message_at_commit(1, commits['message']).startswith(b'Message-ID')
+                assert mock_feed.is_noop_commit(1, commits['rm']) is True
+            proc = mock_feed._cat_file_procs[1]
+            mock_feed.feed_unlock()
+
+        opener.assert_called_once()
+        run_git.assert_not_called()
+        assert proc.returncode == 0
+        assert mock_feed._cat_file_procs == {}
+
+    def test_dead_cat_file_falls_back(self, mock_feed: PIFeed, temp_feed_dir: Path) -> None:
+        """If the cat-file process dies, messages are read with git show."""
+        commits = self._make_repo(mock_feed.get_gitdir(1))
+        with patch('korgalore.pi_feed.HAS_PYGIT2', False):
+            mock_feed.is_noop_commit(1, commits['rm'])
+            mock_feed._cat_file_procs[1].kill()
+            mock_feed._cat_file_procs[1].wait()
+            assert mock_feed.get_message_at_commit(1, commits['message']) == b'Message-ID: <1@x>\n\nbody'
+            assert 1 not in mock_feed._cat_file_procs
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, patch
 import click
 import pytest
 
-from korgalore import PublicInboxError, RemoteError
+from korgalore import GitError, PublicInboxError, RemoteError
 from korgalore.lei_feed import LeiFeed
 from korgalore.lore_feed import LoreFeed
 from korgalore.cli import (
@@ -148,6 +148,43 @@ class TestValidateLeiPath:
                 LeiFeed.validate_lei_path('/some/path')
 
 
+class TestLeiEpochInfo:
+    """Tests for LeiFeed.get_latest_epoch_info."""
+
+    @staticmethod
+    def _make_feed(tmp_path: Path, epochs: int) -> LeiFeed:
+        for epoch in range(epochs):
+            (tmp_path / 'git' / f'{epoch}.git').mkdir(parents=True)
+        return LeiFeed('test', f'lei:{tmp_path}', known_searches=[str(tmp_path)])
+
+    def test_results_in_epoch_order(self, tmp_path: Path) -> None:
+        """Refs are returned in epoch order however the git calls finish."""
+        feed = self._make_feed(tmp_path, 12)
+
+        def fake_git(gitdir: str, args: Any) -> Any:
+            epoch = int(Path(gitdir).name.replace('.git', ''))
+            return 0, f'ref{epoch}'.encode(), b''
+
+        with patch('korgalore.lei_feed.run_git_command', side_effect=fake_git) as mock_git:
+            info = feed.get_latest_epoch_info()
+
+        assert info == [(epoch, f'ref{epoch}') for epoch in range(12)]
+        assert mock_git.call_count == 12
+
+    def test_failure_in_any_epoch_raises(self, tmp_path: Path) -> None:
+        """A failing show-ref in one epoch raises GitError."""
+        feed = self._make_feed(tmp_path, 3)
+
+        def fake_git(gitdir: str, args: Any) -> Any:
+            if gitdir.endswith('1.git'):
+                return 128, b'', b'bad repo'
+            return 0, b'ref', b''
+
+        with patch('korgalore.lei_feed.run_git_command', side_effect=fake_git):
+            with pytest.raises(GitError, match='bad repo'):
+                feed.get_latest_epoch_info()
+
+
 class TestGenerateSubscriptionConfig:
     """Tests for generate_subscription_config function."""
 
@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 import click
 
 from korgalore.cli import map_tracked_threads
-from korgalore.tracking import TrackedThread, TrackStatus
+from korgalore.tracking import TrackedThread, TrackingManifest, TrackStatus
 
 
 def _make_tracked_thread(track_id: str = 'track-abc123',
@@ -52,7 +52,7 @@ class TestTrackedThreadDeliveryTuple:
 
     @patch('korgalore.cli.get_target')
     @patch('korgalore.cli.get_tracking_manifest')
-    @patch('korgalore.cli.LeiFeed')
+    @patch('korgalore.lei_feed.LeiFeed')
     def test_delivery_tuple_has_four_elements(
         self, mock_lei_cls, mock_manifest, mock_target
     ) -> None:
@@ -78,7 +78,7 @@ class TestTrackedThreadDeliveryTuple:
 
     @patch('korgalore.cli.get_target')
     @patch('korgalore.cli.get_tracking_manifest')
-    @patch('korgalore.cli.LeiFeed')
+    @patch('korgalore.lei_feed.LeiFeed')
     def test_subfolder_is_none(
         self, mock_lei_cls, mock_manifest, mock_target
     ) -> None:
@@ -100,7 +100,7 @@ class TestTrackedThreadDeliveryTuple:
 
     @patch('korgalore.cli.get_target')
     @patch('korgalore.cli.get_tracking_manifest')
-    @patch('korgalore.cli.LeiFeed')
+    @patch('korgalore.lei_feed.LeiFeed')
     def test_labels_preserved(
         self, mock_lei_cls, mock_manifest, mock_target
     ) -> None:
@@ -122,7 +122,7 @@ class TestTrackedThreadDeliveryTuple:
 
     @patch('korgalore.cli.get_target')
     @patch('korgalore.cli.get_tracking_manifest')
-    @patch('korgalore.cli.LeiFeed')
+    @patch('korgalore.lei_feed.LeiFeed')
     def test_tuple_unpacks_like_regular_delivery(
         self, mock_lei_cls, mock_manifest, mock_target
     ) -> None:
@@ -148,3 +148,83 @@ class TestTrackedThreadDeliveryTuple:
             assert target is mock_tgt
             assert labels == ['INBOX']
             assert subfolder is None
+
+    @patch('korgalore.cli.get_target')
+    @patch('korgalore.cli.get_tracking_manifest')
+    @patch('korgalore.lei_feed.LeiFeed')
+    def test_target_resolved_once_per_target(
+        self, mock_lei_cls, mock_manifest, mock_target
+    ) -> None:
+        """Threads sharing a target resolve that target only once."""
+        threads = [_make_tracked_thread(track_id=f'track-{i}') for i in range(3)]
+        threads.append(_make_tracked_thread(track_id='track-gone', target='gone'))
+        manifest = MagicMock()
+        manifest.check_and_expire_threads.return_value = []
+        manifest.get_active_threads.return_value = threads
+        mock_manifest.return_value = manifest
+
+        mock_lei_cls.return_value = MagicMock()
+        local = MagicMock()
+        mock_target.side_effect = lambda ctx, name: local if name == 'local' else _abort()
+
+        ctx = _make_context()
+        mapped = map_tracked_threads(ctx)
+
+        assert mapped == ['track-0', 'track-1', 'track-2']
+        assert [c.args[1] for c in mock_target.call_args_list] == ['local', 'gone']
+        assert mock_lei_cls.call_count == 3
+        mock_lei_cls.list_known_searches.assert_called_once()
+        known = mock_lei_cls.list_known_searches.return_value
+        assert all(c.kwargs['known_searches'] is known for c in mock_lei_cls.call_args_list)
+
+
+class TestLeiFeedKnownSearches:
+    """LeiFeed can reuse a list of known searches instead of asking lei."""
+
+    @patch('korgalore.lei_feed.run_lei_command')
+    def test_known_searches_skip_lei(self, mock_lei, tmp_path: Path) -> None:
+        """Passing known_searches validates the path without running lei."""
+        from korgalore.lei_feed import LeiFeed
+        feed = LeiFeed('track-1', f'lei:{tmp_path}', known_searches=[str(tmp_path)])
+        assert feed.feed_dir == tmp_path
+        mock_lei.assert_not_called()
+
+    @patch('korgalore.lei_feed.run_lei_command')
+    def test_list_known_searches_v2_only(self, mock_lei) -> None:
+        """Only v2 search outputs are listed, without their prefix."""
+        from korgalore.lei_feed import LeiFeed
+        mock_lei.return_value = (0, b'[{"output": "v2:/a"}, {"output": "maildir:/b"}]')
+        assert LeiFeed.list_known_searches() == ['/a']
+        mock_lei.assert_called_once()
+
+
+def _abort() -> None:
+    raise click.Abort()
+
+
+class TestManifestDeferredWrites:
+    """Activity updates are kept in memory until flushed."""
+
+    def _make_manifest(self, tmp_path: Path) -> TrackingManifest:
+        manifest = TrackingManifest(tmp_path)
+        manifest.add_thread('track-1', '<a@b>', 'Subject', 'personal', ['INBOX'],
+                            tmp_path / 'lei' / 'track-1')
+        return manifest
+
+    def test_update_activity_defers_write(self, tmp_path: Path) -> None:
+        """update_activity marks the manifest dirty without writing it."""
+        manifest = self._make_manifest(tmp_path)
+        manifest.update_activity('track-1', 3)
+        assert manifest.dirty
+        assert TrackingManifest(tmp_path).get_thread('track-1').message_count == 0
+
+        manifest.flush_if_dirty()
+        assert not manifest.dirty
+        assert TrackingManifest(tmp_path).get_thread('track-1').message_count == 3
+
+    def test_flush_if_clean_does_not_write(self, tmp_path: Path) -> None:
+        """flush_if_dirty is a no-op when nothing changed."""
+        manifest = self._make_manifest(tmp_path)
+        manifest.manifest_path.unlink()
+        manifest.flush_if_dirty()
+        assert not manifest.manifest_path.exists()
@@ -47,6 +47,14 @@ class TestGetRequestsSession:
         finally:
             korgalore._user_agent_plus = None
 
+    def test_session_connection_pool_size(self) -> None:
+        """Session adapters are sized for concurrent requests."""
+        session = get_requests_session()
+        for prefix in ('https://', 'http://'):
+            adapter = session.get_adapter(prefix + 'lore.kernel.org/')
+            assert adapter._pool_maxsize == korgalore.HTTP_POOL_SIZE  # type: ignore[attr-defined]
+            assert adapter._pool_connections == korgalore.HTTP_POOL_SIZE  # type: ignore[attr-defined]
+
 
 class TestCloseRequestsSession:
     """Tests for close_requests_session function."""